@@ -57,19 +57,23 @@ class RiskFormulaParserAgent:
         self.code_generation_node = CodeGenerationNode(self.llm_client)
         self.validation_node = ValidationNode(self.llm_client)
     
-    def parse_risk_formula(self, risk_description: str, model_items: List[Dict]) -> Optional[str]:
+    def parse_risk_formula(self, risk_description: str, model_items: List[Dict],
+                           use_cache: bool = True) -> Optional[str]:
         """
         将风险描述转化为Python代码
         
         Args:
             risk_description: 风险描述
             model_items: 模型涉及项目列表
+            use_cache: 是否使用LLM响应缓存，重新生成代码复核时应为False
             
         Returns:
             生成的Python代码
         """
         print(f"开始解析风险公式: {risk_description[:50]}...")
         
+        cache_enabled = self.llm_client.cache_enabled
+        self.llm_client.cache_enabled = cache_enabled and use_cache
         try:
             # Step 1: 分析风险公式结构
             analysis_result = self._analyze_formula_structure(risk_description, model_items)
@@ -114,6 +118,8 @@ class RiskFormulaParserAgent:
         except Exception as e:
             print(f"解析风险公式时发生错误: {str(e)}")
             return None
+        finally:
+            self.llm_client.cache_enabled = cache_enabled
     
     def _analyze_formula_structure(self, risk_description: str, model_items: List[Dict]) -> Dict:
         """分析风险公式结构"""
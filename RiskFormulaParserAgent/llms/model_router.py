@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+多模型路由：按模型统计滚动窗口内的延迟、错误率和限流状态，每次调用选择当前最快的健康模型；
+连续失败、错误率过高或被限流的模型熔断一段时间，冷却结束后放行一个探测请求，
+成功则恢复，失败则加倍冷却时间
+
+环境变量：
+    LLM_FALLBACK_MODELS   逗号分隔的备用模型，追加在主模型之后
+
+本文件以 structuring/ 下的版本为准，三个 Agent 的 llms/ 下各有一份相同副本，
+修改后运行 python -m structuring.sync_agent_copies 同步
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class ModelStats:
+    """单个模型的滚动统计与熔断状态"""
+
+    def __init__(self, name: str, window: int):
+        self.name = name
+        self.latencies = deque(maxlen=window)   # 最近成功请求的耗时（秒）
+        self.outcomes = deque(maxlen=window)    # 最近请求是否成功
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.open_until = 0.0
+        self.cooldown = 0.0
+        self.probe_started = 0.0
+
+    @property
+    def latency(self) -> Optional[float]:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else None
+
+    @property
+    def error_rate(self) -> float:
+        return 1 - sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+
+    def snapshot(self) -> dict:
+        return {"state": self.state, "latency": self.latency, "error_rate": self.error_rate,
+                "samples": len(self.outcomes), "open_for": max(0.0, self.open_until - time.time())}
+
+
+class ModelRouter:
+    """
+    线程安全；choose() 返回本次调用应使用的模型，调用结束后必须以同一模型名调用
+    record_success() 或 record_failure()
+    """
+
+    def __init__(self, models: List[str], window: int = 20, failure_threshold: int = 3,
+                 error_rate_threshold: float = 0.5, min_samples: int = 5,
+                 cooldown: float = 30.0, max_cooldown: float = 600.0, probe_timeout: float = 120.0):
+        if not models:
+            raise ValueError("至少需要一个模型")
+        self.models = list(dict.fromkeys(models))
+        self.stats = {name: ModelStats(name, window) for name in self.models}
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.min_samples = min_samples
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_timeout = probe_timeout
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, primary: str, **kwargs) -> "ModelRouter":
+        """主模型加上 LLM_FALLBACK_MODELS 中的备用模型"""
+        fallbacks = [m.strip() for m in os.getenv("LLM_FALLBACK_MODELS", "").split(",") if m.strip()]
+        return cls([primary] + fallbacks, **kwargs)
+
+    def choose(self) -> str:
+        """
+        冷却结束的熔断模型优先放行一个探测请求；否则在未熔断的模型中选平均延迟最低的，
+        尚无延迟样本的模型按列表顺序优先（以便获得样本）；全部熔断时选最早恢复的模型
+        """
+        now = time.time()
+        with self._lock:
+            for stats in self.stats.values():
+                if stats.state == OPEN and now >= stats.open_until:
+                    stats.state = HALF_OPEN
+                    stats.probe_started = now
+                    logger.info(f"模型{stats.name}冷却结束，发送探测请求")
+                    return stats.name
+                if stats.state == HALF_OPEN and now - stats.probe_started > self.probe_timeout:
+                    # 探测请求没有回报结果（调用方异常退出），重新放行
+                    stats.probe_started = now
+                    return stats.name
+            healthy = [s for s in self.stats.values() if s.state == CLOSED]
+            if healthy:
+                return min(healthy, key=lambda s: (s.latency is not None, s.latency or 0.0,
+                                                   self.models.index(s.name))).name
+            return min(self.stats.values(), key=lambda s: s.open_until).name
+
+    def healthy_count(self) -> int:
+        with self._lock:
+            return sum(1 for s in self.stats.values() if s.state == CLOSED)
+
+    def record_success(self, model: str, latency: float):
+        with self._lock:
+            stats = self.stats[model]
+            stats.latencies.append(latency)
+            stats.outcomes.append(True)
+            stats.consecutive_failures = 0
+            if stats.state != CLOSED:
+                logger.info(f"模型{model}探测成功，恢复使用")
+                stats.outcomes.clear()
+                stats.outcomes.append(True)
+            stats.state = CLOSED
+            stats.cooldown = 0.0
+
+    def record_failure(self, model: str, rate_limited: bool = False, retry_after: Optional[float] = None):
+        """rate_limited=True 时立即熔断；其余错误在连续失败或错误率超过阈值时熔断"""
+        with self._lock:
+            stats = self.stats[model]
+            stats.outcomes.append(False)
+            stats.consecutive_failures += 1
+            if stats.state == OPEN:
+                # 熔断前已发出的请求陆续失败，不再延长冷却
+                return
+            if (rate_limited or stats.state == HALF_OPEN
+                    or stats.consecutive_failures >= self.failure_threshold
+                    or (len(stats.outcomes) >= self.min_samples
+                        and stats.error_rate >= self.error_rate_threshold)):
+                self._open(stats, retry_after, "限流" if rate_limited else f"错误率{stats.error_rate:.0%}")
+
+    def _open(self, stats: ModelStats, retry_after: Optional[float], reason: str):
+        if stats.state == CLOSED:
+            stats.cooldown = self.base_cooldown
+        else:
+            stats.cooldown = min(max(stats.cooldown, self.base_cooldown) * 2, self.max_cooldown)
+        cooldown = max(stats.cooldown, retry_after or 0.0)
+        stats.state = OPEN
+        stats.open_until = time.time() + cooldown
+        logger.warning(f"模型{stats.name}熔断{cooldown:.0f}秒（{reason}）")
+
+    def snapshot(self) -> dict:
+        """{模型: {state, latency, error_rate, samples, open_for}}"""
+        with self._lock:
+            return {name: stats.snapshot() for name, stats in self.stats.items()}
+
+    def summary(self) -> str:
+        parts = []
+        for name, s in self.snapshot().items():
+            latency = f"{s['latency']:.1f}s" if s["latency"] is not None else "-"
+            parts.append(f"{name}: {s['state']}，平均延迟{latency}，错误率{s['error_rate']:.0%}（{s['samples']}次）")
+        return "；".join(parts)
+
+
+def retry_after_seconds(error) -> Optional[float]:
+    """从限流异常的响应头中取 Retry-After 秒数，没有时返回 None"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
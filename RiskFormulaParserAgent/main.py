@@ -110,7 +110,8 @@ class RiskAnalysisSystem:
                             if not is_risk:
                                 print(f"    🔄 第一次验证结果为无风险，重新生成验证代码进行确认...")
                                 # 再次调用LLM生成代码
-                                retry_code = self.formula_parser_agent.parse_risk_formula(risk_description, model_items)
+                                retry_code = self.formula_parser_agent.parse_risk_formula(risk_description, model_items,
+                                                                                          use_cache=False)
                                 
                                 if retry_code:
                                     # 将重试生成的代码也添加到列表中
@@ -7,12 +7,15 @@ import logging
 from typing import Optional
 from openai import OpenAI, RateLimitError, AuthenticationError, APITimeoutError
 from .base import BaseLLM
+from .response_cache import ResponseCache
+from .model_router import ModelRouter, retry_after_seconds
 import random  
 
 class OpenRouterLLM(BaseLLM):
     """OpenRouter API客户端"""
     
-    def __init__(self, api_key: str, model_name: str = "deepseek/deepseek-chat-v3.1:free"):
+    def __init__(self, api_key: str, model_name: str = "deepseek/deepseek-chat-v3.1:free",
+                 cache: Optional[ResponseCache] = None, router: Optional[ModelRouter] = None):
         """
         初始化OpenRouter API客户端
         """
@@ -38,6 +41,13 @@ class OpenRouterLLM(BaseLLM):
 
         self.last_request_time = 0
         self.min_request_interval = 2.0  # 最小请求间隔为2秒
+        # 响应缓存默认关闭，设置环境变量 LLM_CACHE_PATH 或传入 cache 时启用；
+        # 需要重新生成独立结果的调用（如复核）把 cache_enabled 置为 False
+        self.cache = cache if cache is not None else ResponseCache.from_env(default_path="")
+        self.cache_enabled = True
+        # 模型路由，未传入时为主模型加上环境变量 LLM_FALLBACK_MODELS 中的备用模型；
+        # 每次调用选择最快的健康模型，限流或连续失败的模型熔断后定期探测恢复
+        self.router = router if router is not None else ModelRouter.from_env(model_name)
     
     def _rate_limit_delay(self):
         """实施速率限制延迟"""
@@ -51,47 +61,67 @@ class OpenRouterLLM(BaseLLM):
 
         self.last_request_time = time.time()
     
+    def _cached_response(self, messages, temperature, max_tokens) -> Optional[str]:
+        """按模型列表顺序查询缓存，路由可能把同一提示词发给任一模型"""
+        return self.cache.get_any(self.router.models, messages, temperature, max_tokens)
+    
     def call_llm(self, prompt: str, **kwargs) -> Optional[str]:
         """
         调用OpenRouter API
         """
-        # 速率限制
-        self._rate_limit_delay()
-
         max_retries = kwargs.get("max_retries", 3)
         retry_delay = kwargs.get("retry_delay", 1.0)
 
+        messages = [
+            {
+                "role": "system",
+                "content": "你是一个专业的财务风险分析专家，擅长根据风险点生成自然语言判断规则和可执行的DSL公式。请严格按照要求输出JSON格式的规则。"
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+        temperature = kwargs.get("temperature", 0.1)
+        max_tokens = kwargs.get("max_tokens", 2000)
+        use_cache = self.cache is not None and self.cache_enabled and kwargs.get("use_cache", True)
+        if use_cache:
+            cached = self._cached_response(messages, temperature, max_tokens)
+            if cached is not None:
+                self.logger.info(f"命中LLM缓存 (命中率 {self.cache.hit_rate:.1%})")
+                return cached
+
+        # 速率限制
+        self._rate_limit_delay()
+
         for attempt in range(max_retries):
+            model = self.router.choose()
+            started = time.time()
             try:
-                self.logger.info(f"LLM调用尝试 {attempt + 1}/{max_retries}: 模型={self.model_name}, 提示词长度={len(prompt)}字符")
+                self.logger.info(f"LLM调用尝试 {attempt + 1}/{max_retries}: 模型={model}, 提示词长度={len(prompt)}字符")
                 
                 # 使用OpenAI SDK调用API
                 completion = self.client.chat.completions.create(
                     extra_headers=self.extra_headers,
                     extra_body={},
-                    model=self.model_name,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "你是一个专业的财务风险分析专家，擅长根据风险点生成自然语言判断规则和可执行的DSL公式。请严格按照要求输出JSON格式的规则。"
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=kwargs.get("temperature", 0.1),
-                    max_tokens=kwargs.get("max_tokens", 2000),
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
                     timeout=kwargs.get("timeout", 30)  # 设置超时时间
                 )
-                
                 # 提取响应内容
-                if completion and completion.choices:
+                if completion and completion.choices and completion.choices[0].message.content:
+                    # 返回了有效内容才算成功，空响应计入模型的失败统计
+                    self.router.record_success(model, time.time() - started)
                     response_content = completion.choices[0].message.content
                     self.logger.info(f"LLM调用成功，响应长度={len(response_content)}字符")
+                    if use_cache:
+                        self.cache.put(model, messages, temperature, max_tokens, response_content)
                     return response_content
                 else:
                     self.logger.error(f"API调用未返回有效响应: completion对象={completion}")
+                    self.router.record_failure(model)
                     return None
                     
             except AuthenticationError as e:
@@ -100,18 +130,24 @@ class OpenRouterLLM(BaseLLM):
                 break
             except RateLimitError as e:
                 self.logger.warning(f"达到速率限制 (尝试 {attempt + 1}/{max_retries}): {str(e)}。请稍后再试或减少请求频率。")
+                self.router.record_failure(model, rate_limited=True, retry_after=retry_after_seconds(e))
+                if attempt < max_retries - 1 and self.router.healthy_count():
+                    # 还有未熔断的模型，换模型立即重试
+                    continue
                 if attempt < max_retries - 1:
                     # 指数退避策略，添加随机延迟
                     sleep_time = retry_delay * (2 ** attempt) + random.uniform(0, 1)  # 添加0-1秒的随机延迟
                     self.logger.info(f"{sleep_time:.2f}秒后重试...")
                     time.sleep(sleep_time)
             except APITimeoutError as e:
+                self.router.record_failure(model)
                 self.logger.error(f"API超时错误 (尝试 {attempt + 1}/{max_retries}): 请求超时。详细错误: {str(e)}")
                 if attempt < max_retries - 1:
                     sleep_time = retry_delay * (2 ** attempt)
                     self.logger.info(f"{sleep_time:.2f}秒后重试...")
                     time.sleep(sleep_time)
             except Exception as e:
+                self.router.record_failure(model)
                 error_type = type(e).__name__
                 self.logger.error(f"API调用错误 (尝试 {attempt + 1}/{max_retries}): 错误类型={error_type}, 详细错误: {str(e)}")
                 if attempt < max_retries - 1:
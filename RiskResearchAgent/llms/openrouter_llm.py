@@ -9,11 +9,14 @@ import logging
 from typing import Optional
 from openai import OpenAI, RateLimitError
 from .base import BaseLLM
+from .response_cache import ResponseCache
+from .model_router import ModelRouter, retry_after_seconds
 
 class OpenRouterLLM(BaseLLM):
     """OpenRouter API客户端"""
     
-    def __init__(self, api_key: str, model_name: str = "deepseek/deepseek-chat-v3.1:free"):
+    def __init__(self, api_key: str, model_name: str = "deepseek/deepseek-chat-v3.1:free",
+                 cache: Optional[ResponseCache] = None, router: Optional[ModelRouter] = None):
         """
         初始化OpenRouter API客户端
         
@@ -36,6 +39,13 @@ class OpenRouterLLM(BaseLLM):
         # 请求速率限制控制
         self.last_request_time = 0
         self.min_request_interval = 2.0  # 最小请求间隔2秒
+        # 响应缓存默认关闭，设置环境变量 LLM_CACHE_PATH 或传入 cache 时启用；
+        # 需要重新生成独立结果的调用（如复核）把 cache_enabled 置为 False
+        self.cache = cache if cache is not None else ResponseCache.from_env(default_path="")
+        self.cache_enabled = True
+        # 模型路由，未传入时为主模型加上环境变量 LLM_FALLBACK_MODELS 中的备用模型；
+        # 每次调用选择最快的健康模型，限流或连续失败的模型熔断后定期探测恢复
+        self.router = router if router is not None else ModelRouter.from_env(model_name)
     
     def _rate_limit_delay(self):
         """实施速率限制延迟"""
@@ -48,6 +58,10 @@ class OpenRouterLLM(BaseLLM):
         
         self.last_request_time = time.time()
     
+    def _cached_response(self, messages, temperature, max_tokens) -> Optional[str]:
+        """按模型列表顺序查询缓存，路由可能把同一提示词发给任一模型"""
+        return self.cache.get_any(self.router.models, messages, temperature, max_tokens)
+    
     def call_llm(self, prompt: str, **kwargs) -> Optional[str]:
         """
         调用OpenRouter API
@@ -59,35 +73,46 @@ class OpenRouterLLM(BaseLLM):
         Returns:
             LLM返回的文本
         """
-        # 实施速率限制
-        self._rate_limit_delay()
-        
         # 从kwargs中获取重试参数，默认值更高
         max_retries = kwargs.pop('max_retries', 5)  # 最大重试次数5次
         retry_delay = kwargs.pop('retry_delay', 3.0)  # 重试延迟3秒
         
+        messages = [
+            {
+                "role": "system",
+                "content": "你是一个专业的风险研究专家，擅长分析和总结文档内容，特别是关于造假案例、政策法规等信息。请严格按照要求提取和总结文档内容。"
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+        temperature = kwargs.get("temperature", 0.1)
+        max_tokens = kwargs.get("max_tokens", 2000)
+        use_cache = self.cache is not None and self.cache_enabled and kwargs.get("use_cache", True)
+        if use_cache:
+            cached = self._cached_response(messages, temperature, max_tokens)
+            if cached is not None:
+                self.logger.info(f"命中LLM缓存 (命中率 {self.cache.hit_rate:.1%})")
+                return cached
+
+        # 实施速率限制
+        self._rate_limit_delay()
+
         for attempt in range(max_retries):
+            model = self.router.choose()
+            started = time.time()
             try:
                 # 使用OpenAI SDK调用API
                 completion = self.client.chat.completions.create(
                     extra_headers=self.extra_headers,
                     extra_body={},
-                    model=self.model_name,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "你是一个专业的风险研究专家，擅长分析和总结文档内容，特别是关于造假案例、政策法规等信息。请严格按照要求提取和总结文档内容。"
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=kwargs.get("temperature", 0.1),
-                    max_tokens=kwargs.get("max_tokens", 2000),
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
                     timeout=kwargs.get("timeout", 60)  
                 )
-                
                 self.logger.info(f"成功获取API响应: {completion}")
                 
                 if completion and hasattr(completion, 'choices') and completion.choices:
@@ -95,13 +120,22 @@ class OpenRouterLLM(BaseLLM):
                     if hasattr(choice, 'message') and hasattr(choice.message, 'content'):
                         content = choice.message.content
                         if content:
+                            # 返回了有效内容才算成功，空响应计入模型的失败统计
+                            self.router.record_success(model, time.time() - started)
+                            if use_cache:
+                                self.cache.put(model, messages, temperature, max_tokens, content)
                             return content
                 
                 self.logger.error(f"API调用返回了有效状态码但内容无效: completion={completion}")
+                self.router.record_failure(model)
                 return None
                     
             except RateLimitError as e:
                 self.logger.warning(f"达到速率限制 (尝试 {attempt + 1}/{max_retries}): {str(e)}")
+                self.router.record_failure(model, rate_limited=True, retry_after=retry_after_seconds(e))
+                if attempt < max_retries - 1 and self.router.healthy_count():
+                    # 还有未熔断的模型，换模型立即重试
+                    continue
                 if attempt < max_retries - 1:
                     #退避策略：基础延迟 * (2^attempt) + 随机延迟
                     sleep_time = retry_delay * (2 ** attempt)
@@ -112,6 +146,7 @@ class OpenRouterLLM(BaseLLM):
                     return None
                     
             except Exception as e:
+                self.router.record_failure(model)
                 self.logger.error(f"调用LLM API时出错 (尝试 {attempt + 1}/{max_retries}): {str(e)}")
                 if attempt < max_retries - 1:
                     # 非速率限制错误同样使用指数退避
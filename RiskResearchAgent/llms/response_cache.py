@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+LLM响应缓存：SQLite持久化，键为 (模型, 消息, temperature, max_tokens) 的哈希，
+支持过期时间（TTL）、按最近访问时间淘汰（LRU）和条数/字节数上限，并统计命中率
+
+环境变量：
+    LLM_CACHE_PATH        缓存文件路径，设为空字符串则禁用缓存
+    LLM_CACHE_TTL_DAYS    过期天数，0 表示永不过期
+    LLM_CACHE_MAX_MB      缓存总大小上限（MB），0 表示不限制
+    LLM_CACHE_MAX_ENTRIES 缓存条数上限，0 表示不限制
+
+本文件以 structuring/ 下的版本为准，三个 Agent 的 llms/ 下各有一份相同副本，
+修改后运行 python -m structuring.sync_agent_copies 同步
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_responses_created ON responses (created_at);
+"""
+
+
+def cache_key(model: str, messages: list, temperature: float, max_tokens: int) -> str:
+    """同样的请求参数得到同样的键，与字典键顺序无关"""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens},
+        ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """线程安全；多个进程可共用同一个缓存文件（WAL模式）"""
+
+    def __init__(self, path: str, ttl_seconds: float = 0, max_bytes: int = 0,
+                 max_entries: int = 0, evict_every: int = 50):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls, default_path: str = "outputs/llm_cache.sqlite") -> Optional["ResponseCache"]:
+        """按环境变量创建缓存，LLM_CACHE_PATH 为空字符串时返回 None"""
+        path = os.getenv("LLM_CACHE_PATH", default_path)
+        if not path:
+            return None
+        return cls(
+            path,
+            ttl_seconds=float(os.getenv("LLM_CACHE_TTL_DAYS", "30")) * 86400,
+            max_bytes=int(float(os.getenv("LLM_CACHE_MAX_MB", "512")) * 1024 * 1024),
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "0")),
+        )
+
+    def get(self, model: str, messages: list, temperature: float, max_tokens: int) -> Optional[str]:
+        """命中时返回缓存的响应并刷新访问时间，过期条目视为未命中"""
+        return self.get_any([model], messages, temperature, max_tokens)
+
+    def get_any(self, models: list, messages: list, temperature: float, max_tokens: int,
+                accept: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """
+        按顺序查询多个模型的缓存，返回第一条 accept(响应) 为真的响应；
+        无论查询了几个模型，命中率统计都只记一次命中或未命中
+        """
+        now = time.time()
+        with self._lock:
+            for model in models:
+                key = cache_key(model, messages, temperature, max_tokens)
+                response = self._fetch(key, now)
+                if response is None or (accept is not None and not accept(response)):
+                    continue
+                self._conn.execute(
+                    "UPDATE responses SET accessed_at = ?, hits = hits + 1 WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+                self.hits += 1
+                return response
+            self.misses += 1
+            return None
+
+    def _fetch(self, key: str, now: float) -> Optional[str]:
+        """读取一条未过期的响应，过期条目顺便删除；不更新统计"""
+        row = self._conn.execute(
+            "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row and self.ttl_seconds and now - row[1] > self.ttl_seconds:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
+            return None
+        return row[0] if row else None
+
+    def put(self, model: str, messages: list, temperature: float, max_tokens: int, response: str):
+        if not response:
+            return
+        key = cache_key(model, messages, temperature, max_tokens)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, len(response.encode("utf-8")), now, now)
+            )
+            self._conn.commit()
+            self._puts += 1
+            if self.evict_every and self._puts % self.evict_every == 0:
+                self._evict()
+
+    def _evict(self):
+        """先删过期条目，再按最近访问时间从旧到新删除，直到满足条数和大小上限"""
+        removed = 0
+        if self.ttl_seconds:
+            removed += self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            ).rowcount
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if (self.max_entries and count > self.max_entries) or (self.max_bytes and total > self.max_bytes):
+            rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+            doomed = []
+            for key, size in rows:
+                if (not self.max_entries or count <= self.max_entries) and \
+                        (not self.max_bytes or total <= self.max_bytes):
+                    break
+                doomed.append((key,))
+                count -= 1
+                total -= size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+            removed += len(doomed)
+        self._conn.commit()
+        if removed:
+            logger.info(f"LLM缓存淘汰 {removed} 条")
+
+    def evict(self):
+        with self._lock:
+            self._evict()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": round(self.hit_rate, 4),
+                "entries": count, "bytes": total}
+
+    def close(self):
+        with self._lock:
+            self._evict()
+            self._conn.close()
+        logger.info(f"LLM缓存命中 {self.hits} 次，未命中 {self.misses} 次，命中率 {self.hit_rate:.1%}")
@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+离线抓取基准：启动本地页面服务器，用 sp.py 的同一套抓取流程跑串行 / 多进程 / 纯 HTTP 模式，
+输出吞吐（页/秒）和单页耗时分布
+
+    python -m crawler.bench_crawl --pages 100 --modes http
+    python -m crawler.bench_crawl --pages 200 --modes sequential,pool,http --workers 4 \\
+        --latency-ms 80 --jitter-ms 40 --error-rate 0.02 --headless
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+from crawler.bench_extract import load_corpus
+from crawler.bench_server import start_server, synthetic_pages, page_urls
+from crawler.metrics import CrawlMetrics
+
+MODES = {
+    # 模式名 -> sp.py 参数
+    "sequential": ["--backend", "selenium", "--workers", "1"],
+    "pool": ["--backend", "selenium"],
+    "http": ["--backend", "http"],
+    "auto": ["--backend", "auto"],
+}
+
+
+def run_mode(mode: str, urls: list, extra_args: list) -> dict:
+    """在临时目录中跑一种模式，返回指标汇总"""
+    import sp
+
+    args = sp.build_parser().parse_args(MODES[mode] + extra_args)
+    args.write_txt = True
+    workdir = tempfile.mkdtemp(prefix=f"bench_{mode}_")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        sp.ensure_out()
+        metrics = CrawlMetrics("metrics", flush_every=0)
+        tasks = list(enumerate(urls, start=1))
+        sp.crawl(args, tasks, len(tasks), metrics.add)
+        return metrics.summary()
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=100, help="抓取的页面数")
+    parser.add_argument("--modes", default="sequential,pool,http", help="逗号分隔：sequential,pool,http,auto")
+    parser.add_argument("--workers", type=int, default=4, help="pool 模式的浏览器进程数")
+    parser.add_argument("--http-concurrency", type=int, default=16)
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--light", action="store_true")
+    parser.add_argument("--rate", type=float, default=1000.0,
+                        help="限速器初始速率，默认足够大以测量原始吞吐")
+    parser.add_argument("--corpus", default="", help="录制的违规详情页目录，为空则生成")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--empty-rate", type=float, default=0.0)
+    parser.add_argument("--render-delay-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus) if args.corpus else synthetic_pages()
+    server, base_url, stats = start_server(
+        pages, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, empty_rate=args.empty_rate,
+        render_delay_ms=args.render_delay_ms)
+    urls = page_urls(base_url, args.pages)
+    print(f"本地服务器 {base_url}，{len(pages)} 个录制页面，抓取 {len(urls)} 个 URL")
+
+    extra = ["--rate", str(args.rate), "--max-rate", str(max(args.rate, 1.0)),
+             "--http-concurrency", str(args.http_concurrency), "--html-cache", ""]
+    if args.headless:
+        extra.append("--headless")
+    if args.light:
+        extra.append("--light")
+
+    results = {}
+    try:
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            mode_args = extra + (["--workers", str(args.workers)] if mode == "pool" else [])
+            before = stats["requests"]
+            t0 = time.perf_counter()
+            try:
+                summary = run_mode(mode, urls, mode_args)
+            except Exception as e:
+                print(f"❌ {mode} 模式失败：{e}")
+                continue
+            wall = time.perf_counter() - t0
+            summary["requests"] = stats["requests"] - before
+            summary["pages_per_second"] = round(summary["pages"] / wall, 3) if wall > 0 else 0.0
+            results[mode] = summary
+    finally:
+        server.shutdown()
+
+    print(f"\n{'模式':<12}{'页面':>6}{'成功':>6}{'请求':>7}{'页/秒':>9}{'p50':>8}{'p95':>8}{'p99':>8}")
+    for mode, s in results.items():
+        lat = s["phases"].get("elapsed", {})
+        print(f"{mode:<12}{s['pages']:>6}{s['ok']:>6}{s['requests']:>7}{s['pages_per_second']:>9.2f}"
+              f"{lat.get('p50', 0):>8.3f}{lat.get('p95', 0):>8.3f}{lat.get('p99', 0):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
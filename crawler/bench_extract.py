@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+正文抽取基准：对比原 BeautifulSoup 实现与 lxml 实现的速度和输出一致性
+
+    python -m crawler.bench_extract --corpus cache/html
+    python -m crawler.bench_extract --corpus fixtures/pages --rounds 5 --workers 8
+"""
+
+import os
+import gzip
+import time
+import argparse
+
+from crawler.extract import CONTENT_SELECTORS, clean, extract_text, extract_many
+
+
+def extract_text_bs4(html: str) -> str:
+    """sp.py 原来的实现，作为基准"""
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "lxml")
+    for sel in CONTENT_SELECTORS:
+        node = soup.select_one(sel)
+        if node:
+            return clean(node.get_text(" ", strip=True))
+    return clean(soup.get_text(" ", strip=True))
+
+
+def load_corpus(root: str) -> list:
+    """读取目录下所有 .html / .html.gz 文件"""
+    pages = []
+    for dirpath, _, files in os.walk(root):
+        for name in sorted(files):
+            path = os.path.join(dirpath, name)
+            if name.endswith(".html.gz"):
+                with gzip.open(path, "rb") as f:
+                    pages.append(f.read().decode("utf-8", errors="replace"))
+            elif name.endswith((".html", ".htm")):
+                with open(path, "r", encoding="utf-8", errors="replace") as f:
+                    pages.append(f.read())
+    return pages
+
+
+def _timeit(fn, pages, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        for html in pages:
+            fn(html)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", default="cache/html", help="HTML 语料目录")
+    parser.add_argument("--rounds", type=int, default=3, help="每个实现重复次数，取最快一次")
+    parser.add_argument("--workers", type=int, default=0, help="批量模式进程数，默认等于 CPU 核数")
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    if not pages:
+        print(f"❌ 语料目录为空：{args.corpus}")
+        return
+    total_mb = sum(len(p) for p in pages) / 1024 / 1024
+    print(f"语料：{len(pages)} 个页面，{total_mb:.1f} MB")
+
+    mismatches = sum(1 for html in pages if extract_text(html) != extract_text_bs4(html))
+    print(f"输出不一致：{mismatches} / {len(pages)}")
+
+    t_bs4 = _timeit(extract_text_bs4, pages, args.rounds)
+    t_lxml = _timeit(extract_text, pages, args.rounds)
+    print(f"BeautifulSoup：{t_bs4:.3f}s（{len(pages) / t_bs4:.1f} 页/秒）")
+    print(f"lxml：        {t_lxml:.3f}s（{len(pages) / t_lxml:.1f} 页/秒），加速 {t_bs4 / t_lxml:.1f}x")
+
+    t0 = time.perf_counter()
+    extract_many(pages, workers=args.workers)
+    t_batch = time.perf_counter() - t0
+    print(f"lxml 批量（{args.workers or os.cpu_count()} 进程）：{t_batch:.3f}s（{len(pages) / t_batch:.1f} 页/秒）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+本地违规页面服务器：复现 valueonline 的「外层页面 + 违规详情 iframe」结构，
+可配置延迟和错误注入，用于离线测量抓取吞吐
+
+    python -m crawler.bench_server --corpus cache/html --port 8765 --latency-ms 80
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+OUTER_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>违规案例 {id}</title>
+<link rel="stylesheet" href="/static/app.css"></head>
+<body><div id="app"><div class="header">首页 / 违规案例</div>
+<iframe src="/newviolation/detail.html?id={id}" width="100%" height="2000"></iframe>
+</div></body></html>"""
+
+# render_delay_ms > 0 时正文由脚本延迟插入，模拟需要浏览器渲染的页面
+RENDERED_FRAME = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"></head><body><div id="app"></div>
+<script>
+setTimeout(function () {{
+  document.getElementById('app').innerHTML = {payload};
+}}, {delay});
+</script></body></html>"""
+
+SYNTHETIC_SECTIONS = ["案件解析", "违法事项", "处罚情况", "法规定据", "总结"]
+
+
+def synthetic_pages(n: int = 50, seed: int = 7) -> list:
+    """没有录制页面时生成结构相近的违规详情页"""
+    rnd = random.Random(seed)
+    pages = []
+    for i in range(n):
+        parts = [f'<div class="law-content"><h1>关于某某股份有限公司{i}的行政处罚决定书</h1>']
+        for sec in SYNTHETIC_SECTIONS:
+            parts.append(f"<h2>{sec}</h2>")
+            for _ in range(rnd.randint(2, 12)):
+                parts.append(f"<p>经查，{sec}相关事实{rnd.randint(1, 999)}项，"
+                             f"涉及金额{rnd.randint(10, 99999)}万元。</p>")
+        parts.append("<table><tr><td>当事人</td><td>处罚</td></tr>"
+                     f"<tr><td>张{i}</td><td>罚款{rnd.randint(10, 500)}万元</td></tr></table></div>")
+        pages.append("<html><head><meta charset='utf-8'></head><body>"
+                     + "".join(parts) + "</body></html>")
+    return pages
+
+
+def make_handler(pages, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, empty_rate=0.0,
+                 render_delay_ms=0, seed=None):
+    rnd = random.Random(seed)
+    lock = threading.Lock()
+    stats = {"requests": 0, "errors": 0, "empty": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *args):
+            pass
+
+        def _send(self, status: int, body: str, ctype="text/html; charset=utf-8"):
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            with lock:
+                stats["requests"] += 1
+                delay = max(0.0, latency_ms + rnd.uniform(-jitter_ms, jitter_ms)) / 1000
+                roll = rnd.random()
+            if delay:
+                time.sleep(delay)
+
+            parts = urlsplit(self.path)
+            if parts.path.startswith("/static/"):
+                return self._send(200, "body{margin:0}", "text/css")
+            if roll < error_rate:
+                with lock:
+                    stats["errors"] += 1
+                return self._send(rnd.choice([429, 500, 503]), "error")
+
+            segs = [s for s in parts.path.split("/") if s]
+            if len(segs) == 4 and segs[:2] == ["laws", "violation"]:
+                return self._send(200, OUTER_PAGE.format(id=segs[2]))
+            if parts.path == "/newviolation/detail.html":
+                doc_id = parse_qs(parts.query).get("id", ["0"])[0]
+                if roll < error_rate + empty_rate:
+                    with lock:
+                        stats["empty"] += 1
+                    return self._send(200, "<html><body></body></html>")
+                page = pages[int(doc_id) % len(pages)] if doc_id.isdigit() else pages[0]
+                if render_delay_ms:
+                    from lxml import html as lxml_html
+                    body = lxml_html.document_fromstring(page).find("body")
+                    inner = "".join(lxml_html.tostring(c, encoding="unicode") for c in body)
+                    page = RENDERED_FRAME.format(payload=json.dumps(inner, ensure_ascii=False),
+                                                 delay=render_delay_ms)
+                return self._send(200, page)
+            return self._send(404, "not found")
+
+    return Handler, stats
+
+
+def start_server(pages, host="127.0.0.1", port=0, **options):
+    """在后台线程启动服务器，返回 (server, base_url, stats)；port=0 自动分配端口"""
+    handler, stats = make_handler(pages, **options)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}", stats
+
+
+def page_urls(base_url: str, n: int, first_id: int = 1000) -> list:
+    return [f"{base_url}/laws/violation/{first_id + i}/01.html" for i in range(n)]
+
+
+def main():
+    from crawler.bench_extract import load_corpus
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", default="", help="录制的违规详情页目录（.html / .html.gz），为空则生成")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="返回 429/500/503 的概率")
+    parser.add_argument("--empty-rate", type=float, default=0.0, help="iframe 返回空页面的概率")
+    parser.add_argument("--render-delay-ms", type=int, default=0, help="正文由脚本延迟插入的毫秒数")
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus) if args.corpus else synthetic_pages()
+    server, base_url, _ = start_server(
+        pages, port=args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, empty_rate=args.empty_rate,
+        render_delay_ms=args.render_delay_ms)
+    print(f"本地页面服务器：{base_url}/laws/violation/1000/01.html（{len(pages)} 个页面）")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
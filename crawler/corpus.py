@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+JSONL 语料分片：文档追加写入按大小切分的分片（可选 zstd 压缩），旁路 .idx 记录每个 id 的偏移量
+
+    corpus-00000.jsonl(.zst)   每行一个文档 {"id", "url", "fetched_at", "sha256", "text"[, "title", "sections", "tables"]}
+    corpus-00000.idx           每行 {"id", "offset", "length"}，支持按 id 直接定位
+"""
+
+import os
+import re
+import json
+import time
+
+SHARD_RE = re.compile(r"^corpus-(\d{5})\.jsonl(\.zst)?$")
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd 压缩需要安装 zstandard：pip install zstandard")
+    return zstandard
+
+
+class CorpusWriter:
+    """
+    每条文档单独成一个 zstd 帧，帧首尾相接仍是合法的 zstd 流，
+    既可整片流式解压，也可按偏移只解压一条
+    """
+
+    def __init__(self, root: str = "out/corpus", max_bytes: int = 64 * 1024 * 1024,
+                 compress: bool = False):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self._cctx = _zstd().ZstdCompressor(level=3) if compress else None
+        os.makedirs(root, exist_ok=True)
+        existing = sorted((int(m.group(1)), bool(m.group(2)))
+                          for m in map(SHARD_RE.match, os.listdir(root)) if m)
+        self.shard = 0
+        if existing:
+            last, last_zst = existing[-1]
+            # 续写最后一个分片；压缩方式不同则另起一片
+            self.shard = last if last_zst == compress else last + 1
+        self._open()
+
+    def _shard_path(self, shard: int) -> str:
+        ext = ".jsonl.zst" if self.compress else ".jsonl"
+        return os.path.join(self.root, f"corpus-{shard:05d}{ext}")
+
+    def _open(self):
+        path = self._shard_path(self.shard)
+        self._fp = open(path, "ab")
+        self._idx = open(os.path.join(self.root, f"corpus-{self.shard:05d}.idx"), "a", encoding="utf-8")
+        self.offset = self._fp.tell()
+
+    def _rotate(self):
+        self.close()
+        self.shard += 1
+        self._open()
+
+    def append(self, doc_id: int, url: str, text: str, sha256: str | None = None,
+               fetched_at: str | None = None, structure: dict | None = None):
+        """structure 为 crawler.sections.extract_sections 的结果，展开为 title / sections / tables 字段"""
+        doc = {
+            "id": doc_id,
+            "url": url,
+            "fetched_at": fetched_at or time.strftime("%Y-%m-%d %H:%M:%S"),
+            "sha256": sha256,
+            "text": text,
+        }
+        if structure:
+            doc.update(structure)
+        data = (json.dumps(doc, ensure_ascii=False) + "\n").encode("utf-8")
+        if self.compress:
+            data = self._cctx.compress(data)
+        if self.offset and self.offset + len(data) > self.max_bytes:
+            self._rotate()
+        self._fp.write(data)
+        self._fp.flush()
+        self._idx.write(json.dumps({"id": doc_id, "offset": self.offset, "length": len(data)}) + "\n")
+        self._idx.flush()
+        self.offset += len(data)
+
+    def close(self):
+        self._fp.close()
+        self._idx.close()
+
+
+class CorpusReader:
+    """加载全部 .idx 后按 id O(1) 定位；同一 id 多次写入时以最后一次为准"""
+
+    def __init__(self, root: str = "out/corpus"):
+        self.root = root
+        self.shards = {}
+        for name in sorted(os.listdir(root)):
+            m = SHARD_RE.match(name)
+            if m:
+                self.shards[int(m.group(1))] = os.path.join(root, name)
+        self.index = {}
+        for shard in self.shards:
+            idx_path = os.path.join(root, f"corpus-{shard:05d}.idx")
+            if not os.path.exists(idx_path):
+                continue
+            with open(idx_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    self.index[entry["id"]] = (shard, entry["offset"], entry["length"])
+        self._dctx = None
+
+    def __len__(self):
+        return len(self.index)
+
+    def ids(self):
+        return sorted(self.index)
+
+    def _decode(self, path: str, data: bytes) -> dict:
+        if path.endswith(".zst"):
+            if self._dctx is None:
+                self._dctx = _zstd().ZstdDecompressor()
+            data = self._dctx.decompress(data)
+        return json.loads(data)
+
+    def get(self, doc_id: int) -> dict:
+        shard, offset, length = self.index[doc_id]
+        path = self.shards[shard]
+        with open(path, "rb") as f:
+            f.seek(offset)
+            return self._decode(path, f.read(length))
+
+    def __iter__(self):
+        """按分片顺序流式读取，跳过被后续写入覆盖的旧版本"""
+        for shard, path in self.shards.items():
+            positions = {}
+            idx_path = os.path.join(self.root, f"corpus-{shard:05d}.idx")
+            if not os.path.exists(idx_path):
+                continue
+            with open(idx_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if self.index.get(entry["id"]) == (shard, entry["offset"], entry["length"]):
+                        positions[entry["offset"]] = entry["length"]
+            with open(path, "rb") as f:
+                for offset in sorted(positions):
+                    f.seek(offset)
+                    yield self._decode(path, f.read(positions[offset]))
+
+
+def is_corpus_dir(path: str) -> bool:
+    return os.path.isdir(path) and any(SHARD_RE.match(n) for n in os.listdir(path))
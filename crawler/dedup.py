@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+语料近重复检测：64 位 SimHash + 分段倒排索引，把事先告知书 / 决定书、转载稿等近似文档聚类，
+每簇选一篇代表交给 LLM 结构化，其余直接复用代表的结果
+
+    python -m crawler.dedup out --threshold 3 --batch-size 2000
+    python -m crawler.dedup out/corpus --workers 8
+
+输出 <目录>/near_duplicates.json：
+    {"threshold": 3, "documents": N, "clusters": [{"representative": "012.txt", "members": ["012.txt", "587.txt"]}]}
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+INDEX_NAME = "near_duplicates.json"
+
+# 去掉空白和标点后再切分，排版差异不影响指纹
+_NOISE_RE = re.compile(r"[\s\W_]+", re.UNICODE)
+
+
+def simhash(text: str, shingle: int = 4) -> int:
+    """
+    字符 n-gram 去重后按 blake2b 哈希投票；逐字节查表累加，避免 64 次逐位循环
+    """
+    text = _NOISE_RE.sub("", text)
+    grams = {text[i:i + shingle] for i in range(max(1, len(text) - shingle + 1))}
+    counts = [[0] * 256 for _ in range(8)]
+    for gram in grams:
+        digest = hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest()
+        for pos, byte in enumerate(digest):
+            counts[pos][byte] += 1
+    half = len(grams) / 2
+    value = 0
+    for pos in range(8):
+        table = counts[pos]
+        for bit in range(8):
+            mask = 1 << bit
+            ones = sum(n for byte, n in enumerate(table) if byte & mask)
+            if ones > half:
+                value |= 1 << (pos * 8 + bit)
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _fingerprint(item):
+    name, text = item
+    return name, len(text), simhash(text)
+
+
+class NearDuplicateIndex:
+    """
+    汉明距离 <= threshold 的指纹必然在 threshold+1 段中至少有一段完全相同（抽屉原理），
+    只在同段桶内比较；内存中只保留指纹和并查集，不保留正文
+    """
+
+    def __init__(self, threshold: int = 3, max_bucket: int = 500):
+        self.threshold = threshold
+        self.bands = threshold + 1
+        self.band_bits = 64 // self.bands
+        self.max_bucket = max_bucket
+        self.buckets = [{} for _ in range(self.bands)]
+        self.names = []
+        self.chars = []
+        self.hashes = []
+        self.parent = []
+
+    def _find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def _union(self, a: int, b: int):
+        ra, rb = self._find(a), self._find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+    def add(self, name: str, chars: int, value: int):
+        doc = len(self.names)
+        self.names.append(name)
+        self.chars.append(chars)
+        self.hashes.append(value)
+        self.parent.append(doc)
+        mask = (1 << self.band_bits) - 1
+        for band, table in enumerate(self.buckets):
+            key = (value >> (band * self.band_bits)) & mask
+            bucket = table.setdefault(key, [])
+            # 超大桶多为模板化短文，只和最近的一批比较，避免平方级开销
+            for other in bucket[-self.max_bucket:]:
+                if hamming(value, self.hashes[other]) <= self.threshold:
+                    self._union(doc, other)
+            bucket.append(doc)
+
+    def clusters(self) -> list:
+        """只返回成员数大于 1 的簇；代表取正文最长者，同长取文件名最小者"""
+        groups = {}
+        for doc in range(len(self.names)):
+            groups.setdefault(self._find(doc), []).append(doc)
+        result = []
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            rep = min(members, key=lambda d: (-self.chars[d], self.names[d]))
+            result.append({"representative": self.names[rep],
+                           "members": sorted(self.names[d] for d in members)})
+        result.sort(key=lambda c: c["representative"])
+        return result
+
+
+def iter_documents(directory: str):
+    """yield (文件名, 正文)；语料分片目录按 NNN.txt 命名，与 out/ 下的 txt 一致"""
+    from crawler.corpus import CorpusReader, is_corpus_dir
+    if is_corpus_dir(directory):
+        for doc in CorpusReader(directory):
+            yield f"{doc['id']:03d}.txt", doc["text"]
+        return
+    for name in sorted(f for f in os.listdir(directory) if f.endswith(".txt")):
+        with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+            yield name, f.read()
+
+
+def _batches(items, size: int):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def build_index(directory: str, threshold: int = 3, min_chars: int = 200,
+                batch_size: int = 2000, workers: int = 0) -> dict:
+    """
+    按 batch_size 分批读入正文并多进程计算指纹，任一时刻内存中最多一批正文；
+    短于 min_chars 的文档不参与聚类
+    """
+    index = NearDuplicateIndex(threshold)
+    skipped = 0
+    t0 = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or None) as ex:
+        for batch in _batches(iter_documents(directory), batch_size):
+            docs = [(name, text) for name, text in batch if len(text) >= min_chars]
+            skipped += len(batch) - len(docs)
+            for name, chars, value in ex.map(_fingerprint, docs, chunksize=64):
+                index.add(name, chars, value)
+            print(f"已计算 {len(index.names)} 个指纹（{time.perf_counter() - t0:.1f}s）")
+    clusters = index.clusters()
+    return {
+        "threshold": threshold,
+        "documents": len(index.names),
+        "skipped_short": skipped,
+        "duplicates": sum(len(c["members"]) - 1 for c in clusters),
+        "clusters": clusters,
+    }
+
+
+def load_duplicate_map(path: str) -> dict:
+    """返回 {重复文档: 代表文档}，代表文档自身不在其中"""
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return {m: c["representative"] for c in data.get("clusters", [])
+            for m in c["members"] if m != c["representative"]}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("directory", nargs="?", default="out", help="out/ 或 JSONL 语料分片目录")
+    parser.add_argument("--output", default="", help=f"索引输出路径，默认 <目录>/{INDEX_NAME}")
+    parser.add_argument("--threshold", type=int, default=3, help="SimHash 汉明距离阈值")
+    parser.add_argument("--min-chars", type=int, default=200, help="短于该长度的文档不参与去重")
+    parser.add_argument("--batch-size", type=int, default=2000, help="每批读入内存的文档数")
+    parser.add_argument("--workers", type=int, default=0, help="计算指纹的进程数，默认等于 CPU 核数")
+    args = parser.parse_args()
+
+    result = build_index(args.directory, args.threshold, args.min_chars, args.batch_size, args.workers)
+    output = args.output or os.path.join(args.directory, INDEX_NAME)
+    tmp = output + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, output)
+    print(f"{result['documents']} 个文档，{len(result['clusters'])} 个近重复簇，"
+          f"可跳过 {result['duplicates']} 次 LLM 调用，索引已写入 {output}")
+
+
+if __name__ == "__main__":
+    main()
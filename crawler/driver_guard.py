@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+浏览器看护：每 N 页或内存超过阈值时重启 driver，driver 崩溃时透明重启并重试当前页；
+重启失败时按指数退避重试，仍失败则只把当前页记为失败，不中断整个抓取
+"""
+
+import time
+
+try:
+    import psutil
+except ImportError:  # 没有 psutil 时只按页数回收
+    psutil = None
+
+
+def driver_rss_mb(driver) -> float | None:
+    """chromedriver 及其全部子进程（浏览器、渲染进程）的 RSS 之和（MB）"""
+    if psutil is None:
+        return None
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        procs = [root] + root.children(recursive=True)
+    except Exception:
+        return None
+    total = 0
+    for p in procs:
+        try:
+            total += p.memory_info().rss
+        except psutil.Error:
+            continue
+    return total / 1024 / 1024
+
+
+class DriverGuard:
+    def __init__(self, driver_factory, recycle_every: int = 0, max_rss_mb: float = 0,
+                 log=print, restart_attempts: int = 3, restart_backoff: float = 2.0):
+        self.driver_factory = driver_factory
+        self.recycle_every = recycle_every
+        self.max_rss_mb = max_rss_mb
+        self.log = log
+        self.restart_attempts = restart_attempts
+        self.restart_backoff = restart_backoff
+        self.driver = driver_factory()
+        self.pages = 0
+        self.restarts = 0
+        # 上一页结束时判定需要回收，留到下一页开始前再重启，保证已完成的记录先交给调用方
+        self.recycle_reason = None
+        if max_rss_mb and psutil is None:
+            self.log("⚠ 未安装 psutil，内存阈值回收不可用，仅按页数回收")
+
+    def alive(self) -> bool:
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def restart(self, reason: str) -> bool:
+        """重启浏览器，启动失败时退避重试；全部失败时 driver 置为 None 并返回 False，下一页会再次尝试"""
+        self.log(f"♻ 重启浏览器：{reason}")
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception:
+                pass
+            self.driver = None
+        for attempt in range(self.restart_attempts):
+            try:
+                self.driver = self.driver_factory()
+            except Exception as e:
+                delay = self.restart_backoff * 2 ** attempt
+                self.log(f"⚠ 浏览器启动失败（第 {attempt + 1}/{self.restart_attempts} 次）：{e}，{delay:.0f} 秒后重试")
+                time.sleep(delay)
+                continue
+            self.pages = 0
+            self.restarts += 1
+            return True
+        return False
+
+    def _failed(self, index: int, url: str, error: str) -> dict:
+        return {"index": index, "url": url, "ok": False, "error": error}
+
+    def run(self, handle, index: int, url: str) -> dict:
+        """
+        执行 handle(driver, index, url)；浏览器已崩溃时重启后重试一次，
+        返回的记录附带 rss_mb；需要回收浏览器时在下一页开始前重启，不影响已完成的这一页
+        """
+        t0 = time.perf_counter()
+        reason = self.recycle_reason or ("上次重启失败，再次尝试启动" if self.driver is None else None)
+        self.recycle_reason = None
+        if reason and not self.restart(reason):
+            return self._failed(index, url, "浏览器启动失败")
+        try:
+            record = handle(self.driver, index, url)
+        except Exception as e:
+            if self.alive():
+                record = self._failed(index, url, str(e))
+            elif not self.restart(f"浏览器无响应（{type(e).__name__}）"):
+                return self._failed(index, url, f"{e}；浏览器重启失败")
+            else:
+                try:
+                    record = handle(self.driver, index, url)
+                except Exception as e2:
+                    record = self._failed(index, url, str(e2))
+                record["restarted"] = True
+        record.setdefault("elapsed", time.perf_counter() - t0)
+
+        self.pages += 1
+        rss = driver_rss_mb(self.driver)
+        record["rss_mb"] = round(rss, 1) if rss is not None else None
+        if self.recycle_every and self.pages >= self.recycle_every:
+            self.recycle_reason = f"已处理 {self.pages} 页"
+        elif self.max_rss_mb and rss is not None and rss > self.max_rss_mb:
+            self.recycle_reason = f"内存 {rss:.0f} MB 超过 {self.max_rss_mb:.0f} MB"
+        return record
+
+    def quit(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
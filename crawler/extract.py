@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+基于 lxml 的正文抽取：选择器预编译为 XPath，单次遍历收集文本，输出与原 BeautifulSoup 版本一致；
+同一棵树上可顺带按章节切分（见 crawler/sections.py）
+"""
+
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree, html as lxml_html
+
+CONTENT_SELECTORS = [".law-content", ".ant-card-body", ".detail-content", "article", "#app"]
+
+# get_text() 默认不包含脚本、样式和模板中的文本
+SKIP_TAGS = {"script", "style", "template"}
+
+_SPACES_RE = re.compile(r"[ \t\xa0\u3000]+")
+_NEWLINES_RE = re.compile(r"\s*\n\s*")
+
+
+def clean(s: str) -> str:
+    if not s:
+        return ""
+    s = _SPACES_RE.sub(" ", s)
+    s = _NEWLINES_RE.sub("\n", s)
+    return s.strip()
+
+
+def _selector_xpath(sel: str) -> etree.XPath:
+    """只需支持 .class / #id / tag 三种简单选择器"""
+    if sel.startswith("."):
+        expr = f"(//*[contains(concat(' ', normalize-space(@class), ' '), ' {sel[1:]} ')])[1]"
+    elif sel.startswith("#"):
+        expr = f"(//*[@id='{sel[1:]}'])[1]"
+    else:
+        expr = f"(//{sel})[1]"
+    return etree.XPath(expr)
+
+
+SELECTOR_XPATHS = [_selector_xpath(sel) for sel in CONTENT_SELECTORS]
+
+
+def _collect(el, out: list):
+    if el.text:
+        out.append(el.text)
+    for child in el:
+        # 注释、处理指令的 tag 不是字符串，只保留它们后面的 tail 文本
+        if isinstance(child.tag, str) and child.tag not in SKIP_TAGS:
+            _collect(child, out)
+        if child.tail:
+            out.append(child.tail)
+
+
+def node_text(el) -> str:
+    """等价于 BeautifulSoup 的 get_text(" ", strip=True)"""
+    parts = []
+    _collect(el, parts)
+    return " ".join(p for p in (s.strip() for s in parts) if p)
+
+
+def parse_html(html: str):
+    """返回文档根节点，无法解析时返回 None"""
+    if not html or not html.strip():
+        return None
+    try:
+        return lxml_html.document_fromstring(html)
+    except ValueError:
+        # 带 XML 编码声明的字符串需要按字节解析
+        return lxml_html.document_fromstring(html.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+
+def content_node(root):
+    """按 CONTENT_SELECTORS 顺序取第一个命中的正文节点，都不命中时返回整个文档"""
+    for xp in SELECTOR_XPATHS:
+        found = xp(root)
+        if found:
+            return found[0]
+    return root
+
+
+def extract_text(html: str, timings: dict | None = None) -> str:
+    """timings 不为 None 时写入 parse（建树）和 text（选择器 + 取文本）两段耗时"""
+    return extract_page(html, timings, sections=False)[0]
+
+
+def extract_page(html: str, timings: dict | None = None, sections: bool = True):
+    """
+    只建一次树，返回 (正文, 章节结构)；sections=False 时结构为 None，
+    章节切分耗时记入 timings["sections"]
+    """
+    t0 = time.perf_counter()
+    root = parse_html(html)
+    if root is None:
+        return "", None
+    t1 = time.perf_counter()
+    node = content_node(root)
+    text = clean(node_text(node))
+    t2 = time.perf_counter()
+    structure = None
+    if sections:
+        from crawler.sections import extract_sections
+        structure = extract_sections(node)
+    if timings is not None:
+        timings["parse"] = t1 - t0
+        timings["text"] = t2 - t1
+        if sections:
+            timings["sections"] = time.perf_counter() - t2
+    return text, structure
+
+
+def extract_many(htmls, workers: int = 0, chunksize: int = 16) -> list:
+    """多进程批量抽取，按输入顺序返回正文列表"""
+    htmls = list(htmls)
+    if workers == 1 or len(htmls) < 2:
+        return [extract_text(h) for h in htmls]
+    with ProcessPoolExecutor(max_workers=workers or None) as ex:
+        return list(ex.map(extract_text, htmls, chunksize=chunksize))
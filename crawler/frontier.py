@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+URL 列表：从 txt（每行一个，# 开头为注释）或 JSONL（{"url": ...}）文件流式读取，规范化、去重并按稳定哈希分片
+"""
+
+import json
+import hashlib
+from urllib.parse import urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def normalize_url(url: str) -> str:
+    """scheme / host 小写，去掉默认端口和 #fragment"""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and str(parts.port) != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """'i/N' -> (i, N)，i 从 0 开始"""
+    i, n = (int(x) for x in spec.split("/"))
+    if n < 1 or not 0 <= i < n:
+        raise ValueError(f"无效的分片参数：{spec}，应为 i/N 且 0 <= i < N")
+    return i, n
+
+
+def shard_of(url: str, shards: int) -> int:
+    """只依赖 URL 本身的稳定哈希，各节点读同一文件得到相同的划分"""
+    digest = hashlib.sha1(url.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % shards
+
+
+def _iter_raw(path: str):
+    jsonl = path.endswith((".jsonl", ".ndjson"))
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if jsonl:
+                try:
+                    yield json.loads(line)["url"]
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue
+            else:
+                yield line
+
+
+def iter_frontier(path: str, shard: tuple[int, int] | None = None):
+    """
+    yield (index, url)；index 为去重后在整个文件中的序号（从 1 开始），
+    分片后仍保持全局序号，多个节点的 out/NNN.txt 可以直接合并
+    """
+    seen = set()
+    index = 0
+    for raw in _iter_raw(path):
+        url = normalize_url(raw)
+        if not url.startswith(("http://", "https://")) or url in seen:
+            continue
+        seen.add(url)
+        index += 1
+        if shard and shard_of(url, shard[1]) != shard[0]:
+            continue
+        yield index, url
+
+
+def load_frontier(path: str, shard: tuple[int, int] | None = None) -> tuple[list, int]:
+    """返回 (本分片的 [(index, url), ...], 去重后的 URL 总数)"""
+    tasks = []
+    total = 0
+    for index, url in iter_frontier(path):
+        total = index
+        if shard is None or shard_of(url, shard[1]) == shard[0]:
+            tasks.append((index, url))
+    return tasks, total
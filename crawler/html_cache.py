@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""
+原始 HTML 的内容寻址缓存：按 sha256 存 gzip 压缩文件，URL 到哈希的映射记录在抓取清单中
+"""
+
+import os
+import gzip
+import hashlib
+
+
+class HtmlCache:
+    """blob 路径为 <root>/<sha 前两位>/<sha>.html.gz，相同内容只存一份"""
+
+    def __init__(self, root: str = "cache/html"):
+        self.root = root
+
+    def _path(self, sha: str) -> str:
+        return os.path.join(self.root, sha[:2], f"{sha}.html.gz")
+
+    def has(self, sha: str) -> bool:
+        return os.path.exists(self._path(sha))
+
+    def put(self, html: str) -> str:
+        data = html.encode("utf-8")
+        sha = hashlib.sha256(data).hexdigest()
+        path = self._path(sha)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 先写临时文件再改名，多个抓取进程同时写同一内容也不会读到半个文件
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with gzip.open(tmp, "wb", compresslevel=6) as f:
+                f.write(data)
+            os.replace(tmp, path)
+        return sha
+
+    def get(self, sha: str) -> str:
+        with gzip.open(self._path(sha), "rb") as f:
+            return f.read().decode("utf-8")
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+纯 HTTP 抓取后端（aiohttp）：不启动浏览器，直接请求页面及其中的违规详情 iframe 文档
+"""
+
+import re
+import time
+import asyncio
+from urllib.parse import urljoin, urlsplit
+
+IFRAME_KEYWORDS = ["violation", "easy-board", "newviolation"]
+IFRAME_SRC_RE = re.compile(r"""<iframe\b[^>]*?\bsrc\s*=\s*["']([^"']+)["']""", re.I)
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/122.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "zh-CN,zh;q=0.9",
+}
+
+
+def find_iframe_src(html: str, base_url: str) -> str | None:
+    """从静态 HTML 中找出违规详情 iframe 的绝对地址"""
+    for src in IFRAME_SRC_RE.findall(html or ""):
+        if any(k in src.lower() for k in IFRAME_KEYWORDS):
+            return urljoin(base_url, src)
+    return None
+
+
+async def _get(session, url: str) -> str:
+    async with session.get(url) as resp:
+        resp.raise_for_status()
+        return await resp.text(errors="replace")
+
+
+async def fetch_html(session, url: str, accept) -> str | None:
+    """
+    先取页面本身，不满足 accept(html) 时再取 iframe 文档；都不满足返回 None
+    """
+    html = await _get(session, url)
+    if accept(html):
+        return html
+    src = find_iframe_src(html, url)
+    if src:
+        frame_html = await _get(session, src)
+        if accept(frame_html):
+            return frame_html
+    return None
+
+
+async def _fetch_all(urls, accept, concurrency: int, timeout: float, limiter=None) -> dict:
+    import aiohttp
+
+    sem = asyncio.Semaphore(concurrency)
+    results = {}
+
+    async def one(session, url):
+        host = urlsplit(url).netloc
+        async with sem:
+            if limiter:
+                while (wait := limiter.try_acquire(host)) > 0:
+                    await asyncio.sleep(wait)
+            t0 = time.perf_counter()
+            status = 200
+            error = None
+            try:
+                html = await fetch_html(session, url, accept)
+            except aiohttp.ClientResponseError as e:
+                html, status = None, e.status
+            except Exception as e:
+                # 连接被拒、超时等没有状态码，但同样说明主机承受不住当前速率
+                html, status, error = None, None, type(e).__name__
+            elapsed = time.perf_counter() - t0
+            if limiter:
+                # 缺少章节只说明需要浏览器渲染，不算作服务端压力信号
+                limiter.feedback(host, elapsed, status, error=error)
+            results[url] = (html, elapsed, status)
+
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=client_timeout) as session:
+        await asyncio.gather(*(one(session, u) for u in urls))
+    return results
+
+
+def fetch_all(urls, accept, concurrency: int = 8, timeout: float = 20.0, limiter=None) -> dict:
+    """
+    并发抓取一批 URL，返回 {url: (html 或 None, 耗时秒, HTTP 状态码)}；None 表示需要回退到浏览器
+    """
+    return asyncio.run(_fetch_all(list(urls), accept, concurrency, timeout, limiter))
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+按域名学习「页面 URL -> 违规详情 iframe 地址」的映射，命中后可直接打开 iframe，跳过外层页面和逐帧探测
+"""
+
+import os
+import json
+from urllib.parse import urlsplit
+
+
+def _id_segments(url: str):
+    """URL 路径中可能是文书 ID 的片段（至少 3 位，含数字）"""
+    parts = [p for p in urlsplit(url).path.split("/") if p]
+    return [(idx, p) for idx, p in enumerate(parts)
+            if len(p) >= 3 and any(c.isdigit() for c in p) and "." not in p]
+
+
+class IframePatternCache:
+    """
+    模板形如 {"segment": 2, "template": "https://host/newviolation?id={id}"}：
+    取页面路径第 segment 段替换 {id} 即为 iframe 地址
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.patterns = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.patterns = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self.patterns = {}
+
+    def resolve(self, page_url: str) -> str | None:
+        pattern = self.patterns.get(urlsplit(page_url).netloc)
+        if not pattern:
+            return None
+        parts = [p for p in urlsplit(page_url).path.split("/") if p]
+        if pattern["segment"] >= len(parts):
+            return None
+        return pattern["template"].replace("{id}", parts[pattern["segment"]])
+
+    def learn(self, page_url: str, iframe_src: str) -> bool:
+        """根据一次成功的抓取学习模板；页面 ID 不出现在 iframe 地址中时无法学习"""
+        for idx, seg in _id_segments(page_url):
+            if seg in iframe_src:
+                pattern = {"segment": idx, "template": iframe_src.replace(seg, "{id}", 1)}
+                host = urlsplit(page_url).netloc
+                if self.patterns.get(host) != pattern:
+                    self.patterns[host] = pattern
+                    self.save()
+                return True
+        return False
+
+    def forget(self, page_url: str):
+        """模板失效（打开后没有正文）时删除"""
+        if self.patterns.pop(urlsplit(page_url).netloc, None) is not None:
+            self.save()
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.patterns, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
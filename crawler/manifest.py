@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+抓取清单：追加写入的 JSONL，记录每个 URL 的状态、字节数、内容哈希和耗时，用于断点续抓
+"""
+
+import os
+import json
+import time
+
+
+class CrawlManifest:
+    """以 URL 为键，保留每个 URL 最近一次的抓取记录"""
+
+    def __init__(self, path: str = "out/manifest.jsonl"):
+        self.path = path
+        self.entries = {}
+        # 最近一次成功抓取的内容哈希，失败记录不会覆盖它
+        self.hashes = {}
+        # 同理保留最近一次成功抓取的 HTML 哈希，离线重抽取时按它读取 HTML 缓存
+        self.html_hashes = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 中断时可能写了半行，忽略即可
+                        continue
+                    self._remember(entry)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._fp = open(path, "a", encoding="utf-8")
+
+    def is_done(self, url: str) -> bool:
+        entry = self.entries.get(url)
+        return bool(entry and entry.get("status") == "ok")
+
+    def pending(self, tasks):
+        """过滤掉已成功抓取的任务，失败和未抓取的保留"""
+        return [(i, url) for i, url in tasks if not self.is_done(url)]
+
+    def record(self, record: dict) -> str:
+        """
+        写入一条抓取结果，返回内容变化情况：new / changed / unchanged / failed
+        """
+        prev_hash = self.hashes.get(record["url"])
+        entry = {
+            "url": record["url"],
+            "index": record["index"],
+            "status": "ok" if record["ok"] else "failed",
+            "bytes": record.get("bytes", 0),
+            "transferred": record.get("transferred", 0),
+            "sha256": record.get("sha256"),
+            "html_sha256": record.get("html_sha256"),
+            "elapsed": round(record.get("elapsed", 0.0), 3),
+            "rss_mb": record.get("rss_mb"),
+            "timings": {k: round(v, 3) for k, v in record.get("timings", {}).items()},
+            "backend": record.get("backend"),
+            "iframe_route": record.get("iframe_route"),
+            "error": record.get("error"),
+            "fetched_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        if not record["ok"]:
+            change = "failed"
+        elif not prev_hash:
+            change = "new"
+        elif prev_hash != entry["sha256"]:
+            change = "changed"
+        else:
+            change = "unchanged"
+        entry["change"] = change
+        self._fp.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._fp.flush()
+        self._remember(entry)
+        return change
+
+    def _remember(self, entry: dict):
+        self.entries[entry["url"]] = entry
+        if entry.get("sha256"):
+            self.hashes[entry["url"]] = entry["sha256"]
+        if entry.get("html_sha256"):
+            self.html_hashes[entry["url"]] = entry["html_sha256"]
+
+    def close(self):
+        self._fp.close()
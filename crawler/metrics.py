@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""
+抓取指标：逐页记录各阶段耗时，导出 pages.csv、summary.json（含 p50/p95/p99）和 Prometheus 文本格式
+"""
+
+import os
+import csv
+import json
+import time
+
+PHASES = ["direct", "navigate", "ready", "iframe", "probe", "settle", "page_source",
+          "fetch", "parse", "text", "sections", "save", "cache"]
+QUANTILES = [0.5, 0.95, 0.99]
+
+
+def percentile(values, q: float) -> float:
+    """线性插值分位数"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    pos = (len(values) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+class CrawlMetrics:
+    def __init__(self, out_dir: str = "out/metrics", flush_every: int = 100):
+        self.out_dir = out_dir
+        self.flush_every = flush_every
+        self.rows = []
+        self.started = time.time()
+
+    def add(self, record: dict):
+        timings = record.get("timings") or {}
+        row = {
+            "index": record["index"],
+            "url": record["url"],
+            "ok": record["ok"],
+            "backend": record.get("backend"),
+            "iframe_route": record.get("iframe_route"),
+            "status": record.get("status"),
+            "chars": record.get("chars", 0),
+            "transferred": record.get("transferred", 0),
+            "rss_mb": record.get("rss_mb"),
+            "elapsed": round(record.get("elapsed", 0.0), 4),
+        }
+        for phase in PHASES:
+            row[phase] = round(timings[phase], 4) if phase in timings else None
+        self.rows.append(row)
+        if self.flush_every and len(self.rows) % self.flush_every == 0:
+            self.write()
+
+    def summary(self) -> dict:
+        wall = time.time() - self.started
+        ok = sum(1 for r in self.rows if r["ok"])
+        result = {
+            "pages": len(self.rows),
+            "ok": ok,
+            "failed": len(self.rows) - ok,
+            "wall_seconds": round(wall, 2),
+            "pages_per_second": round(len(self.rows) / wall, 3) if wall > 0 else 0.0,
+            "phases": {},
+        }
+        for phase in ["elapsed"] + PHASES:
+            values = [r[phase] for r in self.rows if r[phase] is not None]
+            if not values:
+                continue
+            stats = {"count": len(values), "mean": round(sum(values) / len(values), 4),
+                     "sum": round(sum(values), 3)}
+            for q in QUANTILES:
+                stats[f"p{int(q * 100)}"] = round(percentile(values, q), 4)
+            result["phases"][phase] = stats
+        return result
+
+    def prometheus(self, summary: dict) -> str:
+        lines = [
+            "# HELP crawl_pages_total Pages crawled by status.",
+            "# TYPE crawl_pages_total counter",
+            f'crawl_pages_total{{status="ok"}} {summary["ok"]}',
+            f'crawl_pages_total{{status="failed"}} {summary["failed"]}',
+            "# HELP crawl_pages_per_second Overall crawl throughput.",
+            "# TYPE crawl_pages_per_second gauge",
+            f"crawl_pages_per_second {summary['pages_per_second']}",
+            "# HELP crawl_phase_seconds Per-page time spent in each crawl phase.",
+            "# TYPE crawl_phase_seconds summary",
+        ]
+        for phase, stats in summary["phases"].items():
+            for q in QUANTILES:
+                lines.append(f'crawl_phase_seconds{{phase="{phase}",quantile="{q}"}} '
+                             f'{stats[f"p{int(q * 100)}"]}')
+            lines.append(f'crawl_phase_seconds_sum{{phase="{phase}"}} {stats["sum"]}')
+            lines.append(f'crawl_phase_seconds_count{{phase="{phase}"}} {stats["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> dict:
+        os.makedirs(self.out_dir, exist_ok=True)
+        fields = ["index", "url", "ok", "backend", "iframe_route", "status", "chars",
+                  "transferred", "rss_mb", "elapsed"] + PHASES
+        with open(os.path.join(self.out_dir, "pages.csv"), "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(self.rows)
+        summary = self.summary()
+        with open(os.path.join(self.out_dir, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        with open(os.path.join(self.out_dir, "metrics.prom"), "w", encoding="utf-8") as f:
+            f.write(self.prometheus(summary))
+        return summary
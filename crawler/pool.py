@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+多进程浏览器池：每个工作进程持有一个独立的 driver，从共享队列中领取 URL
+"""
+
+import queue
+import multiprocessing as mp
+from urllib.parse import urlsplit
+
+from crawler.driver_guard import DriverGuard
+
+
+def _worker_loop(worker_id, task_q, result_q, driver_factory, handle, recycle_every, max_rss_mb):
+    """工作进程主循环：启动自己的 driver，逐个处理队列中的任务"""
+    def log(msg):
+        print(f"[worker {worker_id}] {msg}")
+
+    try:
+        guard = DriverGuard(driver_factory, recycle_every, max_rss_mb, log=log)
+    except Exception as e:
+        result_q.put(("dead", worker_id, f"浏览器启动失败: {e}"))
+        return
+    try:
+        while True:
+            task = task_q.get()
+            if task is None:
+                break
+            seq, index, url = task
+            try:
+                record = guard.run(handle, index, url)
+            except Exception as e:
+                # 浏览器重启失败由 DriverGuard 记为单页失败，这里只兜底处理意外异常
+                result_q.put(("done", seq, {"index": index, "url": url, "ok": False,
+                                            "error": str(e), "worker": worker_id}))
+                result_q.put(("dead", worker_id, f"浏览器重启失败: {e}"))
+                return
+            record["worker"] = worker_id
+            result_q.put(("done", seq, record))
+    finally:
+        guard.quit()
+
+
+def run_pool(tasks, workers, driver_factory, handle, limiter=None,
+             recycle_every: int = 0, max_rss_mb: float = 0):
+    """
+    并行抓取，按输入顺序逐条 yield 结果
+
+    tasks: [(index, url), ...]
+    driver_factory: 无参可调用对象，在工作进程内创建 driver（需可 pickle）
+    handle: handle(driver, index, url) -> dict，在工作进程内执行（需可 pickle）
+    limiter: AIMDRateLimiter，由主进程按令牌派发任务，所有工作进程共享速率
+    recycle_every / max_rss_mb: 每个工作进程的浏览器回收条件，见 DriverGuard
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return
+    workers = max(1, min(workers, len(tasks)))
+
+    task_q = mp.Queue()
+    result_q = mp.Queue()
+    procs = [
+        mp.Process(target=_worker_loop,
+                   args=(w, task_q, result_q, driver_factory, handle,
+                         recycle_every, max_rss_mb),
+                   daemon=True)
+        for w in range(workers)
+    ]
+    for p in procs:
+        p.start()
+
+    pending = {}
+    next_seq = 0
+    put_seq = 0
+    in_flight = 0
+    try:
+        while next_seq < len(tasks):
+            # 只在有空闲工作进程且拿到令牌时派发，保证派发时刻就是开始抓取的时刻
+            timeout = 1.0
+            while put_seq < len(tasks) and in_flight < workers:
+                index, url = tasks[put_seq]
+                wait = limiter.try_acquire(urlsplit(url).netloc) if limiter else 0.0
+                if wait > 0:
+                    timeout = min(timeout, wait)
+                    break
+                task_q.put((put_seq, index, url))
+                put_seq += 1
+                in_flight += 1
+                if put_seq == len(tasks):
+                    for _ in range(workers):
+                        task_q.put(None)
+
+            try:
+                kind, key, payload = result_q.get(timeout=timeout)
+            except queue.Empty:
+                # 所有工作进程都已退出但仍有任务未完成，剩余任务记为失败
+                if all(not p.is_alive() for p in procs) and result_q.empty():
+                    for seq in range(next_seq, len(tasks)):
+                        if seq not in pending:
+                            index, url = tasks[seq]
+                            pending[seq] = {"index": index, "url": url, "ok": False,
+                                            "error": "工作进程已全部退出"}
+                else:
+                    continue
+            else:
+                if kind == "dead":
+                    print(f"⚠ 工作进程 {key} 不可用：{payload}")
+                    continue
+                in_flight -= 1
+                if limiter:
+                    limiter.observe(payload)
+                    payload["rate"] = limiter.rate(urlsplit(payload["url"]).netloc)
+                pending[key] = payload
+            while next_seq in pending:
+                yield pending.pop(next_seq)
+                next_seq += 1
+    finally:
+        if put_seq < len(tasks):
+            for _ in range(workers):
+                task_q.put(None)
+        for p in procs:
+            p.join(timeout=5)
+            if p.is_alive():
+                p.terminate()
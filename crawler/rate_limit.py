@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+按 host 的自适应限速：令牌桶 + AIMD（响应健康时线性加速，慢响应 / 429 / 空页面时成倍减速）
+"""
+
+import time
+from urllib.parse import urlsplit
+
+BACKOFF_STATUS = {429, 502, 503, 504}
+
+
+class AIMDRateLimiter:
+    """
+    只在主进程中使用：并行模式下由主进程按令牌派发任务，所有工作进程共享同一组速率
+    """
+
+    def __init__(self, start_rate=1.0, min_rate=0.1, max_rate=8.0, increase=0.1,
+                 decrease=0.5, burst=1.0, slow_threshold=15.0, cooldown=5.0, log=print):
+        self.start_rate = start_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.burst = burst
+        self.slow_threshold = slow_threshold
+        # 同一批在途请求可能同时失败，冷却期内只减速一次
+        self.cooldown = cooldown
+        self.log = log
+        self.hosts = {}
+
+    def _state(self, host: str) -> dict:
+        if host not in self.hosts:
+            self.hosts[host] = {"rate": self.start_rate, "tokens": self.burst,
+                                "updated": time.monotonic(), "last_backoff": 0.0}
+        return self.hosts[host]
+
+    def rate(self, host: str) -> float:
+        return self._state(host)["rate"]
+
+    def try_acquire(self, host: str) -> float:
+        """有令牌则取走并返回 0，否则返回还需等待的秒数（不取令牌）"""
+        st = self._state(host)
+        now = time.monotonic()
+        st["tokens"] = min(self.burst, st["tokens"] + (now - st["updated"]) * st["rate"])
+        st["updated"] = now
+        if st["tokens"] >= 1.0:
+            st["tokens"] -= 1.0
+            return 0.0
+        return (1.0 - st["tokens"]) / st["rate"]
+
+    def acquire(self, host: str):
+        """阻塞直到取得令牌"""
+        while True:
+            wait = self.try_acquire(host)
+            if wait <= 0:
+                return
+            time.sleep(wait)
+
+    def feedback(self, host: str, elapsed: float, status: int | None = None, empty: bool = False,
+                 error: str | None = None):
+        """error 为连接失败、超时等没有拿到 HTTP 响应的异常类型，与限流状态码一样触发降速"""
+        st = self._state(host)
+        reason = None
+        if error:
+            reason = f"请求失败（{error}）"
+        elif status in BACKOFF_STATUS:
+            reason = f"HTTP {status}"
+        elif empty:
+            reason = "空页面"
+        elif elapsed >= self.slow_threshold:
+            reason = f"响应慢 {elapsed:.1f}s"
+
+        if reason is None:
+            st["rate"] = min(self.max_rate, st["rate"] + self.increase)
+            return
+        now = time.monotonic()
+        if now - st["last_backoff"] < self.cooldown:
+            return
+        old = st["rate"]
+        st["rate"] = max(self.min_rate, old * self.decrease)
+        st["tokens"] = min(st["tokens"], 0.0)
+        st["last_backoff"] = now
+        self.log(f"⏬ 限速 {host}：{reason}，速率 {old:.2f} → {st['rate']:.2f} 次/秒")
+
+    def observe(self, record: dict):
+        """根据一条抓取记录调整速率"""
+        self.feedback(urlsplit(record["url"]).netloc,
+                      record.get("elapsed", 0.0),
+                      record.get("status"),
+                      empty=not record["ok"] or record.get("chars", 0) == 0)
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+按章节切分违规详情页：识别「违法事项」「处罚情况」「法规定据」等标题，表格解析为逐行字典
+
+    {
+      "title": "关于……的行政处罚决定书",
+      "sections": [{"name": "违法事项", "text": "……"}, ...],
+      "tables": [{"section": "处罚情况", "header": ["当事人", "处罚"], "rows": [{"当事人": "张三", "处罚": "罚款50万元"}]}]
+    }
+"""
+
+import re
+
+from crawler.extract import SKIP_TAGS, clean, node_text
+
+SECTION_NAMES = ["案件解析", "违法事项", "处罚情况", "处罚决定", "法规定据", "法律依据", "当事人", "总结"]
+
+# 标题之前的内容归入该章节
+PREAMBLE = "正文"
+
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+BLOCK_TAGS = HEADING_TAGS | {
+    "p", "div", "section", "article", "main", "header", "footer", "aside", "blockquote", "pre",
+    "ul", "ol", "li", "dl", "dt", "dd", "table", "form", "fieldset", "hr", "br",
+}
+
+_NUMBERING_RE = re.compile(r"^[（(]?[一二三四五六七八九十\d]+[)）、.．]\s*")
+_INLINE_HEADING_RE = re.compile(
+    r"^[（(]?(?:[一二三四五六七八九十\d]+[)）、.．]\s*)?(" + "|".join(SECTION_NAMES) + r")\s*[:：]\s*")
+
+
+def _heading_name(text: str, tag: str) -> str | None:
+    """整块文本是否为章节标题，是则返回规范化后的标题名"""
+    if len(text) > 40:
+        return None
+    name = _NUMBERING_RE.sub("", text).rstrip(":： ")
+    if name in SECTION_NAMES:
+        return name
+    if tag in HEADING_TAGS and name:
+        return name
+    return None
+
+
+def _walk(el, out: list):
+    """按文档顺序展开为 ("text", 文本, tag) / ("table", 元素) 块"""
+    if el.tag == "table":
+        out.append(("table", el, "table"))
+        return
+    if not any(isinstance(c.tag, str) and c.tag in BLOCK_TAGS for c in el):
+        text = node_text(el)
+        if text:
+            out.append(("text", text, el.tag))
+        return
+    if el.text and el.text.strip():
+        out.append(("text", el.text.strip(), None))
+    for child in el:
+        if isinstance(child.tag, str) and child.tag not in SKIP_TAGS:
+            _walk(child, out)
+        if child.tail and child.tail.strip():
+            out.append(("text", child.tail.strip(), None))
+
+
+def _cells(tr) -> list:
+    return [clean(node_text(c)) for c in tr if isinstance(c.tag, str) and c.tag in ("td", "th")]
+
+
+def parse_table(table) -> dict:
+    """
+    首行含 th 或表格多于一行时把首行当表头；列数不一致时多出的列命名为 列N
+    """
+    # 嵌套表格的行归内层表格
+    rows = [r for r in table.iter("tr") if next(r.iterancestors("table"), None) is table]
+    rows = [(r, c) for r, c in ((r, _cells(r)) for r in rows) if any(c)]
+    if not rows:
+        return {"header": [], "rows": []}
+    first_has_th = any(isinstance(c.tag, str) and c.tag == "th" for c in rows[0][0])
+    cells = [c for _, c in rows]
+    if first_has_th or len(cells) > 1:
+        header, body = cells[0], cells[1:]
+    else:
+        header, body = [], cells
+    parsed = []
+    for row in body:
+        keys = header + [f"列{j + 1}" for j in range(len(header), len(row))]
+        parsed.append({keys[j]: v for j, v in enumerate(row)})
+    return {"header": header, "rows": parsed}
+
+
+def extract_sections(node) -> dict:
+    """node 为正文节点（lxml 元素）"""
+    blocks = []
+    _walk(node, blocks)
+
+    title = ""
+    order, texts, tables = [], {}, []
+    current = PREAMBLE
+
+    def add(name, text):
+        if name not in texts:
+            order.append(name)
+            texts[name] = []
+        texts[name].append(text)
+
+    for kind, value, tag in blocks:
+        if kind == "table":
+            table = parse_table(value)
+            if table["rows"] or table["header"]:
+                tables.append({"section": current, **table})
+            add(current, clean(node_text(value)))
+            continue
+        if not title and tag in HEADING_TAGS:
+            title = value
+            continue
+        name = _heading_name(value, tag)
+        if name:
+            current = name
+            continue
+        m = _INLINE_HEADING_RE.match(value)
+        if m:
+            current = m.group(1)
+            value = value[m.end():]
+            if not value:
+                continue
+        add(current, value)
+
+    sections = [{"name": name, "text": clean("\n".join(t for t in texts[name] if t))} for name in order]
+    return {"title": title, "sections": [s for s in sections if s["text"]], "tables": tables}
+
+
+def section_text(structure: dict, names) -> str:
+    """按给定顺序拼出指定章节的正文，缺失的章节跳过"""
+    by_name = {s["name"]: s["text"] for s in structure.get("sections", [])}
+    return "\n\n".join(f"{name}\n{by_name[name]}" for name in names if by_name.get(name))
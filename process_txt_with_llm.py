@@ -5,9 +5,21 @@
 
 import os
 import time
+import asyncio
 import logging
-from openai import OpenAI
+import argparse
+from openai import OpenAI, AsyncOpenAI
 from dotenv import load_dotenv
+from structuring.response_cache import ResponseCache
+from structuring.resume import StructuredManifest, text_sha256
+from structuring.chunking import split_sections, parse_partial, merge_results
+from structuring.pre_extract import pre_extract, prune_sections, resolved_fields
+from structuring.batching import (BATCH_INSTRUCTION, MAX_BATCH_TOKENS, BatchBuffer, check_batch_options,
+                                  format_documents, split_batch_response)
+from structuring.streaming import IncrementalJSONValidator, StreamAbort, first_json_value
+from structuring.model_router import ModelRouter, retry_after_seconds
+from structuring.schema import (validate, repair_units, get_path, set_path, relevant_text,
+                                repair_prompt, syntax_repair_prompt)
 
 # 加载环境变量
 load_dotenv()
@@ -22,8 +34,13 @@ logger = logging.getLogger(__name__)
 class SimpleLLMClient:
     """LLM客户端"""
     
-    def __init__(self):
-        """初始化LLM客户端"""
+    def __init__(self, chunk_chars=0, use_rules=False, stream=False, repair=False):
+        """
+        初始化LLM客户端；chunk_chars > 0 时长文档按章节切成不超过该长度的块分别处理，
+        use_rules=True 时先用正则抽取格式固定的字段，LLM只负责其余字段，
+        stream=True 时流式接收输出并逐段校验JSON，结构一出错就中止重试，
+        repair=True 时按Schema校验结果，只把不合格的片段和相关原文发回模型修复
+        """
         # 从环境变量获取API密钥
         self.api_key = os.getenv('OPENROUTER_API_KEY')
         
@@ -40,9 +57,20 @@ class SimpleLLMClient:
             "z-ai/glm-4.5-air:free"  
         ]
         self.model_name = self.available_models[0]  
-        self.current_model_index = 0  
+        # 按滚动延迟和错误率选择模型，限流或连续失败的模型熔断后定期探测恢复
+        self.router = ModelRouter(self.available_models)
         self.min_request_interval = 2.0  
         self.last_request_time = 0
+        self.temperature = 0.1
+        self.max_tokens = 3000
+        self.chunk_chars = chunk_chars
+        self.use_rules = use_rules
+        self.stream = stream
+        self.repair = repair
+        self.repair_max_tokens = 1500
+        
+        # 响应缓存，LLM_CACHE_PATH 设为空字符串则禁用
+        self.cache = ResponseCache.from_env("cache/llm_cache.sqlite")
         
         # 创建OpenAI客户端
         self.client = OpenAI(
@@ -77,77 +105,157 @@ class SimpleLLMClient:
         self.last_request_time = time.time()
     
     def process_text(self, text, filename):
-        """调用LLM处理文本，包含速率限制处理和模型切换"""
-        # 生成提示词
-        prompt = self._generate_prompt(text, filename)
-        
-        max_retries = 3
-        self.current_retry = 0  # 重置当前重试计数
-        
+        """调用LLM处理文本，包含速率限制处理和模型切换；分块模式下逐块处理后合并"""
         # 检查API密钥是否有效
         if not self.api_key or "your_actual_openrouter_api_key_here" in self.api_key:
             logger.error(f"跳过文件{filename}：API密钥未设置或无效")
             return "API密钥未设置或无效，请在代码中设置有效的OpenRouter API密钥"
         
+        known = pre_extract(text) if self.use_rules else {}
+        prompts = self._prompts(text, filename, known)
+        responses = [self._complete(self._messages(prompt), filename) for prompt in prompts]
+        for k in self._invalid_chunks(responses, filename):
+            responses[k] = self._complete(self._messages(prompts[k]), filename)
+        return self._finalize(self._merge_responses(responses, filename, known), text, filename)
+    
+    def _finalize(self, response, text, filename):
+        """单篇和合并请求共用的收尾：校验JSON，repair=True 时定向修复未通过Schema校验的字段"""
+        response = self._validate_response(response)
+        if not self.repair:
+            return response
+        
+        data = parse_partial(response)
+        if data is None:
+            data = parse_partial(self._try_complete(syntax_repair_prompt(response), f"{filename}（修复JSON语法）"))
+        if data is None:
+            logger.warning(f"{filename}输出无法修复为JSON，原样保存")
+            return response
+        requests = self._repair_requests(data, text, filename)
+        fixes = [self._try_complete(prompt, f"{filename}（修复{unit[-1]}）", self.repair_max_tokens)
+                 for unit, prompt in requests]
+        return self._apply_repairs(data, requests, fixes, filename)
+    
+    def _try_complete(self, prompt, label, max_tokens=None):
+        """修复请求失败时返回None，保留原结果"""
+        try:
+            return self._complete(self._messages(prompt), label, max_tokens)
+        except Exception as e:
+            logger.error(f"{label}失败: {str(e)}")
+            return None
+    
+    def _repair_requests(self, data, text, filename):
+        """按Schema校验，返回 [(片段路径, 修复提示词)]"""
+        units = repair_units(validate(data))
+        if units:
+            logger.warning(f"{filename}有{len(units)}个片段未通过Schema校验: "
+                           + "；".join(m for messages in units.values() for m in messages[:3]))
+        return [(unit, repair_prompt(unit, get_path(data, unit, ""), messages, relevant_text(text, unit)))
+                for unit, messages in units.items()]
+    
+    def _apply_repairs(self, data, requests, fixes, filename):
+        """把修复后的片段写回，修复后仍不合格的片段保持原样"""
+        import json
+        for (unit, _), fix in zip(requests, fixes):
+            fixed = parse_partial(fix)
+            if not fixed or unit[-1] not in fixed:
+                continue
+            candidate = json.loads(json.dumps(data))
+            set_path(candidate, unit, fixed[unit[-1]])
+            if not any(path[:len(unit)] == unit for path, _ in validate(candidate)):
+                data = candidate
+                logger.info(f"{filename}已修复{'.'.join(unit)}")
+        remaining = validate(data)
+        if remaining:
+            logger.warning(f"{filename}仍有{len(remaining)}处未通过Schema校验")
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    
+    def process_batch(self, docs):
+        """
+        多篇短文书合并为一次请求，docs为[(文件名, 正文)]；
+        返回{文件名: 结构化结果}，解析失败或缺失的文件不在其中，由调用方退回单篇处理
+        """
+        names = ", ".join(name for name, _ in docs)
+        try:
+            response = self._complete(self._messages(self._batch_prompt(docs)), names,
+                                      self._batch_max_tokens(docs), batch=True)
+        except Exception as e:
+            logger.error(f"批量请求失败（{names}）: {str(e)}")
+            return {}
+        texts = dict(docs)
+        return {name: self._finalize(result, texts[name], name)
+                for name, result in self._split_batch(response, docs).items()}
+    
+    def _batch_prompt(self, docs):
+        # 批次大小已由BatchBuffer按token预算控制，不再按单篇上限截断，否则靠后的文书会被静默截掉
+        return (self._generate_prompt(format_documents(docs), "batch", truncate=False)
+                + BATCH_INSTRUCTION.format(count=len(docs)))
+    
+    def _batch_max_tokens(self, docs):
+        """输出长度随篇数增长，上限8000"""
+        return min(self.max_tokens * len(docs), 8000)
+    
+    def _split_batch(self, response, docs):
+        import json
+        results = split_batch_response(response, [name for name, _ in docs])
+        if len(results) < len(docs):
+            logger.warning(f"批量响应中{len(docs) - len(results)}/{len(docs)}篇无法解析，将逐篇重新处理")
+        texts = dict(docs)
+        output = {}
+        for name, result in results.items():
+            if self.use_rules:
+                result = merge_results([pre_extract(texts[name]), result])
+            output[name] = json.dumps(result, ensure_ascii=False, indent=2)
+        return output
+    
+    def _complete(self, messages, filename, max_tokens=None, batch=False):
+        """
+        单次对话请求，先查缓存，失败时重试并在速率限制时切换模型；
+        batch=True 为合并请求，输出是JSON数组，流式输出被截断时返回已收到的部分，由拆分时保留已闭合的文档
+        """
+        max_tokens = max_tokens or self.max_tokens
+        cached = self._cached_response(messages, max_tokens)
+        if cached is not None:
+            logger.info(f"{filename}命中LLM缓存")
+            return cached
+        
+        max_retries = 3
+        self.current_retry = 0  # 重置当前重试计数
+        
         for attempt in range(max_retries):
+            model = self.model_name = self.router.choose()
             try:
                 self._rate_limit_delay(backoff_factor=2)  # 使用指数退避
+                started = time.time()
                 
-                completion = self.client.chat.completions.create(
-                    extra_headers=self.extra_headers,
-                    model=self.model_name,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "你是一名擅长信息抽取与整理的金融监管文书分析专家。请阅读以下TXT文件，并将其结构化输出为统一的json格式。"
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.1,
-                    max_tokens=3000,
-                    timeout=60
-                )
-                
-                # 获取LLM响应
-                response = completion.choices[0].message.content
-                
-                # 验证响应是否为JSON
-                try:
-                    import json
-                    if '```json' in response:
-                        json_start = response.find('```json') + 7
-                        json_end = response.rfind('```')
-                        if json_end > json_start:
-                            response = response[json_start:json_end]
+                if self.stream:
+                    response = self._stream_completion(messages, filename, max_tokens, model, batch)
+                else:
+                    completion = self.client.chat.completions.create(
+                        extra_headers=self.extra_headers,
+                        model=model,
+                        messages=messages,
+                        temperature=self.temperature,
+                        max_tokens=max_tokens,
+                        timeout=60
+                    )
                     
-                    # 尝试解析JSON
-                    json.loads(response)
-                    logger.info("LLM输出是有效的JSON格式")
-                except json.JSONDecodeError:
-                    logger.warning("LLM输出不是有效的JSON格式，但仍将保存")
-                except ImportError:
-                    logger.warning("无法验证JSON格式，未导入json模块")
+                    # 获取LLM响应
+                    response = self._reply_content(completion)
+                self.router.record_success(model, time.time() - started)
+                self._store_response(messages, response, max_tokens, model)
                 
                 return response
                 
             except Exception as e:
                 error_str = str(e)
-                logger.error(f"第{attempt+1}次调用LLM失败: {error_str}")
+                logger.error(f"第{attempt+1}次调用LLM失败（{model}）: {error_str}")
                 
-                if "429" in error_str or "rate-limited" in error_str.lower():
-                    logger.warning(f"遇到速率限制，尝试切换模型或增加延迟")
-                    
-                    if hasattr(self, 'available_models') and hasattr(self, 'current_model_index') and self.current_model_index < len(self.available_models) - 1:
-                        self.current_model_index += 1
-                        self.model_name = self.available_models[self.current_model_index]
-                        logger.info(f"已切换到备用模型: {self.model_name}")
+                rate_limited = self._record_failure(model, e)
+                if rate_limited:
+                    logger.warning(f"遇到速率限制，模型{model}已熔断，改用其他模型或增加延迟")
                 
                 if attempt < max_retries - 1:
-                    # 指数退避
-                    retry_delay = 2 ** (attempt + 1)
+                    retry_delay = self._retry_delay(e, rate_limited, attempt)
                     logger.info(f"{retry_delay}秒后重试...")
                     time.sleep(retry_delay)
                     self.current_retry += 1
@@ -155,8 +263,183 @@ class SimpleLLMClient:
                     logger.error(f"处理文件{filename}失败: {error_str}")
                     raise
     
-    def _generate_prompt(self, text, filename):
-        """生成提示词模板"""
+    @staticmethod
+    def _reply_content(completion):
+        """取出回复内容；没有choices或内容为空时抛出异常，按失败计入路由统计并重试"""
+        choices = getattr(completion, "choices", None)
+        content = choices[0].message.content if choices else None
+        if not content:
+            raise ValueError("LLM返回了空内容")
+        return content
+    
+    def _record_failure(self, model, error):
+        """把失败计入路由统计，返回是否为限流"""
+        error_str = str(error)
+        rate_limited = "429" in error_str or "rate-limited" in error_str.lower()
+        self.router.record_failure(model, rate_limited, retry_after_seconds(error) if rate_limited else None)
+        return rate_limited
+    
+    def _retry_delay(self, error, rate_limited, attempt):
+        """
+        指数退避；输出结构错误与服务端无关，限流时还有其他健康模型可用，这两种情况立即重试
+        """
+        if isinstance(error, StreamAbort) or (rate_limited and self.router.healthy_count()):
+            return 0
+        return 2 ** (attempt + 1)
+    
+    def _stream_completion(self, messages, filename, max_tokens, model, batch=False):
+        """流式请求：逐段校验JSON，结构出错时抛出StreamAbort，顶层JSON闭合后不再读取剩余输出"""
+        started = time.time()
+        stream = self.client.chat.completions.create(
+            extra_headers=self.extra_headers,
+            model=model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=max_tokens,
+            timeout=60,
+            stream=True
+        )
+        validator = IncrementalJSONValidator(openers="[" if batch else "{")
+        try:
+            for chunk in stream:
+                if validator.feed(self._chunk_content(chunk, validator, filename, started)):
+                    break
+        except StreamAbort as e:
+            logger.warning(f"{filename}流式输出{time.time() - started:.1f}秒后中止: {e}")
+            raise
+        finally:
+            stream.close()
+        return self._stream_result(validator, filename, started, batch)
+    
+    def _chunk_content(self, chunk, validator, filename, started):
+        if not chunk.choices:
+            return ""
+        content = chunk.choices[0].delta.content or ""
+        if content and not validator.length:
+            logger.info(f"{filename}首个token用时{time.time() - started:.1f}秒")
+        return content
+    
+    def _stream_result(self, validator, filename, started, batch=False):
+        import json
+        if not validator.done and batch and validator.start is not None:
+            logger.warning(f"{filename}合并请求的输出在数组闭合前结束，只保留已完整输出的文档")
+            return validator.text[validator.start:]
+        if not validator.done:
+            raise StreamAbort(f"输出在JSON闭合前结束（已收到{validator.length}个字符，可能超出max_tokens）")
+        try:
+            # 自动机只校验结构，最终结果仍需能被完整解析才算成功
+            json.loads(validator.json_text)
+        except json.JSONDecodeError as e:
+            raise StreamAbort(f"输出的JSON无法解析: {e}")
+        logger.info(f"{filename}流式输出完成，用时{time.time() - started:.1f}秒")
+        return validator.json_text
+    
+    def _prompts(self, text, filename, known=None):
+        """
+        未开启分块或文档不超长时只有一个提示词；known为规则已抽取的字段，
+        只与这些字段相关的章节不再发送，并在提示词中说明这些字段无需抽取
+        """
+        resolved = resolved_fields(known) if known else []
+        if resolved:
+            text = prune_sections(text, known)
+        if not self.chunk_chars:
+            return [self._generate_prompt(text, filename, resolved=resolved)]
+        chunks = split_sections(text, self.chunk_chars)
+        if len(chunks) > 1:
+            logger.info(f"{filename}共{len(text)}字符，按章节分为{len(chunks)}块")
+        return [self._generate_prompt(chunk, filename, (k, len(chunks)) if len(chunks) > 1 else None, resolved)
+                for k, chunk in enumerate(chunks, 1)]
+    
+    def _invalid_chunks(self, responses, filename):
+        """分块处理时输出不是有效JSON的块的序号，调用方对这些块重新请求一次"""
+        if len(responses) < 2:
+            return []
+        invalid = [k for k, r in enumerate(responses) if parse_partial(r) is None]
+        if invalid:
+            logger.warning(f"{filename}第{'、'.join(str(k + 1) for k in invalid)}/{len(responses)}块输出"
+                           f"不是有效的JSON，重新请求")
+        return invalid
+    
+    def _merge_responses(self, responses, filename, known=None):
+        """
+        单块且没有规则字段时直接返回；否则解析各块JSON后与规则字段合并（规则字段优先）。
+        多块中任一块（重试后）仍无法解析时抛出异常，整篇记为失败，避免缺块的结果被当作成功保存
+        """
+        if len(responses) == 1 and not known:
+            return responses[0]
+        parts = [parse_partial(r) for r in responses]
+        valid = [p for p in parts if p is not None]
+        if len(responses) == 1 and not valid:
+            return responses[0]
+        if len(valid) < len(parts):
+            raise ValueError(f"第{'、'.join(str(k + 1) for k, p in enumerate(parts) if p is None)}/{len(parts)}块"
+                             f"的LLM输出重试后仍不是有效的JSON")
+        import json
+        return json.dumps(merge_results(([known] if known else []) + valid), ensure_ascii=False, indent=2)
+    
+    def _messages(self, prompt):
+        """构造对话消息"""
+        return [
+            {
+                "role": "system",
+                "content": "你是一名擅长信息抽取与整理的金融监管文书分析专家。请阅读以下TXT文件，并将其结构化输出为统一的json格式。"
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
+    def _cached_response(self, messages, max_tokens=None):
+        """按模型列表顺序查询缓存（路由可能把同一提示词发给任一模型），未启用缓存或未命中时返回None"""
+        if self.cache is None:
+            return None
+        # 旧版本可能缓存过无效输出，命中了也不用，交给重新请求覆盖
+        return self.cache.get_any(self.available_models, messages, self.temperature,
+                                  max_tokens or self.max_tokens,
+                                  accept=lambda cached: first_json_value(cached) is not None)
+    
+    def _store_response(self, messages, response, max_tokens=None, model=None):
+        """只缓存包含完整JSON的输出，截断或格式错误的输出下次（如--resume重跑）仍会重新请求"""
+        if self.cache is not None and first_json_value(response) is not None:
+            self.cache.put(model or self.model_name, messages, self.temperature, max_tokens or self.max_tokens,
+                           response)
+    
+    def close(self):
+        """关闭缓存并输出命中率和各模型的路由统计"""
+        logger.info(f"模型路由统计: {self.router.summary()}")
+        if self.cache is not None:
+            self.cache.close()
+    
+    def _validate_response(self, response):
+        """取出输出中第一个完整的JSON值并验证，失败时去掉```json代码块标记后验证，无效时仍原样返回"""
+        import json
+        extracted = first_json_value(response)
+        if extracted is not None:
+            logger.info("LLM输出是有效的JSON格式")
+            return extracted
+        try:
+            if '```json' in response:
+                json_start = response.find('```json') + 7
+                json_end = response.rfind('```')
+                if json_end > json_start:
+                    response = response[json_start:json_end]
+            
+            # 尝试解析JSON
+            json.loads(response)
+            logger.info("LLM输出是有效的JSON格式")
+        except json.JSONDecodeError:
+            logger.warning("LLM输出不是有效的JSON格式，但仍将保存")
+        except ImportError:
+            logger.warning("无法验证JSON格式，未导入json模块")
+        
+        return response
+    
+    def _generate_prompt(self, text, filename, part=None, resolved=None, truncate=True):
+        """
+        生成提示词模板；part=(k, n) 表示只处理整篇文档的第k/n块，resolved为已由规则抽取、无需再抽取的字段，
+        truncate=False 时不截断正文（合并请求的长度由调用方控制）
+        """
         prompt_template = '''
 【任务要求】
 1. 从文本中提取以下字段（如缺失则填"无"）：
@@ -223,56 +506,489 @@ class SimpleLLMClient:
 请处理以下文本内容：
 {text_content}
 '''
-        return prompt_template.format(text_content=text[:10000])  # 限制输入长度
+        if resolved:
+            prompt_template = self._drop_fields(prompt_template, resolved)
+        if part:
+            prompt_template += f"\n（以上内容是整篇文书的第{part[0]}/{part[1]}部分，只提取本部分出现的信息，未出现的字段填\"无\"或空列表）\n"
+        if truncate:
+            text = text[:self.chunk_chars or 10000]  # 限制输入长度
+        return prompt_template.format(text_content=text)
 
-def process_files_in_directory(directory, output_dir):
-    """遍历目录处理所有txt文件"""
-    # 输出目录存在
-    os.makedirs(output_dir, exist_ok=True)
+    @staticmethod
+    def _drop_fields(prompt_template, fields):
+        """从任务要求和JSON结构中删去已由规则确定的字段，LLM既不抽取也不输出这些字段"""
+        def resolved_line(line):
+            stripped = line.strip()
+            return any(stripped == f"- {name}" or stripped.startswith(f"- {name}（")
+                       or stripped.startswith(f'"{name}":') for name in fields)
+        return "\n".join(line for line in prompt_template.split("\n") if not resolved_line(line))
+
+class AsyncRequestLimiter:
+    """全局每分钟请求数限制：按固定间隔发放请求时间片，并发协程依次排队"""
     
-    # 初始化LLM客户端
-    llm_client = SimpleLLMClient()
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute if requests_per_minute > 0 else 0.0
+        self.next_slot = 0.0
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self.lock:
+            now = time.monotonic()
+            wait = max(0.0, self.next_slot - now)
+            self.next_slot = max(now, self.next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    async def pause(self, seconds):
+        """遇到429时推迟所有协程的下一个时间片"""
+        async with self.lock:
+            self.next_slot = max(self.next_slot, time.monotonic() + seconds)
+
+class AsyncLLMClient(SimpleLLMClient):
+    """异步LLM客户端，提示词、模型列表和响应校验与SimpleLLMClient共用"""
+    
+    def __init__(self, requests_per_minute=60, max_retries=3, chunk_chars=0, use_rules=False, stream=False,
+                 repair=False, max_in_flight=8):
+        """max_in_flight为同时在途的请求数上限，分块、修复等同一文件内并发的请求也计入"""
+        super().__init__(chunk_chars, use_rules, stream, repair)
+        self.async_client = AsyncOpenAI(
+            base_url=self.base_url,
+            api_key=self.api_key
+        )
+        self.limiter = AsyncRequestLimiter(requests_per_minute)
+        self.in_flight = asyncio.Semaphore(max(1, max_in_flight))
+        self.max_retries = max_retries
+    
+    async def process_text_async(self, text, filename):
+        """
+        调用LLM处理文本；每个文件独立重试，速率限制时全局暂停并切换模型。
+        分块模式下各块并发请求，耗时取决于最慢的一块而不是文档总长度
+        """
+        if not self.api_key or "your_actual_openrouter_api_key_here" in self.api_key:
+            logger.error(f"跳过文件{filename}：API密钥未设置或无效")
+            return "API密钥未设置或无效，请在代码中设置有效的OpenRouter API密钥"
+        
+        known = pre_extract(text) if self.use_rules else {}
+        prompts = self._prompts(text, filename, known)
+        responses = list(await asyncio.gather(*(self._complete_async(self._messages(prompt), filename)
+                                                for prompt in prompts)))
+        invalid = self._invalid_chunks(responses, filename)
+        retried = await asyncio.gather(*(self._complete_async(self._messages(prompts[k]), filename)
+                                         for k in invalid))
+        for k, r in zip(invalid, retried):
+            responses[k] = r
+        return await self._finalize_async(self._merge_responses(responses, filename, known), text, filename)
+    
+    async def _finalize_async(self, response, text, filename):
+        response = self._validate_response(response)
+        if not self.repair:
+            return response
+        
+        # 与process_text相同，各片段的修复请求并发发出
+        data = parse_partial(response)
+        if data is None:
+            data = parse_partial(await self._try_complete_async(syntax_repair_prompt(response),
+                                                                f"{filename}（修复JSON语法）"))
+        if data is None:
+            logger.warning(f"{filename}输出无法修复为JSON，原样保存")
+            return response
+        requests = self._repair_requests(data, text, filename)
+        fixes = await asyncio.gather(*(self._try_complete_async(prompt, f"{filename}（修复{unit[-1]}）",
+                                                                self.repair_max_tokens)
+                                       for unit, prompt in requests))
+        return self._apply_repairs(data, requests, list(fixes), filename)
     
+    async def _try_complete_async(self, prompt, label, max_tokens=None):
+        try:
+            return await self._complete_async(self._messages(prompt), label, max_tokens)
+        except Exception as e:
+            logger.error(f"{label}失败: {str(e)}")
+            return None
+    
+    async def process_batch_async(self, docs):
+        """process_batch的异步版本"""
+        names = ", ".join(name for name, _ in docs)
+        try:
+            response = await self._complete_async(self._messages(self._batch_prompt(docs)), names,
+                                                  self._batch_max_tokens(docs), batch=True)
+        except Exception as e:
+            logger.error(f"批量请求失败（{names}）: {str(e)}")
+            return {}
+        results = self._split_batch(response, docs)
+        texts = dict(docs)
+        finalized = await asyncio.gather(*(self._finalize_async(result, texts[name], name)
+                                           for name, result in results.items()))
+        return dict(zip(results, finalized))
+    
+    async def _complete_async(self, messages, filename, max_tokens=None, batch=False):
+        max_tokens = max_tokens or self.max_tokens
+        cached = self._cached_response(messages, max_tokens)
+        if cached is not None:
+            logger.info(f"{filename}命中LLM缓存")
+            return cached
+        
+        for attempt in range(self.max_retries):
+            try:
+                async with self.in_flight:
+                    await self.limiter.acquire()
+                    # 协程共享客户端，本次请求使用的模型保存在局部变量中
+                    model = self.model_name = self.router.choose()
+                    started = time.time()
+                    if self.stream:
+                        response = await self._stream_completion_async(messages, filename, max_tokens, model,
+                                                                       batch)
+                    else:
+                        completion = await self.async_client.chat.completions.create(
+                            extra_headers=self.extra_headers,
+                            model=model,
+                            messages=messages,
+                            temperature=self.temperature,
+                            max_tokens=max_tokens,
+                            timeout=60
+                        )
+                        response = self._reply_content(completion)
+                self.router.record_success(model, time.time() - started)
+                self._store_response(messages, response, max_tokens, model)
+                return response
+            except Exception as e:
+                error_str = str(e)
+                logger.error(f"{filename}第{attempt+1}次调用LLM失败（{model}）: {error_str}")
+                rate_limited = self._record_failure(model, e)
+                retry_delay = self._retry_delay(e, rate_limited, attempt)
+                if rate_limited and retry_delay:
+                    logger.warning("遇到速率限制且没有其他健康模型，暂停全部请求")
+                    await self.limiter.pause(retry_delay)
+                if attempt == self.max_retries - 1:
+                    raise
+                logger.info(f"{filename}将在{retry_delay}秒后重试...")
+                await asyncio.sleep(retry_delay)
+
+    async def _stream_completion_async(self, messages, filename, max_tokens, model, batch=False):
+        """_stream_completion的异步版本"""
+        started = time.time()
+        stream = await self.async_client.chat.completions.create(
+            extra_headers=self.extra_headers,
+            model=model,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=max_tokens,
+            timeout=60,
+            stream=True
+        )
+        validator = IncrementalJSONValidator(openers="[" if batch else "{")
+        try:
+            async for chunk in stream:
+                if validator.feed(self._chunk_content(chunk, validator, filename, started)):
+                    break
+        except StreamAbort as e:
+            logger.warning(f"{filename}流式输出{time.time() - started:.1f}秒后中止: {e}")
+            raise
+        finally:
+            await stream.close()
+        return self._stream_result(validator, filename, started, batch)
+
+def list_input_documents(directory):
+    """
+    返回 (文档总数, 迭代器)，迭代器 yield (文件名, 读取正文的函数)，读取函数的 mtime 属性为源文件修改时间
+    （语料分片中为抓取时间），续跑时据此判断旧版本输出是否仍对应当前内容；
+    目录是 sp.py --output jsonl 生成的语料分片时直接流式读取，不再逐个打开小文件
+    """
+    from crawler.corpus import CorpusReader, is_corpus_dir
+    if is_corpus_dir(directory):
+        reader = CorpusReader(directory)
+
+        def corpus_reader(doc):
+            def read():
+                return doc["text"]
+            try:
+                read.mtime = time.mktime(time.strptime(doc.get("fetched_at") or "", "%Y-%m-%d %H:%M:%S"))
+            except ValueError:
+                read.mtime = None
+            return read
+
+        docs = ((f"{doc['id']:03d}.txt", corpus_reader(doc)) for doc in reader)
+        return len(reader), docs
+
     # 获取所有txt文件
     txt_files = [f for f in os.listdir(directory) if f.endswith('.txt')]
     txt_files.sort()
+
+    def reader_for(path):
+        def read():
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        read.mtime = os.path.getmtime(path)
+        return read
+
+    docs = ((f, reader_for(os.path.join(directory, f))) for f in txt_files)
+    return len(txt_files), docs
+
+def load_duplicates(directory, dedup_index=None):
+    """读取 python -m crawler.dedup 生成的近重复索引，返回 {重复文档: 代表文档}；索引不存在时为空"""
+    from crawler.dedup import INDEX_NAME, load_duplicate_map
+    path = dedup_index or os.path.join(directory, INDEX_NAME)
+    if not os.path.exists(path):
+        return {}
+    duplicates = load_duplicate_map(path)
+    logger.info(f"近重复索引{path}：{len(duplicates)}个文档将复用代表文档的结果")
+    return duplicates
+
+# 近重复文档各自不同、复用代表文档结果时必须按本文重新填写的字段
+DUPLICATE_OWN_FIELDS = ["文号", "公告类型", "监管机构", "发布日期"]
+
+def duplicate_result(representative_result, text, representative):
+    """
+    以代表文档的结果为底，用本文的规则抽取结果覆盖文号、公告类型、监管机构、发布日期和立案日期，
+    规则抽不到的字段填"无"而不是沿用代表文档的值，并标注结果来自哪个代表文档
+    """
+    import json
+    data = json.loads(json.dumps(representative_result))
+    known = pre_extract(text)
+    for field in DUPLICATE_OWN_FIELDS:
+        data[field] = known.get(field, "无")
+    if isinstance(data.get("案件信息"), dict):
+        data["案件信息"]["立案日期"] = known.get("案件信息", {}).get("立案日期", "无")
+    data["近重复代表"] = representative
+    return data
+
+def copy_duplicate_results(duplicates, output_dir, manifest, readers):
+    """
+    代表文档处理成功后，把结果复用给同簇的重复文档（各文档自己的字段按本文重新填写），
+    并记入清单；readers为{重复文档: 读取正文的函数}
+    """
+    import json
+    for filename, representative in duplicates.items():
+        read_text = readers.get(filename)
+        if read_text is None:
+            continue
+        source = os.path.join(output_dir, f"structured_{representative}")
+        if not os.path.exists(source):
+            logger.warning(f"代表文档{representative}没有结构化结果，{filename}未处理")
+            continue
+        sha256 = None
+        try:
+            text = read_text()
+            sha256 = text_sha256(text)
+            with open(source, 'r', encoding='utf-8') as f:
+                result = duplicate_result(json.load(f), text, representative)
+        except Exception as e:
+            save_error(output_dir, manifest, filename, sha256, f"无法复用代表文档{representative}的结果: {e}")
+            continue
+        save_result(output_dir, manifest, filename, sha256,
+                    json.dumps(result, ensure_ascii=False, indent=2), duplicate_of=representative)
+
+def save_result(output_dir, manifest, filename, sha256, structured_text, duplicate_of=None):
+    """写入structured_文件并记入清单"""
+    output_path = os.path.join(output_dir, f"structured_{filename}")
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(structured_text)
+    manifest.record(filename, sha256, True, duplicate_of=duplicate_of)
+    return output_path
+
+def save_error(output_dir, manifest, filename, sha256, error):
+    logger.error(f"处理文件{filename}失败: {str(error)}")
+    error_path = os.path.join(output_dir, f"error_{filename}")
+    with open(error_path, 'w', encoding='utf-8') as f:
+        f.write(f"处理失败: {str(error)}")
+    manifest.record(filename, sha256, False, str(error))
+
+def process_files_in_directory(directory, output_dir, dedup_index=None, resume=False, chunk_chars=0,
+                               use_rules=False, batch_tokens=0, batch_chars=1500, batch_docs=8, stream=False,
+                               repair=False):
+    """
+    遍历目录处理所有txt文件；近重复文档只处理代表文档，
+    resume=True 时跳过已有有效结果且内容未变的文件，
+    batch_tokens > 0 时不超过batch_chars字符的短文书按token预算合并请求，
+    stream=True 时流式接收并逐段校验输出，repair=True 时定向修复未通过Schema校验的字段
+    """
+    # 输出目录存在
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # 初始化LLM客户端
+    check_batch_options(batch_tokens, batch_chars)
+    llm_client = SimpleLLMClient(chunk_chars, use_rules, stream, repair)
+    manifest = StructuredManifest(output_dir)
+    batch = BatchBuffer(batch_tokens, batch_docs)
+    skipped = 0
     
-    total_files = len(txt_files)
+    total_files, documents = list_input_documents(directory)
     logger.info(f"找到{total_files}个txt文件")
+    duplicates = load_duplicates(directory, dedup_index)
+    duplicate_readers = {}
     
-    # 逐个处理文件
-    for idx, filename in enumerate(txt_files, 1):
-        file_path = os.path.join(directory, filename)
-        output_path = os.path.join(output_dir, f"structured_{filename}")
-        
-        logger.info(f"处理文件{idx}/{total_files}: {filename}")
-        
+    def process_one(filename, text, sha256):
         try:
-            # 读取文件内容
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
-            
             # 调用LLM处理文本
             structured_text = llm_client.process_text(text, filename)
             
             # 保存结构化结果
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(structured_text)
-            
+            output_path = save_result(output_dir, manifest, filename, sha256, structured_text)
             logger.info(f"成功保存结果: {output_path}")
-            
         except Exception as e:
-            logger.error(f"处理文件{filename}失败: {str(e)}")
-            error_path = os.path.join(output_dir, f"error_{filename}")
-            with open(error_path, 'w', encoding='utf-8') as f:
-                f.write(f"处理失败: {str(e)}")
+            save_error(output_dir, manifest, filename, sha256, e)
+    
+    def flush_batch():
+        items = batch.take()
+        if not items:
+            return
+        logger.info(f"批量处理{len(items)}篇短文书: {', '.join(name for name, _, _ in items)}")
+        results = llm_client.process_batch([(name, text) for name, text, _ in items])
+        for name, text, sha256 in items:
+            if name in results:
+                save_result(output_dir, manifest, name, sha256, results[name])
+            else:
+                process_one(name, text, sha256)
+    
+    # 逐个处理文件
+    for idx, (filename, read_text) in enumerate(documents, 1):
+        if filename in duplicates:
+            logger.info(f"跳过文件{idx}/{total_files}: {filename}（与{duplicates[filename]}近重复）")
+            duplicate_readers[filename] = read_text
+            continue
+        
+        sha256 = None
+        try:
+            # 读取文件内容
+            text = read_text()
+            sha256 = text_sha256(text)
+        except Exception as e:
+            save_error(output_dir, manifest, filename, sha256, e)
+            continue
+        if resume and manifest.is_current(filename, sha256, read_text.mtime):
+            skipped += 1
+            continue
+        
+        if batch_tokens and len(text) <= batch_chars:
+            if not batch.fits(text):
+                flush_batch()
+            batch.add((filename, text, sha256), text)
+            continue
+        
+        logger.info(f"处理文件{idx}/{total_files}: {filename}")
+        process_one(filename, text, sha256)
+    flush_batch()
+    
+    if resume:
+        logger.info(f"续跑：{skipped}个文件已有有效结果且内容未变，已跳过")
+    copy_duplicate_results(duplicates, output_dir, manifest, duplicate_readers)
+    manifest.close()
+    llm_client.close()
+
+async def process_files_async(directory, output_dir, concurrency=8, requests_per_minute=60,
+                              dedup_index=None, resume=False, chunk_chars=0, use_rules=False,
+                              batch_tokens=0, batch_chars=1500, batch_docs=8, stream=False, repair=False):
+    """
+    并发处理目录中的文件：concurrency个协程从同一文档迭代器取任务，
+    同时在途的LLM请求不超过concurrency，总请求速率不超过requests_per_minute；
+    合并请求时每个协程各自累积一批短文书
+    """
+    check_batch_options(batch_tokens, batch_chars)
+    os.makedirs(output_dir, exist_ok=True)
+    llm_client = AsyncLLMClient(requests_per_minute, chunk_chars=chunk_chars, use_rules=use_rules, stream=stream,
+                                repair=repair, max_in_flight=concurrency)
+    manifest = StructuredManifest(output_dir)
+    
+    total_files, documents = list_input_documents(directory)
+    logger.info(f"找到{total_files}个txt文件，并发数{concurrency}，每分钟最多{requests_per_minute}次请求")
+    duplicates = load_duplicates(directory, dedup_index)
+    duplicate_readers = {}
+    documents = enumerate(documents, 1)
+    counts = {"ok": 0, "failed": 0, "skipped": 0}
+    started = time.time()
+    
+    async def process_one(filename, text, sha256):
+        try:
+            structured_text = await llm_client.process_text_async(text, filename)
+            output_path = save_result(output_dir, manifest, filename, sha256, structured_text)
+            counts["ok"] += 1
+            logger.info(f"成功保存结果: {output_path}")
+        except Exception as e:
+            counts["failed"] += 1
+            save_error(output_dir, manifest, filename, sha256, e)
+    
+    async def flush_batch(batch):
+        items = batch.take()
+        if not items:
+            return
+        results = await llm_client.process_batch_async([(name, text) for name, text, _ in items])
+        for name, text, sha256 in items:
+            if name in results:
+                save_result(output_dir, manifest, name, sha256, results[name])
+                counts["ok"] += 1
+            else:
+                await process_one(name, text, sha256)
+    
+    async def worker():
+        batch = BatchBuffer(batch_tokens, batch_docs)
+        for idx, (filename, read_text) in documents:
+            if filename in duplicates:
+                duplicate_readers[filename] = read_text
+                continue
+            sha256 = None
+            try:
+                text = await asyncio.to_thread(read_text)
+                sha256 = text_sha256(text)
+            except Exception as e:
+                counts["failed"] += 1
+                save_error(output_dir, manifest, filename, sha256, e)
+                continue
+            if resume and manifest.is_current(filename, sha256, read_text.mtime):
+                counts["skipped"] += 1
+                continue
+            if batch_tokens and len(text) <= batch_chars:
+                if not batch.fits(text):
+                    await flush_batch(batch)
+                batch.add((filename, text, sha256), text)
+                continue
+            logger.info(f"[{idx}/{total_files}] 处理文件: {filename}")
+            await process_one(filename, text, sha256)
+        await flush_batch(batch)
+    
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    copy_duplicate_results(duplicates, output_dir, manifest, duplicate_readers)
+    manifest.close()
+    llm_client.close()
+    elapsed = time.time() - started
+    done = counts["ok"] + counts["failed"]
+    logger.info(f"成功{counts['ok']}个，失败{counts['failed']}个，跳过{counts['skipped']}个，"
+                f"耗时{elapsed:.1f}秒（{done / elapsed if elapsed > 0 else 0:.2f}个/秒）")
 
 def main():
     """主函数"""
-    input_dir = r"c:\Users\lenovo\Desktop\spider\out"
-    output_dir = r"c:\Users\lenovo\Desktop\spider\structured_output"
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input-dir", default=r"c:\Users\lenovo\Desktop\spider\out")
+    parser.add_argument("--output-dir", default=r"c:\Users\lenovo\Desktop\spider\structured_output")
+    parser.add_argument("--concurrency", type=int, default=0,
+                        help="并发请求数，0为逐个处理（原有同步模式）")
+    parser.add_argument("--rpm", type=int, default=60, help="并发模式下每分钟最多请求数")
+    parser.add_argument("--resume", action="store_true",
+                        help="只处理新增、内容变化或上次失败的文件")
+    parser.add_argument("--chunk-chars", type=int, default=0,
+                        help="长文档按章节分块处理的单块字符上限，0为截断到前10000字符（原有行为）")
+    parser.add_argument("--rules", action="store_true",
+                        help="先用正则抽取文号、监管机构、日期、罚没金额和法律依据，LLM只抽取其余字段")
+    parser.add_argument("--batch-tokens", type=int, default=0,
+                        help=f"短文书合并请求时每个请求的正文token预算（不超过{MAX_BATCH_TOKENS}），0为不合并")
+    parser.add_argument("--batch-chars", type=int, default=1500, help="不超过该字符数的文书才参与合并")
+    parser.add_argument("--batch-docs", type=int, default=8, help="每个合并请求最多包含的文书数")
+    parser.add_argument("--stream", action="store_true",
+                        help="流式接收输出并逐段校验JSON，结构出错时立即中止并重试，JSON闭合后不再等待剩余输出")
+    parser.add_argument("--repair", action="store_true",
+                        help="按Schema校验输出，只把不合格的字段和相关原文章节发回模型修复")
+    args = parser.parse_args()
+    try:
+        check_batch_options(args.batch_tokens, args.batch_chars)
+    except ValueError as e:
+        parser.error(str(e))
     
-    process_files_in_directory(input_dir, output_dir)
+    options = dict(resume=args.resume, chunk_chars=args.chunk_chars, use_rules=args.rules,
+                   batch_tokens=args.batch_tokens, batch_chars=args.batch_chars, batch_docs=args.batch_docs,
+                   stream=args.stream, repair=args.repair)
+    if args.concurrency > 0:
+        asyncio.run(process_files_async(args.input_dir, args.output_dir, args.concurrency, args.rpm,
+                                        **options))
+    else:
+        process_files_in_directory(args.input_dir, args.output_dir, **options)
     logger.info("所有文件处理完成")
 
 if __name__ == "__main__":
@@ -1,27 +1,68 @@
 # -*- coding: utf-8 -*-
 """
     python sp.py --headless
+    python sp.py --headless --workers 8
+    python sp.py --headless --backend auto
+    python sp.py --headless --refresh
+    python sp.py --headless --light
+    python sp.py --extract-only
+    python sp.py --headless --urls batch.jsonl --shard 0/4
+    python sp.py --headless --output jsonl --corpus-zstd
 """
 
-import os, re, time, argparse
-from bs4 import BeautifulSoup
+import os, time, json, argparse, hashlib
+from functools import partial
+from urllib.parse import urlsplit
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+from crawler.extract import CONTENT_SELECTORS, extract_text, extract_page
 
-def clean(s: str) -> str:
-    if not s:
-        return ""
-    s = re.sub(r"[ \t\xa0\u3000]+", " ", s)
-    s = re.sub(r"\s*\n\s*", "\n", s)
-    return s.strip()
+SECTION_KEYWORDS = ["案件解析", "违法事项", "处罚情况"]
+
+# 返回 [正文节点文本长度, iframe 数量]，用于判断页面是否已渲染稳定；
+# 没有匹配的正文选择器时（空页、错误页、类名不同的 iframe 文档）退回 body 的文本长度
+CONTENT_PROBE_JS = """
+var sels = arguments[0], len = -1;
+for (var i = 0; i < sels.length; i++) {
+    var n = document.querySelector(sels[i]);
+    if (n) { len = (n.innerText || '').length; break; }
+}
+if (len < 0) len = document.body ? (document.body.innerText || '').length : 0;
+return [len, document.getElementsByTagName('iframe').length];
+"""
+
+FRAME_KEYWORDS = ["案件解析", "违法事项", "处罚情况", "总结", "法规定据"]
+IFRAME_PATTERNS_PATH = "out/iframe_patterns.json"
+HTML_CACHE_DIR = "cache/html"
+URLS_PATH = "data/violation_urls.txt"
+
+FIND_IFRAME_SRC_JS = """
+var fs = document.getElementsByTagName('iframe');
+for (var i = 0; i < fs.length; i++) {
+    var s = fs[i].src || '';
+    if (/violation|easy-board|newviolation/i.test(s)) return s;
+}
+return null;
+"""
+
+# 轻量模式下屏蔽的资源：只保留文档和脚本
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.css",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*hm.baidu.com*", "*cnzz.com*", "*growingio.com*", "*sensorsdata*",
+]
 
 def ensure_out():
     os.makedirs("out", exist_ok=True)
 
-def make_driver(headless: bool):
-    """启动浏览器"""
+def make_driver(headless: bool, light: bool = False):
+    """启动浏览器；light=True 时屏蔽图片/媒体/字体/CSS/统计脚本并关闭不需要的缓存"""
     opts = Options()
     if headless:
         opts.add_argument("--headless=new")
@@ -35,19 +76,90 @@ def make_driver(headless: bool):
                       "AppleWebKit/537.36 (KHTML, like Gecko) "
                       "Chrome/122.0.0.0 Safari/537.36")
     opts.add_argument("--window-size=1366,900")
+    # 性能日志用于统计每页传输字节数
+    opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    if light:
+        opts.add_argument("--blink-settings=imagesEnabled=false")
+        opts.add_argument("--disable-extensions")
+        opts.add_argument("--disable-background-networking")
+        opts.add_argument("--disable-component-update")
+        opts.add_argument("--disable-sync")
+        opts.add_argument("--media-cache-size=1")
+        opts.add_argument("--aggressive-cache-discard")
+        opts.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.media_stream": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
     driver = webdriver.Chrome(options=opts)
     driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
         "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
     })
+    if light:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
     return driver
 
-def wait_ready(driver, timeout=45):
+def drain_network_log(driver) -> tuple[int, int | None]:
+    """读取并清空性能日志，返回 (期间网络传输的字节数, 文档响应的最大 HTTP 状态码)"""
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return 0, None
+    total, status = 0, None
+    for entry in entries:
+        msg = entry.get("message", "")
+        if "Network.loadingFinished" in msg:
+            try:
+                total += int(json.loads(msg)["message"]["params"].get("encodedDataLength", 0))
+            except (ValueError, KeyError):
+                continue
+        elif "Network.responseReceived" in msg and '"Document"' in msg:
+            try:
+                params = json.loads(msg)["message"]["params"]
+                if params.get("type") == "Document":
+                    status = max(status or 0, int(params["response"]["status"]))
+            except (ValueError, KeyError):
+                continue
+    return total, status
+
+def add_timing(timings, key: str, seconds: float):
+    if timings is not None:
+        timings[key] = timings.get(key, 0.0) + seconds
+
+def wait_content_stable(driver, timeout=10, interval=0.15, stable_rounds=3, empty_rounds=8):
+    """
+    轮询正文节点文本长度和 iframe 数量，连续 stable_rounds 次不变且已有内容即视为渲染完成；
+    页面一直为空（空页、错误页）时连续 empty_rounds 次不变也结束等待，由后续抽取判断是否有正文
+    """
+    state = {"last": None, "same": 0}
+
+    def stable(d):
+        probe = d.execute_script(CONTENT_PROBE_JS, CONTENT_SELECTORS)
+        if probe == state["last"]:
+            state["same"] += 1
+        else:
+            state["last"], state["same"] = probe, 0
+        if probe[0] > 0 or probe[1] > 0:
+            return state["same"] >= stable_rounds
+        return state["same"] >= empty_rounds
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=interval).until(stable)
+    except TimeoutException:
+        pass
+
+def wait_ready(driver, timeout=45, settle=0.0, timings=None):
+    """等待 readyState 和正文稳定；settle > 0 时再额外固定等待，并计入 timings["settle"]"""
     WebDriverWait(driver, timeout).until(
         lambda d: d.execute_script("return document.readyState") == "complete"
     )
-    time.sleep(1.2)
+    wait_content_stable(driver, timeout=min(timeout, 10))
+    if settle:
+        time.sleep(settle)
+        add_timing(timings, "settle", settle)
 
-def try_enter_violation_iframe_and_get_html(driver) -> str | None:
+def try_enter_violation_iframe_and_get_html(driver, settle=0.0, timings=None) -> str | None:
     """进入 iframe 并返回 iframe 的 HTML"""
     frames = driver.find_elements(By.TAG_NAME, "iframe")
     candidates = []
@@ -61,1325 +173,376 @@ def try_enter_violation_iframe_and_get_html(driver) -> str | None:
         try:
             driver.switch_to.default_content()
             driver.switch_to.frame(f)
-            wait_ready(driver, 20)
-            body_text = (driver.find_element(By.TAG_NAME, "body").text or "")[:2000]
-            if any(kw in body_text for kw in ["案件解析", "违法事项", "处罚情况", "总结", "法规定据"]):
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
-                time.sleep(0.6)
-                return driver.page_source
+            wait_ready(driver, 20, settle, timings)
+            html = read_violation_html(driver, timings)
+            if html:
+                return html
         except Exception:
             continue
     driver.switch_to.default_content()
     return None
 
-def grab_html(driver, url: str) -> str:
+def read_violation_html(driver, timings=None) -> str | None:
+    """当前文档含章节关键词时滚动到底并返回 HTML"""
+    body_text = (driver.find_element(By.TAG_NAME, "body").text or "")[:2000]
+    if not any(kw in body_text for kw in FRAME_KEYWORDS):
+        return None
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight)")
+    # 滚动可能触发懒加载，等正文长度再次稳定
+    wait_content_stable(driver, timeout=3)
+    return read_page_source(driver, timings)
+
+def read_page_source(driver, timings=None) -> str:
+    """page_source 需要把整个 DOM 序列化后传回，单独计时"""
+    t0 = time.perf_counter()
+    html = driver.page_source
+    add_timing(timings, "page_source", time.perf_counter() - t0)
+    return html
+
+def open_violation_frame(driver, src: str, settle=0.0, timings=None) -> str | None:
+    """把 iframe 地址当作顶层页面直接打开"""
+    try:
+        driver.get(src)
+        wait_ready(driver, 20, settle, timings)
+        return read_violation_html(driver, timings)
+    except Exception:
+        return None
+
+_iframe_patterns = {}
+
+def get_iframe_patterns(path: str):
+    """每个进程各持有一份模板缓存"""
+    if not path:
+        return None
+    if path not in _iframe_patterns:
+        from crawler.iframe_patterns import IframePatternCache
+        _iframe_patterns[path] = IframePatternCache(path)
+    return _iframe_patterns[path]
+
+def grab_html(driver, url: str, settle=0.0, timings=None, patterns=None, meta=None) -> str:
+    """
+    打开页面并取得违规详情 HTML；各阶段耗时（秒）写入 timings，
+    iframe 定位方式（pattern / src / probe / none）写入 meta["iframe_route"]
+    """
+    timings = {} if timings is None else timings
+    meta = {} if meta is None else meta
+    drain_network_log(driver)
+
+    # 已学到该域名的 iframe 模板：直接打开 iframe，不加载外层页面
+    src = patterns.resolve(url) if patterns is not None else None
+    if src:
+        t0 = time.perf_counter()
+        html = open_violation_frame(driver, src, settle, timings)
+        timings["direct"] = time.perf_counter() - t0
+        if html:
+            meta["iframe_route"] = "pattern"
+            return html
+        patterns.forget(url)
+
+    t0 = time.perf_counter()
     driver.get(url)
-    wait_ready(driver, 50)
-    iframe_html = try_enter_violation_iframe_and_get_html(driver)
-    return iframe_html or driver.page_source
+    t1 = time.perf_counter()
+    wait_ready(driver, 50, settle, timings)
+    t2 = time.perf_counter()
+    timings["navigate"] = t1 - t0
+    timings["ready"] = t2 - t1
 
-def extract_text(html: str) -> str:
-    soup = BeautifulSoup(html, "lxml")
-    for sel in [".law-content", ".ant-card-body", ".detail-content", "article", "#app"]:
-        node = soup.select_one(sel)
-        if node:
-            return clean(node.get_text(" ", strip=True))
-    return clean(soup.get_text(" ", strip=True))
+    html = None
+    src = driver.execute_script(FIND_IFRAME_SRC_JS)
+    if src:
+        html = open_violation_frame(driver, src, settle, timings)
+        if html:
+            meta["iframe_route"] = "src"
+            if patterns is not None:
+                patterns.learn(url, src)
+        else:
+            driver.get(url)
+            wait_ready(driver, 50, settle, timings)
+    t3 = time.perf_counter()
+    timings["iframe"] = t3 - t2
+    if html:
+        return html
 
-def main():
+    # 兜底：逐个 iframe 切换探测
+    html = try_enter_violation_iframe_and_get_html(driver, settle, timings)
+    timings["probe"] = time.perf_counter() - t3
+    meta["iframe_route"] = "probe" if html else "none"
+    return html or read_page_source(driver, timings)
+
+def has_sections(html: str) -> bool:
+    """正文中是否出现违规详情的章节关键词"""
+    text = extract_text(html)
+    return any(kw in text for kw in SECTION_KEYWORDS)
+
+def save_text(i: int, url: str, text: str, write_txt: bool = True,
+              structure: dict | None = None) -> dict:
+    """
+    write_txt=False 时只计算哈希，正文随记录交给主进程写入 JSONL 语料；
+    structure 为章节结构，写 txt 时同时写 out/NNN.json
+    """
+    filename = f"out/{i:03d}.txt"
+    data = text.encode("utf-8")
+    if write_txt:
+        with open(filename, "wb") as f:
+            f.write(data)
+        if structure is not None:
+            with open(f"out/{i:03d}.json", "w", encoding="utf-8") as f:
+                json.dump(structure, f, ensure_ascii=False)
+    return {"index": i, "url": url, "ok": True, "filename": filename if write_txt else None,
+            "chars": len(text), "bytes": len(data), "sha256": hashlib.sha256(data).hexdigest(),
+            "text": text, "structure": structure}
+
+def cache_html(html: str, cache_dir: str) -> str | None:
+    """原始 HTML 写入内容寻址缓存，返回其 sha256"""
+    if not cache_dir:
+        return None
+    from crawler.html_cache import HtmlCache
+    return HtmlCache(cache_dir).put(html)
+
+def store_page(i: int, url: str, html: str, cache_dir: str, timings: dict,
+               write_txt: bool = True) -> dict:
+    """抽取正文和章节结构、写 out/NNN.txt 并缓存原始 HTML，各步耗时写入 timings"""
+    text, structure = extract_page(html, timings)
+    t0 = time.perf_counter()
+    record = save_text(i, url, text, write_txt, structure)
+    t1 = time.perf_counter()
+    record["html_sha256"] = cache_html(html, cache_dir)
+    timings["save"] = t1 - t0
+    timings["cache"] = time.perf_counter() - t1
+    return record
+
+def crawl_one(driver, i: int, url: str, settle: float = 0.0,
+              patterns_path: str = IFRAME_PATTERNS_PATH,
+              cache_dir: str = HTML_CACHE_DIR, write_txt: bool = True) -> dict:
+    """抓取单个 URL 并写入 out/NNN.txt"""
+    timings, meta = {}, {}
+    t0 = time.perf_counter()
+    html = grab_html(driver, url, settle, timings, get_iframe_patterns(patterns_path), meta)
+    transferred, status = drain_network_log(driver)
+    record = store_page(i, url, html, cache_dir, timings, write_txt)
+    record["transferred"] = transferred
+    record["status"] = status
+    record["backend"] = "selenium"
+    record["iframe_route"] = meta.get("iframe_route")
+    record["elapsed"] = time.perf_counter() - t0
+    record["timings"] = timings
+    return record
+
+def crawl_http(tasks, concurrency: int, cache_dir: str = HTML_CACHE_DIR, limiter=None,
+               write_txt: bool = True):
+    """
+    纯 HTTP 抓取，返回 (成功记录列表, 需要回退到浏览器的任务列表)
+    """
+    from crawler.http_fetch import fetch_all
+    fetched = fetch_all([url for _, url in tasks], has_sections, concurrency=concurrency,
+                        limiter=limiter)
+    records, remaining = [], []
+    for i, url in tasks:
+        html, elapsed, status = fetched.get(url, (None, 0.0, None))
+        if html:
+            timings = {"fetch": elapsed}
+            t0 = time.perf_counter()
+            record = store_page(i, url, html, cache_dir, timings, write_txt)
+            record["backend"] = "http"
+            record["status"] = status
+            record["elapsed"] = elapsed + time.perf_counter() - t0
+            record["timings"] = timings
+            records.append(record)
+        else:
+            remaining.append((i, url))
+    return records, remaining
+
+def extract_cached(i: int, url: str, sha: str, cache_dir: str, write_txt: bool = True) -> dict:
+    """从 HTML 缓存重新抽取正文，不启动浏览器"""
+    from crawler.html_cache import HtmlCache
+    timings = {}
+    t0 = time.perf_counter()
+    try:
+        html = HtmlCache(cache_dir).get(sha)
+        timings["fetch"] = time.perf_counter() - t0
+        text, structure = extract_page(html, timings)
+        t1 = time.perf_counter()
+        record = save_text(i, url, text, write_txt, structure)
+        timings["save"] = time.perf_counter() - t1
+    except Exception as e:
+        record = {"index": i, "url": url, "ok": False, "error": str(e)}
+    record["html_sha256"] = sha
+    record["backend"] = "cache"
+    record["elapsed"] = time.perf_counter() - t0
+    record["timings"] = timings
+    return record
+
+def extract_from_cache(manifest, cache_dir: str, workers: int, finish, write_txt: bool = True):
+    """按清单中记录的 HTML 哈希，多进程并行重新抽取全部正文"""
+    from concurrent.futures import ProcessPoolExecutor
+    # 重抓失败的记录没有 HTML 哈希，仍按之前成功抓取时缓存的 HTML 抽取
+    jobs = sorted((manifest.entries[url]["index"], url, html_sha256)
+                  for url, html_sha256 in manifest.html_hashes.items())
+    print(f"离线抽取：缓存中共 {len(jobs)} 个页面，{workers or os.cpu_count()} 个进程")
+    with ProcessPoolExecutor(max_workers=workers or None) as ex:
+        for record in ex.map(extract_cached,
+                             [j[0] for j in jobs], [j[1] for j in jobs], [j[2] for j in jobs],
+                             [cache_dir] * len(jobs), [write_txt] * len(jobs), chunksize=16):
+            finish(record)
+
+def format_timings(timings: dict) -> str:
+    return " ".join(f"{k}={v:.2f}s" for k, v in timings.items())
+
+def report(record: dict, total: int):
+    if record["ok"]:
+        target = record.get("filename") or f"语料 #{record['index']}"
+        print(f"✔ [{record['index']}/{total}] 已保存：{target}（{record['chars']} 字符）"
+              + (f" 传输 {record['transferred'] / 1024:.0f} KB" if record.get("transferred") else "")
+              + (f" 速率 {record['rate']:.2f}/s" if record.get("rate") else "")
+              + (f" 内存 {record['rss_mb']:.0f} MB" if record.get("rss_mb") else "")
+              + (f" [{format_timings(record['timings'])}]" if record.get("timings") else ""))
+    else:
+        print(f"❌ [{record['index']}/{total}] 抓取失败：{record['url']} → {record['error']}")
+
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     parser.add_argument("--headless", action="store_true", help="无头模式运行 Chrome")
-    args = parser.parse_args()
+    parser.add_argument("--urls", default=URLS_PATH, help="URL 列表文件（txt 每行一个，或 JSONL）")
+    parser.add_argument("--shard", default=None,
+                        help="只抓取第 i 片（共 N 片，i 从 0 开始），格式 i/N，按 URL 稳定哈希划分")
+    parser.add_argument("--workers", type=int, default=1, help="并行浏览器进程数，1 为串行")
+    parser.add_argument("--rate", type=float, default=0.5, help="每个 host 的初始请求速率（次/秒）")
+    parser.add_argument("--max-rate", type=float, default=4.0, help="每个 host 的最大请求速率（次/秒）")
+    parser.add_argument("--recycle-every", type=int, default=200,
+                        help="每个浏览器处理多少页后重启，0 表示不按页数重启")
+    parser.add_argument("--max-rss-mb", type=float, default=1500,
+                        help="浏览器进程树内存超过该值（MB）时重启（需要 psutil），0 表示不限制")
+    parser.add_argument("--slow", type=float, default=20.0, help="单页耗时超过该值（秒）视为慢响应并降速")
+    parser.add_argument("--light", action="store_true",
+                        help="轻量浏览器配置：屏蔽图片/媒体/字体/CSS/统计脚本")
+    parser.add_argument("--iframe-patterns", default=IFRAME_PATTERNS_PATH,
+                        help="iframe 地址模板缓存文件，传空字符串则禁用")
+    parser.add_argument("--settle", type=float, default=0.0,
+                        help="页面渲染稳定后额外的固定等待（秒），默认不等待")
+    parser.add_argument("--backend", choices=["selenium", "http", "auto"], default="selenium",
+                        help="抓取后端：selenium / http（仅 HTTP）/ auto（先 HTTP，缺少章节时回退浏览器）")
+    parser.add_argument("--http-concurrency", type=int, default=8, help="HTTP 后端并发请求数")
+    parser.add_argument("--manifest", default="out/manifest.jsonl", help="抓取清单路径（JSONL）")
+    parser.add_argument("--refresh", action="store_true",
+                        help="忽略清单中已完成的记录，全部重新抓取并报告内容变化")
+    parser.add_argument("--html-cache", default=HTML_CACHE_DIR,
+                        help="原始 HTML 缓存目录，传空字符串则不缓存")
+    parser.add_argument("--extract-only", action="store_true",
+                        help="不抓取，仅从 HTML 缓存重新抽取正文到 out/")
+    parser.add_argument("--output", choices=["txt", "jsonl", "both"], default="txt",
+                        help="正文输出：txt（out/NNN.txt）/ jsonl（分片语料）/ both")
+    parser.add_argument("--corpus-dir", default="out/corpus", help="JSONL 语料分片目录")
+    parser.add_argument("--corpus-shard-mb", type=int, default=64, help="单个语料分片的大小上限（MB）")
+    parser.add_argument("--corpus-zstd", action="store_true", help="语料分片使用 zstd 压缩（需要 zstandard）")
+    parser.add_argument("--metrics-dir", default="out/metrics",
+                        help="逐页耗时 CSV、分位数汇总 JSON 和 Prometheus 指标的输出目录")
+    parser.add_argument("--extract-workers", type=int, default=0,
+                        help="离线抽取进程数，默认等于 CPU 核数")
+    return parser
 
-    urls = [
-    "https://www.valueonline.cn/laws/violation/15448543976704390673/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972179955539/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976285051865/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975942238729/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972054823191/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543973952605911/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976331153375/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975786945403/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975194342202/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664242154627/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975883280493/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970467483206/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543973445339266/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664212027774/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664212027781/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664143123478/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128365993/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128365998/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366003/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366008/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366015/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366020/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366025/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366030/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366035/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366041/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366046/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366051/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664128366056/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976569327242/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971901228292/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975822257705/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482441/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482446/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482452/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482457/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482462/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482467/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482472/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482477/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482482/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482487/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482492/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482497/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482502/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482507/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482512/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482518/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482523/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482528/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976853482533/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968745541027/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525014293534/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976735286136/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974016260831/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972174329101/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976736197885/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976499825927/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976749000699/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972851422437/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968449477359/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976724430496/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976724430511/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972669332818/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970799981849/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969337892239/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968918335161/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971979716151/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970560994080/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976668348023/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976749001673/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975451883449/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969642817215/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970801233376/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543973192938379/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972850277168/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974270478507/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974270478519/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664115508739/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976542803018/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976510581318/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976510770705/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976512894699/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976512894770/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976512894776/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976512894782/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976512894793/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543973032304377/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971899562831/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975950673824/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968533618459/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969497467648/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971232651578/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974073448339/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543973032304390/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976389371957/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975523482671/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974073448321/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976542833174/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976342456052/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976342456062/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971318150308/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970719175504/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974222275336/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975492050126/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976573277035/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976207549977/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969583202432/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969624854688/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972174329095/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971415040790/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976294703930/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976232120879/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970627687261/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976204063987/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970683440845/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976161843022/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525459102794/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970191625452/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976202869465/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976011832053/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976202869486/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974458430711/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970883033136/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976124960578/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969477648444/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524981822892/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970386868890/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525484424537/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970597157269/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972142590232/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524481942030/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975765982792/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975767003880/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975767109967/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975767188814/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975941790935/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975941790940/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975941790948/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975941790953/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975941790958/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975941790963/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975941790973/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975941790978/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543976037108717/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970182922130/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975701858694/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525512841146/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972339283942/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975665145319/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975675902561/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969795532237/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969845914487/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543973707645962/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970317140859/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975453804780/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525604252336/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970385469050/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975453587958/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975453646166/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975453721710/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975453844927/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975453882750/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975470619604/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975273388218/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975821934311/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975470688201/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664143123489/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971038149702/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974510178147/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975052599320/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975268190884/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975268190889/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975268190894/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975268190914/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975268191024/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972431284144/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970767994099/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971103683883/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975591191159/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974431623904/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969674486217/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970540467617/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970005405210/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969343971991/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972977365993/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974211492320/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543974846701333/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543975043851787/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968509768012/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543973975804010/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543973771288444/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969389022768/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969512210829/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969650879439/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970727032445/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970691260110/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970737313718/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524490841987/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543973032555404/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969573963294/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968467264923/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969409636697/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972119027482/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972119027502/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972119027537/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972119027553/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524360301189/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971398793974/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971398793987/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525573724036/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971265375780/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971264629645/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970446651434/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970942344270/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970895885081/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969252063863/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525696720217/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970862084019/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970862084043/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970862084066/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970428624819/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847388/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970895885041/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970942984935/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970943001306/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968540768513/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970328180011/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970962008264/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968441862012/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969564796336/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847132/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847237/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847243/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847248/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847253/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847258/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847363/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847368/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847373/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847378/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970858847383/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970625203235/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970737369323/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524341199879/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524360911577/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971398793980/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969614707027/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970554760511/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970554760519/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970554760527/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970554760534/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970554760540/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970554760546/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970554760555/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970589391354/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970589391366/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970589391377/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970589391385/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970589391394/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970589391399/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970589391404/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969685277390/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971161298460/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524863655280/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970495070640/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525603054700/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524356289773/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543972420826513/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969908349130/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970624991653/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970625018298/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970625018304/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970325891479/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970375349126/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970376402452/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970376402458/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970462137042/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970624991659/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970257363020/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970257365936/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968207319789/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970444791317/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970296772458/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970296772463/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970296772469/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969313793192/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525684385037/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970257368802/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970265337492/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970265337499/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970265337556/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970265337661/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970265337766/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970265337771/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970265337776/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970265337781/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971161018320/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525622235208/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968526405211/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970072904550/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971160839496/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970257463951/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524352726278/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970323488749/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900697977087/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970323488754/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968441015654/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968441015660/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970072904831/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970072904838/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970072904848/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970072904854/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525389898856/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968441862024/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968331307318/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970973326842/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543971056684013/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970444788779/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524331654567/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970144243414/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969942841355/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525014293540/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968368436307/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969780366871/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968441015648/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970417804352/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969744195114/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524331721400/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968207319782/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968317286703/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969020811707/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969776533606/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969776534522/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969776534532/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969776534542/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969776583331/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969814977963/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969814980362/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524966316288/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524352781181/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968756431924/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969741561346/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524331612893/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524785320384/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968441345041/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969697513514/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969724374006/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524932560471/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968345510109/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969219837675/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524352619631/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969732441450/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525540382981/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968425835859/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968871678358/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969692405111/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969692405262/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969692405426/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969692405586/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969692405676/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969692405783/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525534291650/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969562960802/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969692405298/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524331810428/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900406967465/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543970085574227/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968925617952/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969382142495/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968441862018/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969408998494/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524356525456/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969532709186/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969400963185/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969401017373/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968291735052/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524752197743/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969530133525/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969532709193/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969282488982/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525634949824/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969532709202/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969282488977/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525703942894/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525568483213/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968997916186/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969015529686/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524356238039/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543969633471638/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525470533447/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524377792811/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524352925544/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968856933204/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827316935979/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968796267678/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524650151584/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524446644288/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968633311588/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968524907058/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524982172243/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525573733312/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524761000113/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968567185684/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968481801424/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968481851348/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968449477329/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525430463059/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524778244032/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524340365694/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524351763599/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968397898841/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524982172249/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968466635341/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524118034701/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525710243640/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525710243530/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525710243635/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525710243647/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525710243652/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524752459860/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524966099264/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525657249370/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525657249375/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525723603391/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524352676574/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525560058998/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524331759331/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524352528465/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901389328008/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525507349637/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525507349642/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524742783442/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525486112805/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901070352485/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525723489338/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524356894767/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524889671733/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525372935782/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524580359805/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968365099902/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216523000168/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525170947520/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900718164565/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968365099907/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524118035505/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795525023408919/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524896345252/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524939401011/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524939401316/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524939401321/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524939401326/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524939401331/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524939401336/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524939401343/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524350552692/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524887980810/01.html",
-    "https://www.valueonline.cn/laws/violation/5071765210840383413/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524881564589/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524859404902/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524860293879/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795523953994337/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524778177082/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524778177087/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524778177092/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524472794193/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524053212446/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524784360773/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524352280481/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524774729307/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524774729312/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524774729317/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524774729322/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524774729327/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524774729332/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524774729342/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524778177062/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524778240285/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524778240290/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524778240295/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524473610376/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968366302078/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524243939564/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524352082445/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524739911658/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524739911663/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900688764233/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524739911673/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524356457426/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216478514900/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524739917253/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524474450321/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524777916896/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524777917768/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900634435622/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524353323215/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900763238056/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524218137106/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524262571623/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524784356560/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524102773733/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795523807297170/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524332541910/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524192584705/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900613646436/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524270653249/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524218486247/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795523893692724/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524079467271/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795523872424469/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901127827221/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216599516159/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795523873645038/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216434943538/01.html",
-    "https://www.valueonline.cn/laws/violation/5071765210824783312/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216471444994/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901056105910/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216623765117/01.html",
-    "https://www.valueonline.cn/laws/violation/5071765210754754771/01.html",
-    "https://www.valueonline.cn/laws/violation/5071765210754754809/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216545386989/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216540250353/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216545387159/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216545387164/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216545387174/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216545387182/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216524904961/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900894794029/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968366318119/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216527885099/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900888964872/01.html",
-    "https://www.valueonline.cn/laws/violation/459957216521229717/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900690661054/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901385439242/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901056105880/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900887198945/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968365100035/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901044726711/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900617830835/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901282293101/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900714407556/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901192535961/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901192787617/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901100510942/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901190078837/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901190080537/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901230775340/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901230778717/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827303298955/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901185687848/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901163169117/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901185588462/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901185788486/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524271705129/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827313017204/01.html",
-    "https://www.valueonline.cn/laws/violation/15448543968365100050/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901269755721/01.html",
-    "https://www.valueonline.cn/laws/violation/15449773664320077081/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900925167659/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827299785265/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900340789169/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901004693492/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900898932704/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900778760365/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900933130497/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827317665872/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900637142146/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900644750300/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900712707033/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900800477783/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900901069705/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900916113399/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900682222701/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900871622332/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900802135933/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900832955759/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827310492799/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900688881707/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901053701890/01.html",
-    "https://www.valueonline.cn/laws/violation/459097901054461179/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900802933381/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900340333110/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900689166128/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900787290191/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900758000656/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900772673436/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900772673440/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900772673450/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900772673456/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002844976820/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900452881300/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900747256569/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900535228934/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900717793861/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900747258661/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900346532599/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900699312603/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900765322737/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900491944528/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900439235399/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900683013745/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827245826524/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900651474744/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827299041197/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805385857001/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900643350209/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900422976181/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827300065385/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900593131243/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900593131312/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900655648171/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827248135961/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900544377778/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263438540/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900567199556/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900614510730/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900614518021/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900246999620/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900335070057/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900527193309/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002835680284/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900532980512/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292293265615/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900655763716/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900491492883/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805397064854/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900459237106/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900443555500/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805395644700/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900456841650/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900446955820/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002819243872/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900428842528/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805383229739/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292302024993/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292307560287/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002836897813/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900418170308/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900407184424/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900407192760/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900384151509/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900384265816/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900478756689/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900365175638/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002846557507/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900345120606/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900186969412/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827278436938/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672753162261/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900340345242/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292304285623/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900335212454/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827288777977/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900300277567/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292314595174/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002844976821/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900282302141/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002818643800/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900478571417/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900216533853/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900216611180/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900219644079/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900219653689/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827225333980/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900177757340/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900545192145/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827305389764/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827231658694/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900181630051/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900185544739/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900176000520/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827293232135/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827315128171/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002845907125/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292297981956/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827312933737/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002818007164/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827305819695/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263388089/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827305587018/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827305646076/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002843917951/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827303304609/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827302455579/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524272040098/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292325720686/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827300686490/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827299283342/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827299283615/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827299301904/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827299303037/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827299306469/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827299307340/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827291642270/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292310478805/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827298427533/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524278034519/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827298992295/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827288750420/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827297901690/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827298241430/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827291636540/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827288672561/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827288672565/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827285764117/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827285428363/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827310399513/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827274125797/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827271596822/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827271599377/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827271600111/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827271600813/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827271601454/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827267717455/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827260103506/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827244742000/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827245153053/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827244558420/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827240303838/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827240308882/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827267719086/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827267719204/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827252208850/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672750029657/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900421269027/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827232457505/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827226682067/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524277922343/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827231033644/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827224330524/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827224336565/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827219612364/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827219616486/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827217602514/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827217599356/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827217600604/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827220419113/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827222976030/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827223027216/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827228847578/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827217021276/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827217022602/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827217067389/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827217069364/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827217069697/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827220482873/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827220533617/01.html",
-    "https://www.valueonline.cn/laws/violation/458629827228797502/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292326506164/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292325288582/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292320892750/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292315476135/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292308889205/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292307145743/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002848214906/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002848710562/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002801341536/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002801341581/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672749158713/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065452662020/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002846942625/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292302837057/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672750701684/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002845092985/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002827905602/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002826908119/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002822744981/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002822749554/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002816068854/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002816072050/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002813775769/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002813983403/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002811905056/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002811520233/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002811525780/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002808815310/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002810338204/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002802443375/01.html",
-    "https://www.valueonline.cn/laws/violation/746761292309319241/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002809000845/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805402619893/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002809509278/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805387427259/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805397126972/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805397133830/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805392011562/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805395828128/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805395828144/01.html",
-    "https://www.valueonline.cn/laws/violation/746412002809339509/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805394053813/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805395827415/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805391589277/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805391592040/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805394036951/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805394591534/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805392005744/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805388800414/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805388800815/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805394171108/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805394173356/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805394180783/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672753573632/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805384912544/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805384007949/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805385205677/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805383288917/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065457119420/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805381340007/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757245092/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379605806/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379605920/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379605968/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379606207/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379606228/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379606259/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379606687/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379606707/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805385828677/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379854956/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672744008284/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805385835516/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379605877/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379606360/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379606431/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379606756/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379607143/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379607479/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805379607524/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263386851/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757697362/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757404289/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757404869/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757405168/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757405239/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757405270/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757405322/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757405528/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757405975/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757406089/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757406267/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757406406/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757406490/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757406713/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757406892/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757407028/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757407069/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757407150/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672757407177/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065453001410/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672756410666/01.html",
-    "https://www.valueonline.cn/laws/violation/615/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672741527648/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672754007551/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672748228985/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672753936080/01.html",
-    "https://www.valueonline.cn/laws/violation/81/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672752953041/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672753465453/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065456155054/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672752888494/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263438527/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672749886531/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805387799374/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065456516080/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672749239761/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805387799894/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672749238969/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065456515489/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672747987801/01.html",
-    "https://www.valueonline.cn/laws/violation/3/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672753025736/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672753026055/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672745829239/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672747991937/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454898793/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672740894518/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672739346359/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263438544/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672739005235/01.html",
-    "https://www.valueonline.cn/laws/violation/242/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065452701208/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672738778344/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065456706182/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065456275774/01.html",
-    "https://www.valueonline.cn/laws/violation/745652376752855194/01.html",
-    "https://www.valueonline.cn/laws/violation/745777672739059098/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263438507/01.html",
-    "https://www.valueonline.cn/laws/violation/745652376752214621/01.html",
-    "https://www.valueonline.cn/laws/violation/164/01.html",
-    "https://www.valueonline.cn/laws/violation/745652376750708125/01.html",
-    "https://www.valueonline.cn/laws/violation/745652376752266607/01.html",
-    "https://www.valueonline.cn/laws/violation/5071795524279696299/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454769660/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263438535/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065452862877/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454045643/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454054017/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454059937/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454060085/01.html",
-    "https://www.valueonline.cn/laws/violation/745652376748953097/01.html",
-    "https://www.valueonline.cn/laws/violation/745652376748953957/01.html",
-    "https://www.valueonline.cn/laws/violation/745652376748948196/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065452617438/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065452617990/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065458430738/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065458432800/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065458433461/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065458323075/01.html",
-    "https://www.valueonline.cn/laws/violation/471/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065458004072/01.html",
-    "https://www.valueonline.cn/laws/violation/745652376752848831/01.html",
-    "https://www.valueonline.cn/laws/violation/707/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065457641285/01.html",
-    "https://www.valueonline.cn/laws/violation/746126805387801412/01.html",
-    "https://www.valueonline.cn/laws/violation/745652376752797320/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454537204/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454538318/01.html",
-    "https://www.valueonline.cn/laws/violation/17/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065455211634/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065455211711/01.html",
-    "https://www.valueonline.cn/laws/violation/1928/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263387759/01.html",
-    "https://www.valueonline.cn/laws/violation/473/01.html",
-    "https://www.valueonline.cn/laws/violation/952/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454436710/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454436944/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065453051047/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065454225905/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263566082/01.html",
-    "https://www.valueonline.cn/laws/violation/745439065452592238/01.html",
-    "https://www.valueonline.cn/laws/violation/270/01.html",
-    "https://www.valueonline.cn/laws/violation/1940/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263510348/01.html",
-    "https://www.valueonline.cn/laws/violation/432/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263383404/01.html",
-    "https://www.valueonline.cn/laws/violation/140/01.html",
-    "https://www.valueonline.cn/laws/violation/336/01.html",
-    "https://www.valueonline.cn/laws/violation/1465915350209052679/01.html",
-    "https://www.valueonline.cn/laws/violation/1465915350209052649/01.html",
-    "https://www.valueonline.cn/laws/violation/2/01.html",
-    "https://www.valueonline.cn/laws/violation/1884/01.html",
-    "https://www.valueonline.cn/laws/violation/688/01.html",
-    "https://www.valueonline.cn/laws/violation/1465899435341957903/01.html",
-    "https://www.valueonline.cn/laws/violation/82090/01.html",
-    "https://www.valueonline.cn/laws/violation/1815/01.html",
-    "https://www.valueonline.cn/laws/violation/1860/01.html",
-    "https://www.valueonline.cn/laws/violation/745398478263592719/01.html",
-    "https://www.valueonline.cn/laws/violation/1864/01.html",
-    "https://www.valueonline.cn/laws/violation/1867/01.html",
-    "https://www.valueonline.cn/laws/violation/1465892298868017109/01.html",
-    "https://www.valueonline.cn/laws/violation/1718/01.html",
-    "https://www.valueonline.cn/laws/violation/1903/01.html",
-    "https://www.valueonline.cn/laws/violation/82100/01.html",
-    "https://www.valueonline.cn/laws/violation/82102/01.html",
-    "https://www.valueonline.cn/laws/violation/129/01.html",
-    "https://www.valueonline.cn/laws/violation/82112/01.html",
-    "https://www.valueonline.cn/laws/violation/121/01.html",
-    "https://www.valueonline.cn/laws/violation/81975/01.html",
-    "https://www.valueonline.cn/laws/violation/82133/01.html",
-    "https://www.valueonline.cn/laws/violation/176/01.html",
-    "https://www.valueonline.cn/laws/violation/321/01.html",
-    "https://www.valueonline.cn/laws/violation/1720/01.html",
-    "https://www.valueonline.cn/laws/violation/228/01.html",
-    "https://www.valueonline.cn/laws/violation/229/01.html",
-    "https://www.valueonline.cn/laws/violation/218/01.html",
-    "https://www.valueonline.cn/laws/violation/254/01.html",
-    "https://www.valueonline.cn/laws/violation/82136/01.html",
-    "https://www.valueonline.cn/laws/violation/271/01.html",
-    "https://www.valueonline.cn/laws/violation/82140/01.html",
-    "https://www.valueonline.cn/laws/violation/286/01.html",
-    "https://www.valueonline.cn/laws/violation/290/01.html",
-    "https://www.valueonline.cn/laws/violation/82143/01.html",
-    "https://www.valueonline.cn/laws/violation/81988/01.html",
-    "https://www.valueonline.cn/laws/violation/378/01.html",
-    "https://www.valueonline.cn/laws/violation/629/01.html",
-    "https://www.valueonline.cn/laws/violation/338/01.html",
-    "https://www.valueonline.cn/laws/violation/81541/01.html",
-    "https://www.valueonline.cn/laws/violation/81542/01.html",
-    "https://www.valueonline.cn/laws/violation/82148/01.html",
-    "https://www.valueonline.cn/laws/violation/82150/01.html",
-    "https://www.valueonline.cn/laws/violation/82151/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064193921/01.html",
-    "https://www.valueonline.cn/laws/violation/520/01.html",
-    "https://www.valueonline.cn/laws/violation/392/01.html",
-    "https://www.valueonline.cn/laws/violation/82156/01.html",
-    "https://www.valueonline.cn/laws/violation/82158/01.html",
-    "https://www.valueonline.cn/laws/violation/384/01.html",
-    "https://www.valueonline.cn/laws/violation/413/01.html",
-    "https://www.valueonline.cn/laws/violation/431/01.html",
-    "https://www.valueonline.cn/laws/violation/438/01.html",
-    "https://www.valueonline.cn/laws/violation/449/01.html",
-    "https://www.valueonline.cn/laws/violation/441/01.html",
-    "https://www.valueonline.cn/laws/violation/444/01.html",
-    "https://www.valueonline.cn/laws/violation/446/01.html",
-    "https://www.valueonline.cn/laws/violation/450/01.html",
-    "https://www.valueonline.cn/laws/violation/456/01.html",
-    "https://www.valueonline.cn/laws/violation/82167/01.html",
-    "https://www.valueonline.cn/laws/violation/495/01.html",
-    "https://www.valueonline.cn/laws/violation/541/01.html",
-    "https://www.valueonline.cn/laws/violation/589/01.html",
-    "https://www.valueonline.cn/laws/violation/1727/01.html",
-    "https://www.valueonline.cn/laws/violation/601/01.html",
-    "https://www.valueonline.cn/laws/violation/82181/01.html",
-    "https://www.valueonline.cn/laws/violation/793/01.html",
-    "https://www.valueonline.cn/laws/violation/703/01.html",
-    "https://www.valueonline.cn/laws/violation/704/01.html",
-    "https://www.valueonline.cn/laws/violation/715/01.html",
-    "https://www.valueonline.cn/laws/violation/1730/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195005/01.html",
-    "https://www.valueonline.cn/laws/violation/82190/01.html",
-    "https://www.valueonline.cn/laws/violation/769/01.html",
-    "https://www.valueonline.cn/laws/violation/778/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195011/01.html",
-    "https://www.valueonline.cn/laws/violation/870/01.html",
-    "https://www.valueonline.cn/laws/violation/799/01.html",
-    "https://www.valueonline.cn/laws/violation/812/01.html",
-    "https://www.valueonline.cn/laws/violation/820/01.html",
-    "https://www.valueonline.cn/laws/violation/832/01.html",
-    "https://www.valueonline.cn/laws/violation/829/01.html",
-    "https://www.valueonline.cn/laws/violation/849/01.html",
-    "https://www.valueonline.cn/laws/violation/877/01.html",
-    "https://www.valueonline.cn/laws/violation/881/01.html",
-    "https://www.valueonline.cn/laws/violation/874/01.html",
-    "https://www.valueonline.cn/laws/violation/1735/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195034/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195039/01.html",
-    "https://www.valueonline.cn/laws/violation/923/01.html",
-    "https://www.valueonline.cn/laws/violation/919/01.html",
-    "https://www.valueonline.cn/laws/violation/81648/01.html",
-    "https://www.valueonline.cn/laws/violation/942/01.html",
-    "https://www.valueonline.cn/laws/violation/82218/01.html",
-    "https://www.valueonline.cn/laws/violation/981/01.html",
-    "https://www.valueonline.cn/laws/violation/1015/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195045/01.html",
-    "https://www.valueonline.cn/laws/violation/1040/01.html",
-    "https://www.valueonline.cn/laws/violation/1028/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195050/01.html",
-    "https://www.valueonline.cn/laws/violation/1044/01.html",
-    "https://www.valueonline.cn/laws/violation/82263/01.html",
-    "https://www.valueonline.cn/laws/violation/1055/01.html",
-    "https://www.valueonline.cn/laws/violation/1070/01.html",
-    "https://www.valueonline.cn/laws/violation/1075/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195057/01.html",
-    "https://www.valueonline.cn/laws/violation/1110/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195065/01.html",
-    "https://www.valueonline.cn/laws/violation/1124/01.html",
-    "https://www.valueonline.cn/laws/violation/1121/01.html",
-    "https://www.valueonline.cn/laws/violation/82295/01.html",
-    "https://www.valueonline.cn/laws/violation/82304/01.html",
-    "https://www.valueonline.cn/laws/violation/1178/01.html",
-    "https://www.valueonline.cn/laws/violation/1761/01.html",
-    "https://www.valueonline.cn/laws/violation/1196/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195092/01.html",
-    "https://www.valueonline.cn/laws/violation/82337/01.html",
-    "https://www.valueonline.cn/laws/violation/82071/01.html",
-    "https://www.valueonline.cn/laws/violation/1315/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195101/01.html",
-    "https://www.valueonline.cn/laws/violation/82356/01.html",
-    "https://www.valueonline.cn/laws/violation/1292/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195103/01.html",
-    "https://www.valueonline.cn/laws/violation/1357/01.html",
-    "https://www.valueonline.cn/laws/violation/1771/01.html",
-    "https://www.valueonline.cn/laws/violation/82363/01.html",
-    "https://www.valueonline.cn/laws/violation/82365/01.html",
-    "https://www.valueonline.cn/laws/violation/1364/01.html",
-    "https://www.valueonline.cn/laws/violation/1366/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195109/01.html",
-    "https://www.valueonline.cn/laws/violation/1384/01.html",
-    "https://www.valueonline.cn/laws/violation/1381/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195132/01.html",
-    "https://www.valueonline.cn/laws/violation/82376/01.html",
-    "https://www.valueonline.cn/laws/violation/1427/01.html",
-    "https://www.valueonline.cn/laws/violation/1433/01.html",
-    "https://www.valueonline.cn/laws/violation/82390/01.html",
-    "https://www.valueonline.cn/laws/violation/82394/01.html",
-    "https://www.valueonline.cn/laws/violation/1446/01.html",
-    "https://www.valueonline.cn/laws/violation/1452/01.html",
-    "https://www.valueonline.cn/laws/violation/1453/01.html",
-    "https://www.valueonline.cn/laws/violation/1467/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195164/01.html",
-    "https://www.valueonline.cn/laws/violation/1477/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195180/01.html",
-    "https://www.valueonline.cn/laws/violation/82406/01.html",
-    "https://www.valueonline.cn/laws/violation/1781/01.html",
-    "https://www.valueonline.cn/laws/violation/1509/01.html",
-    "https://www.valueonline.cn/laws/violation/1516/01.html",
-    "https://www.valueonline.cn/laws/violation/1513/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195194/01.html",
-    "https://www.valueonline.cn/laws/violation/82417/01.html",
-    "https://www.valueonline.cn/laws/violation/82418/01.html",
-    "https://www.valueonline.cn/laws/violation/1542/01.html",
-    "https://www.valueonline.cn/laws/violation/1545/01.html",
-    "https://www.valueonline.cn/laws/violation/82422/01.html",
-    "https://www.valueonline.cn/laws/violation/82433/01.html",
-    "https://www.valueonline.cn/laws/violation/1580/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064195207/01.html",
-    "https://www.valueonline.cn/laws/violation/82436/01.html",
-    "https://www.valueonline.cn/laws/violation/82443/01.html",
-    "https://www.valueonline.cn/laws/violation/82444/01.html",
-    "https://www.valueonline.cn/laws/violation/1602/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064196125/01.html",
-    "https://www.valueonline.cn/laws/violation/2014/01.html",
-    "https://www.valueonline.cn/laws/violation/1630/01.html",
-    "https://www.valueonline.cn/laws/violation/82465/01.html",
-    "https://www.valueonline.cn/laws/violation/1653/01.html",
-    "https://www.valueonline.cn/laws/violation/1662/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064196144/01.html",
-    "https://www.valueonline.cn/laws/violation/1670/01.html",
-    "https://www.valueonline.cn/laws/violation/1685/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064196150/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064196154/01.html",
-    "https://www.valueonline.cn/laws/violation/1689/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064196158/01.html",
-    "https://www.valueonline.cn/laws/violation/1700/01.html",
-    "https://www.valueonline.cn/laws/violation/1812/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064196184/01.html",
-    "https://www.valueonline.cn/laws/violation/2009/01.html",
-    "https://www.valueonline.cn/laws/violation/2030/01.html",
-    "https://www.valueonline.cn/laws/violation/1713/01.html",
-    "https://www.valueonline.cn/laws/violation/745280726064196206/01.html",
-    "https://www.valueonline.cn/laws/violation/82481/01.html",
-    "https://www.valueonline.cn/laws/violation/82483/01.html",
-    "https://www.valueonline.cn/laws/violation/81860/01.html",
-    "https://www.valueonline.cn/laws/violation/82488/01.html",
-    "https://www.valueonline.cn/laws/violation/2010/01.html",
-    "https://www.valueonline.cn/laws/violation/82490/01.html",
-    "https://www.valueonline.cn/laws/violation/82496/01.html",
-    "https://www.valueonline.cn/laws/violation/2036/01.html",
-    "https://www.valueonline.cn/laws/violation/2044/01.html",
-    "https://www.valueonline.cn/laws/violation/2050/01.html",
-    "https://www.valueonline.cn/laws/violation/82506/01.html",
-    "https://www.valueonline.cn/laws/violation/2056/01.html",
-    "https://www.valueonline.cn/laws/violation/81866/01.html",
-    "https://www.valueonline.cn/laws/violation/2061/01.html",
-    "https://www.valueonline.cn/laws/violation/2062/01.html",
-    "https://www.valueonline.cn/laws/violation/81867/01.html",
-    "https://www.valueonline.cn/laws/violation/2079/01.html",
-    "https://www.valueonline.cn/laws/violation/82519/01.html",
-    "https://www.valueonline.cn/laws/violation/82524/01.html",
-    "https://www.valueonline.cn/laws/violation/2084/01.html",
-    "https://www.valueonline.cn/laws/violation/81882/01.html",
-    "https://www.valueonline.cn/laws/violation/82529/01.html",
-    "https://www.valueonline.cn/laws/violation/2090/01.html",
-    "https://www.valueonline.cn/laws/violation/81884/01.html",
-    "https://www.valueonline.cn/laws/violation/2093/01.html",
-    "https://www.valueonline.cn/laws/violation/2094/01.html",
-    "https://www.valueonline.cn/laws/violation/2095/01.html",
-    "https://www.valueonline.cn/laws/violation/81886/01.html",
-    "https://www.valueonline.cn/laws/violation/2116/01.html",
-    "https://www.valueonline.cn/laws/violation/81889/01.html",
-    "https://www.valueonline.cn/laws/violation/82535/01.html",
-    "https://www.valueonline.cn/laws/violation/2120/01.html",
-    "https://www.valueonline.cn/laws/violation/81891/01.html",
-    "https://www.valueonline.cn/laws/violation/2123/01.html",
-    "https://www.valueonline.cn/laws/violation/2125/01.html",
-    "https://www.valueonline.cn/laws/violation/81893/01.html",
-    "https://www.valueonline.cn/laws/violation/82538/01.html",
-    "https://www.valueonline.cn/laws/violation/2127/01.html",
-    "https://www.valueonline.cn/laws/violation/81895/01.html",
-    "https://www.valueonline.cn/laws/violation/2187/01.html",
-    "https://www.valueonline.cn/laws/violation/2137/01.html",
-    "https://www.valueonline.cn/laws/violation/2149/01.html",
-    "https://www.valueonline.cn/laws/violation/81902/01.html",
-    "https://www.valueonline.cn/laws/violation/82560/01.html",
-    "https://www.valueonline.cn/laws/violation/459097900874258699/01.html",
-    "https://www.valueonline.cn/laws/violation/2152/01.html",
-    "https://www.valueonline.cn/laws/violation/81903/01.html",
-    "https://www.valueonline.cn/laws/violation/2161/01.html",
-    "https://www.valueonline.cn/laws/violation/2175/01.html",
-    "https://www.valueonline.cn/laws/violation/2177/01.html",
-    "https://www.valueonline.cn/laws/violation/2180/01.html",
-    "https://www.valueonline.cn/laws/violation/2201/01.html",
-    "https://www.valueonline.cn/laws/violation/81906/01.html",
-    "https://www.valueonline.cn/laws/violation/81909/01.html",
-    "https://www.valueonline.cn/laws/violation/81910/01.html",
-    "https://www.valueonline.cn/laws/violation/2218/01.html",
-    "https://www.valueonline.cn/laws/violation/2228/01.html",
-    "https://www.valueonline.cn/laws/violation/81914/01.html",
-    "https://www.valueonline.cn/laws/violation/2257/01.html",
-    "https://www.valueonline.cn/laws/violation/2260/01.html",
-    "https://www.valueonline.cn/laws/violation/81919/01.html",
-    "https://www.valueonline.cn/laws/violation/82572/01.html",
-    "https://www.valueonline.cn/laws/violation/82574/01.html",
-    "https://www.valueonline.cn/laws/violation/2270/01.html",
-    "https://www.valueonline.cn/laws/violation/2274/01.html",
-    "https://www.valueonline.cn/laws/violation/2294/01.html",
-    "https://www.valueonline.cn/laws/violation/2293/01.html",
-    "https://www.valueonline.cn/laws/violation/81926/01.html",
-    "https://www.valueonline.cn/laws/violation/82586/01.html",
-    "https://www.valueonline.cn/laws/violation/2333/01.html",
-    "https://www.valueonline.cn/laws/violation/2340/01.html",
-    "https://www.valueonline.cn/laws/violation/2341/01.html",
-    "https://www.valueonline.cn/laws/violation/2342/01.html",
-    "https://www.valueonline.cn/laws/violation/2346/01.html",
-    "https://www.valueonline.cn/laws/violation/2350/01.html",
-    "https://www.valueonline.cn/laws/violation/82597/01.html",
-    "https://www.valueonline.cn/laws/violation/2362/01.html",
-    "https://www.valueonline.cn/laws/violation/82606/01.html",
-    "https://www.valueonline.cn/laws/violation/2364/01.html",
-    "https://www.valueonline.cn/laws/violation/2372/01.html",
-    "https://www.valueonline.cn/laws/violation/82609/01.html",
-    "https://www.valueonline.cn/laws/violation/82613/01.html",
-    "https://www.valueonline.cn/laws/violation/2398/01.html",
-    "https://www.valueonline.cn/laws/violation/2402/01.html",
-    "https://www.valueonline.cn/laws/violation/81934/01.html",
-    "https://www.valueonline.cn/laws/violation/81935/01.html",
-    "https://www.valueonline.cn/laws/violation/82622/01.html",
-    "https://www.valueonline.cn/laws/violation/82624/01.html",
-    "https://www.valueonline.cn/laws/violation/2424/01.html",
-    "https://www.valueonline.cn/laws/violation/2425/01.html",
-    "https://www.valueonline.cn/laws/violation/82625/01.html",
-    "https://www.valueonline.cn/laws/violation/82633/01.html",
-    "https://www.valueonline.cn/laws/violation/2452/01.html",
-    "https://www.valueonline.cn/laws/violation/81936/01.html",
-    "https://www.valueonline.cn/laws/violation/2454/01.html",
-    "https://www.valueonline.cn/laws/violation/82638/01.html",
-    "https://www.valueonline.cn/laws/violation/2461/01.html",
-    "https://www.valueonline.cn/laws/violation/2460/01.html",
-    "https://www.valueonline.cn/laws/violation/81939/01.html",
-    "https://www.valueonline.cn/laws/violation/81940/01.html",
-    "https://www.valueonline.cn/laws/violation/82640/01.html",
-    "https://www.valueonline.cn/laws/violation/2470/01.html",
-    "https://www.valueonline.cn/laws/violation/2477/01.html",
-    "https://www.valueonline.cn/laws/violation/2479/01.html",
-    "https://www.valueonline.cn/laws/violation/2480/01.html",
-    "https://www.valueonline.cn/laws/violation/82644/01.html",
-    "https://www.valueonline.cn/laws/violation/82645/01.html",
-    "https://www.valueonline.cn/laws/violation/2487/01.html",
-    "https://www.valueonline.cn/laws/violation/2491/01.html",
-    "https://www.valueonline.cn/laws/violation/2499/01.html",
-    "https://www.valueonline.cn/laws/violation/2504/01.html",
-    "https://www.valueonline.cn/laws/violation/81943/01.html",
-    "https://www.valueonline.cn/laws/violation/82647/01.html",
-    "https://www.valueonline.cn/laws/violation/2508/01.html",
-    "https://www.valueonline.cn/laws/violation/82650/01.html",
-    "https://www.valueonline.cn/laws/violation/2526/01.html",
-    "https://www.valueonline.cn/laws/violation/2528/01.html",
-    "https://www.valueonline.cn/laws/violation/2529/01.html",
-    "https://www.valueonline.cn/laws/violation/82662/01.html",
-    "https://www.valueonline.cn/laws/violation/82663/01.html",
-    "https://www.valueonline.cn/laws/violation/82665/01.html",
-    "https://www.valueonline.cn/laws/violation/2540/01.html",
-    "https://www.valueonline.cn/laws/violation/2541/01.html",
-    "https://www.valueonline.cn/laws/violation/2560/01.html",
-    "https://www.valueonline.cn/laws/violation/2561/01.html",
-    "https://www.valueonline.cn/laws/violation/2578/01.html",
-    "https://www.valueonline.cn/laws/violation/2587/01.html",
-    "https://www.valueonline.cn/laws/violation/2604/01.html",
-    "https://www.valueonline.cn/laws/violation/2622/01.html",
-    "https://www.valueonline.cn/laws/violation/2629/01.html",
-    "https://www.valueonline.cn/laws/violation/82688/01.html",
-    "https://www.valueonline.cn/laws/violation/2642/01.html",
-    "https://www.valueonline.cn/laws/violation/2647/01.html",
-    "https://www.valueonline.cn/laws/violation/2648/01.html",
-    "https://www.valueonline.cn/laws/violation/82698/01.html",
-    "https://www.valueonline.cn/laws/violation/2659/01.html",
-    "https://www.valueonline.cn/laws/violation/2687/01.html",
-    "https://www.valueonline.cn/laws/violation/82700/01.html",
-    "https://www.valueonline.cn/laws/violation/2688/01.html",
-    "https://www.valueonline.cn/laws/violation/2707/01.html",
-    "https://www.valueonline.cn/laws/violation/2708/01.html",
-    "https://www.valueonline.cn/laws/violation/2712/01.html",
-    "https://www.valueonline.cn/laws/violation/2714/01.html",
-    "https://www.valueonline.cn/laws/violation/2717/01.html",
-    "https://www.valueonline.cn/laws/violation/2718/01.html",
-    "https://www.valueonline.cn/laws/violation/2721/01.html",
+def main():
+    args = build_parser().parse_args()
 
-    ]
+    from crawler.frontier import load_frontier, parse_shard
+    shard = parse_shard(args.shard) if args.shard else None
+    all_tasks, total = load_frontier(args.urls, shard)
+    if shard:
+        print(f"分片 {shard[0]}/{shard[1]}：{len(all_tasks)} / {total} 个 URL")
 
     ensure_out()
-    driver = make_driver(headless=args.headless)
+    from crawler.manifest import CrawlManifest
+    from crawler.metrics import CrawlMetrics
+    manifest = CrawlManifest(args.manifest)
+    metrics = CrawlMetrics(args.metrics_dir)
+    args.write_txt = args.output in ("txt", "both")
+    corpus = None
+    if args.output in ("jsonl", "both"):
+        from crawler.corpus import CorpusWriter
+        corpus = CorpusWriter(args.corpus_dir, args.corpus_shard_mb * 1024 * 1024, args.corpus_zstd)
+    changes = {"new": [], "changed": [], "unchanged": [], "failed": []}
+
+    def finish(record):
+        text = record.pop("text", None)
+        structure = record.pop("structure", None)
+        if corpus is not None and record["ok"]:
+            corpus.append(record["index"], record["url"], text, record.get("sha256"),
+                          structure=structure)
+        changes[manifest.record(record)].append(record["url"])
+        metrics.add(record)
+        report(record, total)
 
     try:
-        for i, url in enumerate(urls, start=1):
-            print(f"\n[{i}/{len(urls)}] 抓取中：{url}")
-            try:
-                html = grab_html(driver, url)
-                text = extract_text(html)
-                filename = f"out/{i:03d}.txt"
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(text)
-                print(f"✔ 已保存：{filename}（{len(text)} 字符）")
-            except Exception as e:
-                print(f"❌ 抓取失败：{url} → {e}")
-            time.sleep(2)
+        if args.extract_only:
+            extract_from_cache(manifest, args.html_cache, args.extract_workers, finish,
+                               args.write_txt)
+        else:
+            tasks = all_tasks
+            if not args.refresh:
+                tasks = manifest.pending(tasks)
+                print(f"清单中已完成 {len(all_tasks) - len(tasks)} 个，本次抓取 {len(tasks)} 个")
+            crawl(args, tasks, total, finish)
     finally:
-        driver.quit()
+        manifest.close()
+        if corpus is not None:
+            corpus.close()
+        summary = metrics.write()
+        for phase, stats in summary["phases"].items():
+            print(f"  {phase:<12} p50={stats['p50']:.2f}s p95={stats['p95']:.2f}s p99={stats['p99']:.2f}s")
+        print(f"吞吐 {summary['pages_per_second']:.2f} 页/秒，指标已写入 {args.metrics_dir}/")
+        print(f"\n新增 {len(changes['new'])}，变化 {len(changes['changed'])}，"
+              f"未变 {len(changes['unchanged'])}，失败 {len(changes['failed'])}")
+        for url in changes["changed"]:
+            print(f"  内容变化：{url}")
         print("\n全部完成 ✅")
 
+def crawl(args, tasks, total: int, finish):
+    """按 --backend / --workers 抓取 tasks，每条结果交给 finish(record)；args 需带 write_txt"""
+    from crawler.rate_limit import AIMDRateLimiter
+    limiter = AIMDRateLimiter(start_rate=args.rate, max_rate=args.max_rate,
+                              slow_threshold=args.slow)
+
+    if args.backend in ("http", "auto") and tasks:
+        records, tasks = crawl_http(tasks, args.http_concurrency, args.html_cache, limiter,
+                                    args.write_txt)
+        for record in records:
+            finish(record)
+        print(f"HTTP 后端完成 {len(records)} 个，{len(tasks)} 个缺少章节关键词")
+        if args.backend == "http":
+            for i, url in tasks:
+                finish({"index": i, "url": url, "ok": False, "error": "HTTP 抓取未找到章节关键词"})
+            tasks = []
+    if not tasks:
+        return
+
+    if args.workers > 1:
+        from crawler.pool import run_pool
+        print(f"并行模式：{args.workers} 个浏览器进程，共 {len(tasks)} 个 URL")
+        for record in run_pool(tasks, args.workers,
+                               partial(make_driver, headless=args.headless, light=args.light),
+                               partial(crawl_one, settle=args.settle,
+                                       patterns_path=args.iframe_patterns,
+                                       cache_dir=args.html_cache,
+                                       write_txt=args.write_txt),
+                               limiter=limiter, recycle_every=args.recycle_every,
+                               max_rss_mb=args.max_rss_mb):
+            finish(record)
+        return
+
+    from crawler.driver_guard import DriverGuard
+    guard = DriverGuard(partial(make_driver, headless=args.headless, light=args.light),
+                        args.recycle_every, args.max_rss_mb)
+    handle = partial(crawl_one, settle=args.settle, patterns_path=args.iframe_patterns,
+                     cache_dir=args.html_cache, write_txt=args.write_txt)
+    try:
+        for i, url in tasks:
+            host = urlsplit(url).netloc
+            limiter.acquire(host)
+            print(f"\n[{i}/{total}] 抓取中：{url}（速率 {limiter.rate(host):.2f} 次/秒）")
+            record = guard.run(handle, i, url)
+            limiter.observe(record)
+            finish(record)
+    finally:
+        guard.quit()
+
 if __name__ == "__main__":
     main()
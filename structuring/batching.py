@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""
+多文档合并请求：把若干篇短文书按 token 预算拼进同一个请求，要求 LLM 输出以文档编号为键的 JSON 数组，
+再拆回每个文件；解析失败或缺失的文档由调用方退回单篇请求
+"""
+
+import re
+import json
+
+_CJK_RE = re.compile(r"[　-〿一-鿿＀-￯]")
+
+# 合并请求的正文不截断，预算上限与单篇请求的正文上限（10000字符）一致，留出提示词和输出的上下文空间
+MAX_BATCH_TOKENS = 10000
+
+BATCH_INSTRUCTION = """
+【批量处理说明】
+本次请求包含{count}篇相互独立的文书，每篇以「【文档 编号】」开头。请对每篇分别按上述结构抽取，
+输出一个 JSON 数组，数组中每个元素为 {{"id": "文档编号", "result": {{按上述结构的JSON对象}}}}，
+每篇文书对应一个元素，不要合并不同文书的信息。
+"""
+
+
+def estimate_tokens(text: str) -> int:
+    """粗略估计：中文字符约1个token，其余字符约4个一个token"""
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + (len(text) - cjk) // 4 + 1
+
+
+def doc_id(filename: str) -> str:
+    """012.txt -> 012"""
+    return filename.rsplit(".", 1)[0]
+
+
+def format_documents(docs) -> str:
+    """docs 为 [(文件名, 正文)]"""
+    return "\n\n".join(f"【文档 {doc_id(name)}】\n{text.strip()}" for name, text in docs)
+
+
+def check_batch_options(batch_tokens: int, batch_chars: int):
+    """合并请求参数不合法时抛出 ValueError；batch_tokens 为0表示不合并，不做检查"""
+    if not batch_tokens:
+        return
+    if batch_tokens < 0 or batch_tokens > MAX_BATCH_TOKENS:
+        raise ValueError(f"--batch-tokens 应在1到{MAX_BATCH_TOKENS}之间，实际为{batch_tokens}")
+    if batch_chars >= batch_tokens:
+        # 中文约1字1个token，单篇文书就可能超出预算
+        raise ValueError(f"--batch-chars（{batch_chars}）应小于 --batch-tokens（{batch_tokens}）")
+
+
+class BatchBuffer:
+    """累积短文档，加入下一篇会超出 token 预算或篇数上限时由调用方先发出当前批次"""
+
+    def __init__(self, token_budget: int, max_docs: int = 8):
+        self.token_budget = token_budget
+        self.max_docs = max_docs
+        self.items = []
+        self.tokens = 0
+
+    def fits(self, text: str) -> bool:
+        if not self.items:
+            return True
+        return len(self.items) < self.max_docs and self.tokens + estimate_tokens(text) <= self.token_budget
+
+    def add(self, item, text: str):
+        self.items.append(item)
+        self.tokens += estimate_tokens(text)
+
+    def take(self) -> list:
+        items, self.items, self.tokens = self.items, [], 0
+        return items
+
+
+def _closed_items(text: str, start: int) -> list:
+    """
+    从 text[start] 处的 [ 开始逐个解析数组元素，遇到第一个无法解析的元素即停止；
+    输出超出 max_tokens 被截断时，前面已完整输出的元素仍然保留
+    """
+    decoder = json.JSONDecoder()
+    items = []
+    pos = start + 1
+    while True:
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return items
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return items
+        items.append(item)
+
+
+def split_batch_response(response: str, filenames) -> dict:
+    """返回 {文件名: 结果dict}，无法解析或缺失的文档不在其中"""
+    if not response:
+        return {}
+    items = []
+    for m in re.finditer(r"\[", response):
+        items = _closed_items(response, m.start())
+        if any(isinstance(item, dict) for item in items):
+            break
+    by_id = {doc_id(name): name for name in filenames}
+    results = {}
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("result"), dict):
+            continue
+        name = by_id.get(str(item.get("id", "")).strip())
+        if name and name not in results:
+            results[name] = item["result"]
+    return results
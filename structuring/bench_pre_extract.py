@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+规则预抽取基准：统计各字段命中率、准确率，并对比开启规则前后发给 LLM 的提示词长度
+
+    python -m structuring.bench_pre_extract --docs 500
+    python -m structuring.bench_pre_extract --input out                          # 真实语料，覆盖率和提示词长度
+    python -m structuring.bench_pre_extract --input out --truth structured_out   # 与已有的结构化结果对比
+
+合成文书只用于回归检查：标题、文号和落款的写法刻意多于正则编写时参照的格式，文号按去掉空白后的全文比较，
+多带或截断前缀都算错误；规则的真实效果以 --input/--truth 在真实 out/ 语料上的结果为准
+"""
+
+import os
+import re
+import time
+import random
+import argparse
+
+# 只构造提示词，不调用 LLM，也不创建缓存文件
+os.environ.setdefault("LLM_CACHE_PATH", "")
+
+from structuring.pre_extract import pre_extract
+
+REGULATORS = ["中国证券监督管理委员会", "中国证监会广东监管局", "中国证监会上海监管局", "深圳证券交易所"]
+LAWS = ["《证券法》第一百九十七条第二款", "《证券法》第七十八条第一款、第二款",
+        "《上市公司信息披露管理办法》第三条", "《行政处罚法》第三十二条", "《证券市场禁入规定》第三条第一项"]
+CN_MONTHS = "一二三四五六七八九十"
+
+
+def _cn_year(y: int) -> str:
+    return "".join("〇一二三四五六七八九"[int(c)] for c in str(y))
+
+
+HEADERS = [
+    "{regulator}行政处罚决定书 {prefix}{doc_no}",
+    "{regulator}行政处罚决定书（{company}）{doc_no}",
+    "行政处罚决定书 {prefix}{doc_no} {regulator}",
+    "{regulator} 行政处罚决定书{doc_no}",
+]
+
+
+def _doc_no(value):
+    """文号去掉空白后整体比较"""
+    return re.sub(r"\s+", "", value) if isinstance(value, str) else None
+
+
+def synthetic_document(rnd: random.Random, i: int, short: bool = False) -> tuple:
+    """返回 (正文, 标准答案)，结构模仿 sp.py 抽取出的空格拼接正文；short=True 时只有一两句事实"""
+    year = rnd.randint(2016, 2024)
+    number = rnd.randint(1, 150)
+    opening, closing = rnd.choice([("〔", "〕"), ("[", "]"), ("（", "）")])
+    doc_no = f"{opening}{year}{closing}{rnd.choice(['', '第'])}{number}号"
+    prefix = rnd.choice(["证监罚字", "", "广东证监局"])
+    regulator = rnd.choice(REGULATORS)
+    filed = (year - 1, rnd.randint(1, 12), rnd.randint(1, 28))
+    issued = (year, rnd.randint(1, 12), rnd.randint(1, 28))
+    laws = rnd.sample(LAWS, rnd.randint(1, 3))
+    fines = [f"{rnd.randint(10, 900)}万元" for _ in range(rnd.randint(1, 3))]
+    company = f"某某科技股份有限公司{i}"
+
+    header = rnd.choice(HEADERS)
+    parts = [header.format(regulator=regulator, prefix=prefix, doc_no=doc_no, company=company),
+             f"当事人：{company}，住所：广东省深圳市。",
+             f"依据《中华人民共和国证券法》的有关规定，我会于{filed[0]}年{filed[1]}月{filed[2]}日对{company}"
+             f"信息披露违法违规行为立案调查、审理，并依法向当事人告知了作出行政处罚的事实、理由、依据及当事人依法享有的权利。"]
+    parts.append("违法事项")
+    for _ in range(rnd.randint(1, 2) if short else rnd.randint(3, 12)):
+        parts.append(f"经查，{company}{rnd.randint(2016, 2023)}年年度报告虚增营业收入{rnd.randint(1000, 90000)}万元，"
+                     f"虚增利润总额{rnd.randint(100, 9000)}万元，占当期披露利润总额的{rnd.randint(5, 90)}%。")
+    parts.append("法规定据")
+    for law in laws:
+        parts.append(f"上述行为违反了{law}的规定，构成{law}所述的违法行为。"
+                     + ("" if short else "当事人及其代理人在陈述申辩材料中提出的意见与事实不符，我会不予采纳。"
+                        * rnd.randint(1, 3)))
+    parts.append("处罚情况")
+    for k, fine in enumerate(fines):
+        parts.append(f"对当事人{k + 1}给予警告，并处以{fine}罚款；")
+    parts.append("当事人如果对本处罚决定不服，可在收到本处罚决定书之日起60日内向我会申请行政复议。")
+    if rnd.random() < 0.5:
+        parts.append(f"{regulator} {issued[0]}年{issued[1]}月{issued[2]}日")
+    else:
+        parts.append(f"{regulator} {_cn_year(issued[0])}年{CN_MONTHS[issued[1] - 1] if issued[1] <= 10 else '十' + CN_MONTHS[issued[1] - 11]}月"
+                     f"{['', '十', '二十'][issued[2] // 10] if issued[2] >= 10 else ''}"
+                     f"{CN_MONTHS[issued[2] % 10 - 1] if issued[2] % 10 else ''}日")
+    truth = {
+        # 标题与文号连写、没有前缀位置的写法，正确结果是不带前缀的括号年份和序号
+        "文号": (prefix if "{prefix}" in header else "") + doc_no,
+        "监管机构": regulator,
+        "发布日期": f"{issued[0]:04d}-{issued[1]:02d}-{issued[2]:02d}",
+        "立案日期": f"{filed[0]:04d}-{filed[1]:02d}-{filed[2]:02d}",
+        "法律依据": set(laws),
+        "罚没金额": len(fines),
+    }
+    return " ".join(parts), truth
+
+
+def _field(result: dict, name: str):
+    return result.get(name, (result.get("案件信息") or {}).get(name))
+
+
+def _load_truth(directory: str, ids) -> dict:
+    """已有结构化结果（structured_NNN.txt）作为对照，只取规则覆盖的字段"""
+    from structuring.chunking import parse_partial
+    truth = {}
+    for doc_id in ids:
+        path = os.path.join(directory, f"structured_{doc_id}")
+        if not os.path.exists(path):
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            data = parse_partial(f.read())
+        if data:
+            laws = _field(data, "法律依据")
+            truth[doc_id] = {
+                "文号": _doc_no(_field(data, "文号")),
+                "监管机构": _field(data, "监管机构"),
+                "发布日期": _field(data, "发布日期"),
+                "立案日期": _field(data, "立案日期"),
+                "法律依据": set(laws) if isinstance(laws, list) else None,
+                "罚没金额": None,
+            }
+    return truth
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--docs", type=int, default=300, help="合成文档数量")
+    parser.add_argument("--input", default="", help="真实语料目录（out/ 或 JSONL 语料分片）")
+    parser.add_argument("--truth", default="", help="与 --input 对应的结构化结果目录，作为对照统计一致率")
+    parser.add_argument("--short", type=float, default=0.3, help="合成文书中短文书的比例")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    if args.input:
+        from crawler.dedup import iter_documents
+        docs = list(iter_documents(args.input))
+        truth = _load_truth(args.truth, [doc_id for doc_id, _ in docs]) if args.truth else {}
+        docs = [(text, truth.get(doc_id)) for doc_id, text in docs]
+    else:
+        rnd = random.Random(args.seed)
+        docs = [synthetic_document(rnd, i, rnd.random() < args.short) for i in range(args.docs)]
+
+    from process_txt_with_llm import SimpleLLMClient
+    plain, rules = SimpleLLMClient(), SimpleLLMClient(use_rules=True)
+
+    fields = ["文号", "监管机构", "发布日期", "立案日期", "法律依据", "罚没金额"]
+    found = dict.fromkeys(fields, 0)
+    correct = dict.fromkeys(fields, 0)
+    checked = dict.fromkeys(fields, 0)
+    before = after = 0
+    extract_time = 0.0
+    for text, truth in docs:
+        t0 = time.perf_counter()
+        known = pre_extract(text)
+        extract_time += time.perf_counter() - t0
+        before += sum(len(p) for p in plain._prompts(text, "bench.txt"))
+        after += sum(len(p) for p in rules._prompts(text, "bench.txt", known))
+        for name in fields:
+            value = _field(known, name)
+            if not value:
+                continue
+            found[name] += 1
+            if truth is None or truth.get(name) in (None, "", "无"):
+                continue
+            checked[name] += 1
+            if name == "文号":
+                correct[name] += _doc_no(value) == truth[name]
+            elif name == "法律依据":
+                correct[name] += set(value) == truth[name]
+            elif name == "罚没金额":
+                correct[name] += len(value) == truth[name]
+            else:
+                correct[name] += value == truth[name]
+
+    n = len(docs)
+    print(f"{n} 篇文档，规则抽取平均 {extract_time / max(n, 1) * 1000:.2f} ms/篇")
+    for name in fields:
+        line = f"  {name:<6} 命中 {found[name] / max(n, 1):6.1%}"
+        if checked[name]:
+            line += f"  准确 {correct[name] / checked[name]:6.1%}（{checked[name]} 篇有对照）"
+        print(line)
+    print(f"提示词字符数：{before} → {after}（减少 {1 - after / max(before, 1):.1%}）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+长文档分块结构化：按章节边界切块，各块分别抽取部分 JSON，再按固定规则合并
+（列表字段取并集，处罚对象按对象名称合并，标量字段取第一个非空值）
+"""
+
+import re
+import json
+
+from crawler.sections import SECTION_NAMES
+
+# 正文是空格拼接的纯文本，标题词前面是空白或行首、后面是空白或冒号时才视为章节边界，
+# 避免把「上述违法事项」之类的正文当成标题
+_BOUNDARY_RE = re.compile(
+    r"(?:(?<=\s)|^)(?:[一二三四五六七八九十\d]+[、.．]\s*)?(?:" + "|".join(SECTION_NAMES) + r")(?=\s|[:：])")
+_NUMBERING_RE = re.compile(r"^[一二三四五六七八九十\d]+[、.．]\s*")
+_SENTENCE_END_RE = re.compile(r"(?<=[。；！？])")
+
+EMPTY_VALUES = (None, "", "无", "未知", "不详")
+
+
+def _split_long(segment: str, max_chars: int) -> list:
+    """超长章节按句号切开，单句仍超长时硬切"""
+    pieces, current = [], ""
+    for sentence in _SENTENCE_END_RE.split(segment):
+        while len(sentence) > max_chars:
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + len(sentence) > max_chars:
+            pieces.append(current)
+            current = ""
+        current += sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_named_sections(text: str) -> list:
+    """在章节标题处切开，返回 [(章节名, 含标题的片段)]，第一个标题之前的片段章节名为空"""
+    text = text.strip()
+    starts = [0] + [m.start() for m in _BOUNDARY_RE.finditer(text) if m.start() > 0] + [len(text)]
+    sections = []
+    for a, b in zip(starts, starts[1:]):
+        segment = text[a:b]
+        if not segment.strip():
+            continue
+        m = _BOUNDARY_RE.match(segment)
+        name = _NUMBERING_RE.sub("", m.group(0)) if m else ""
+        sections.append((name, segment))
+    return sections
+
+
+def split_sections(text: str, max_chars: int = 8000) -> list:
+    """
+    在章节标题处切开，再把相邻章节贪心拼成不超过 max_chars 的块；
+    文档本身不超长时返回只有一个元素的列表
+    """
+    text = text.strip()
+    if len(text) <= max_chars:
+        return [text]
+    segments = [segment for _, segment in split_named_sections(text)]
+
+    chunks, current = [], ""
+    for segment in segments:
+        for piece in (_split_long(segment, max_chars) if len(segment) > max_chars else [segment]):
+            if current and len(current) + len(piece) > max_chars:
+                chunks.append(current.strip())
+                current = ""
+            current += piece
+    if current.strip():
+        chunks.append(current.strip())
+    return chunks
+
+
+def parse_partial(response: str):
+    """从 LLM 输出中取出 JSON 对象，失败返回 None"""
+    if not response:
+        return None
+    if "```" in response:
+        m = re.search(r"```(?:json)?\s*(.*?)```", response, re.S)
+        if m:
+            response = m.group(1)
+    try:
+        data = json.loads(response)
+    except json.JSONDecodeError:
+        start, end = response.find("{"), response.rfind("}")
+        if start < 0 or end <= start:
+            return None
+        try:
+            data = json.loads(response[start:end + 1])
+        except json.JSONDecodeError:
+            return None
+    return data if isinstance(data, dict) else None
+
+
+def _is_empty(value) -> bool:
+    if isinstance(value, str):
+        return value.strip() in EMPTY_VALUES
+    if isinstance(value, (list, dict)):
+        return not value
+    return value is None
+
+
+def _merge_objects(items: list) -> list:
+    """处罚对象按对象名称合并，同一对象的字段取第一个非空值；没有名称的按完整内容去重"""
+    merged, by_name, seen = [], {}, set()
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        name = str(item.get("对象名称", "")).strip()
+        if name and name not in EMPTY_VALUES:
+            if name in by_name:
+                target = by_name[name]
+                for key, value in item.items():
+                    if _is_empty(target.get(key)) and not _is_empty(value):
+                        target[key] = value
+                continue
+            by_name[name] = dict(item)
+            merged.append(by_name[name])
+            continue
+        key = json.dumps(item, ensure_ascii=False, sort_keys=True)
+        if key not in seen and not all(_is_empty(v) for v in item.values()):
+            seen.add(key)
+            merged.append(dict(item))
+    return merged
+
+
+def _merge_lists(lists: list) -> list:
+    """按出现顺序取并集"""
+    result, seen = [], set()
+    for values in lists:
+        for value in values:
+            if _is_empty(value):
+                continue
+            key = json.dumps(value, ensure_ascii=False, sort_keys=True)
+            if key not in seen:
+                seen.add(key)
+                result.append(value)
+    return result
+
+
+def merge_results(parts: list) -> dict:
+    """按块的顺序合并：字典递归合并，列表取并集，标量取第一个非空值"""
+    parts = [p for p in parts if isinstance(p, dict)]
+    merged = {}
+    keys = []
+    for part in parts:
+        keys.extend(k for k in part if k not in keys)
+    for key in keys:
+        values = [p[key] for p in parts if key in p]
+        if any(isinstance(v, dict) for v in values):
+            merged[key] = merge_results([v for v in values if isinstance(v, dict)])
+        elif any(isinstance(v, list) for v in values):
+            lists = [v for v in values if isinstance(v, list)]
+            if key == "处罚对象":
+                merged[key] = _merge_objects([item for values in lists for item in values])
+            else:
+                merged[key] = _merge_lists(lists)
+        else:
+            merged[key] = next((v for v in values if not _is_empty(v)), values[0] if values else "")
+    return merged
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+规则预抽取：文号、监管机构、发布日期、立案日期、罚没金额和《法》第X条引用格式固定，
+用预编译正则直接填入，LLM 只负责剩下的字段，并且不再发送只与已解决字段相关的章节
+"""
+
+import re
+
+from structuring.chunking import split_named_sections
+
+_BRACKET_OPEN = r"[〔\[【（(]"
+_BRACKET_CLOSE = r"[〕\]】）)]"
+
+# 文号前缀只认「证监罚字」「沪证监罚字」「禁入字」和「XX证监局」，且前面不能紧接其他汉字，
+# 否则标题与文号连写时会把「……委员会行政处罚决定书」截一段当作前缀；认不出前缀时只取括号年份和序号
+_DOC_NO_PREFIX = r"(?:(?<![一-龥])(?:[一-龥]{0,6}(?:罚|禁入)字|[一-龥]{2,3}证监局)\s*)?"
+DOC_NO_RE = re.compile(
+    r"(" + _DOC_NO_PREFIX + _BRACKET_OPEN + r"\s*(?:19|20)\d{2}\s*" + _BRACKET_CLOSE + r"\s*第?\s*\d{1,5}\s*号)")
+
+REGULATOR_RE = re.compile(
+    r"(中国证券监督管理委员会[一-龥]{2,6}监管局|中国证券监督管理委员会|"
+    r"中国证监会[一-龥]{2,6}监管局|中国证监会|[一-龥]{2,3}证监局|"
+    r"上海证券交易所|深圳证券交易所|北京证券交易所|全国中小企业股份转让系统有限责任公司|"
+    r"国家金融监督管理总局[一-龥]{0,8}|中国人民银行[一-龥]{0,8}分行|中国人民银行)")
+
+_CN_DIGITS = {c: i for i, c in enumerate("〇一二三四五六七八九")}
+_CN_DIGITS["零"] = 0
+DATE_RE = re.compile(
+    r"((?:19|20)\d{2})\s*年\s*(\d{1,2})\s*月\s*(\d{1,2})\s*日"
+    r"|([〇零一二三四五六七八九]{4})年([〇零一二三四五六七八九十]{1,3})月([〇零一二三四五六七八九十]{1,3})日")
+
+# 公告类型只看标题（正文开头），正文里「告知了作出行政处罚的事实」之类的表述不算
+NOTICE_TYPES = ["行政处罚事先告知书", "行政处罚决定书", "立案告知书"]
+NOTICE_TYPE_RE = re.compile("|".join(NOTICE_TYPES))
+NOTICE_TYPE_HEAD = 120
+
+# 立案日期：日期与「立案」出现在同一句内
+CASE_DATE_RE = re.compile(r"([^。；]{0,40}立案[^。；]{0,40})")
+
+FINE_RE = re.compile(
+    r"((?:罚款|没收违法所得|并处|处以)[^。；，,]{0,12}?(\d+(?:\.\d+)?)\s*(亿|万)?元)")
+
+_ARTICLE = r"第[（(]?[一二三四五六七八九十百零〇\d]+[)）]?[条款项]"
+# 只收带条款的引用，「依据《证券法》的有关规定」这类泛指不算法律依据
+LAW_CITATION_RE = re.compile(
+    r"(《[^《》]{2,40}?(?:法|规定|办法|规则|条例|准则|指引|决定)》\s*"
+    + _ARTICLE + r"(?:" + _ARTICLE + r")*"
+    + r"(?:\s*[、和及与，,]\s*" + _ARTICLE + r"(?:" + _ARTICLE + r")*)*)")
+
+# 字段只依赖这些章节时，字段解决后不再把章节发给 LLM
+SECTION_FIELDS = {
+    "法规定据": ["法律依据"],
+    "法律依据": ["法律依据"],
+}
+
+# 文末的复议/诉讼告知和落款只用于监管机构、发布日期，二者都已确定时不再发送
+TAIL_RE = re.compile(
+    r"(?:当事人|你|你们|你公司)如(?:果)?对本(?:处罚)?决定不服.*$"
+    r"|(?:请|你|你们|你公司)[^。]{0,20}在收到本告知书之日起.*$", re.S)
+TAIL_FIELDS = ["监管机构", "发布日期"]
+
+
+def _cn_number(s: str) -> int:
+    """二〇二〇 / 十二 / 二十一 之类的中文数字"""
+    if "十" in s:
+        tens, _, ones = s.partition("十")
+        return (_CN_DIGITS[tens] if tens else 1) * 10 + (_CN_DIGITS[ones] if ones else 0)
+    return int("".join(str(_CN_DIGITS[c]) for c in s))
+
+
+def _format_date(m) -> str:
+    if m.group(1):
+        y, mo, d = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    else:
+        y, mo, d = _cn_number(m.group(4)), _cn_number(m.group(5)), _cn_number(m.group(6))
+    return f"{y:04d}-{mo:02d}-{d:02d}" if 1 <= mo <= 12 and 1 <= d <= 31 else ""
+
+
+def _unique(values):
+    seen, result = set(), []
+    for v in values:
+        v = re.sub(r"\s+", "", v)
+        if v and v not in seen:
+            seen.add(v)
+            result.append(v)
+    return result
+
+
+def pre_extract(text: str) -> dict:
+    """
+    返回与 LLM 输出同结构的部分 JSON，只包含规则能确定的字段：
+    文号（第一个）、公告类型（标题中的文书类型）、监管机构（最后一个，通常是落款）、发布日期（最后一个日期）、
+    案件信息.立案日期、案件信息.法律依据，以及罚没金额列表 案件信息.罚没金额
+    （涉案金额还包括虚增收入等，仍交给 LLM）
+    """
+    result = {}
+    case = {}
+    m = DOC_NO_RE.search(text)
+    if m:
+        result["文号"] = re.sub(r"\s+", "", m.group(1))
+    m = NOTICE_TYPE_RE.search(text[:NOTICE_TYPE_HEAD])
+    if m:
+        result["公告类型"] = m.group(0)
+    regulators = REGULATOR_RE.findall(text)
+    if regulators:
+        result["监管机构"] = regulators[-1]
+    dates = [d for d in (_format_date(m) for m in DATE_RE.finditer(text)) if d]
+    if dates:
+        result["发布日期"] = dates[-1]
+    for sentence in CASE_DATE_RE.findall(text):
+        m = DATE_RE.search(sentence)
+        if m and _format_date(m):
+            case["立案日期"] = _format_date(m)
+            break
+    fines = _unique(m.group(1) for m in FINE_RE.finditer(text))
+    if fines:
+        case["罚没金额"] = fines
+    citations = _unique(LAW_CITATION_RE.findall(text))
+    if citations:
+        case["法律依据"] = citations
+    if case:
+        result["案件信息"] = case
+    return result
+
+
+def resolved_fields(known: dict) -> list:
+    """LLM 不必再抽取的字段名，如 ["文号", "立案日期", "法律依据"]；罚没金额不在提示词的字段列表中，不计入"""
+    names = [k for k in known if k != "案件信息"]
+    names.extend(k for k in known.get("案件信息", {}) if k != "罚没金额")
+    return names
+
+
+def prune_sections(text: str, known: dict) -> str:
+    """去掉只与已解决字段相关的章节和文末告知、落款，其余章节按原顺序保留"""
+    done = set(resolved_fields(known))
+    kept = [body for name, body in split_named_sections(text)
+            if not (name in SECTION_FIELDS and all(f in done for f in SECTION_FIELDS[name]))]
+    text = "".join(kept)
+    if all(f in done for f in TAIL_FIELDS):
+        text = TAIL_RE.sub("", text).rstrip()
+    return text
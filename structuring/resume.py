@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+结构化断点续跑：输出目录下追加写入 structured_manifest.jsonl，记录每个源文件的内容哈希和处理状态；
+输出可解析为 JSON 且源文件哈希未变时跳过，新增、内容变化和上次失败（error_ 文件）的重新处理
+"""
+
+import os
+import json
+import time
+import hashlib
+
+MANIFEST_NAME = "structured_manifest.jsonl"
+
+
+def text_sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def output_is_valid(path: str) -> bool:
+    """结构化结果存在且是可解析的 JSON 对象或数组"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return isinstance(json.load(f), (dict, list))
+    except (OSError, ValueError):
+        return False
+
+
+class StructuredManifest:
+    """以源文件名为键，保留最近一次的处理记录"""
+
+    def __init__(self, output_dir: str):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, MANIFEST_NAME)
+        self.entries = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # 中断时可能写了半行，忽略即可
+                        continue
+                    self.entries[entry["file"]] = entry
+        os.makedirs(output_dir, exist_ok=True)
+        self._fp = open(self.path, "a", encoding="utf-8")
+
+    def is_current(self, filename: str, sha256: str, source_mtime: float | None = None) -> bool:
+        """
+        输出有效且哈希一致时为 True；清单中没有记录但已有有效输出的（旧版本产生的结果），
+        只有输出不早于源文件修改时间 source_mtime 时才视为当前版本并补记哈希，避免升级后第一次续跑全部重做；
+        源文件在输出之后改动过或修改时间未知时重新处理
+        """
+        output_path = os.path.join(self.output_dir, f"structured_{filename}")
+        if not output_is_valid(output_path):
+            return False
+        entry = self.entries.get(filename)
+        if entry is None:
+            if source_mtime is None or os.path.getmtime(output_path) < source_mtime:
+                return False
+            self.record(filename, sha256, True, adopted=True)
+            return True
+        return entry.get("status") == "ok" and entry.get("sha256") == sha256
+
+    def record(self, filename: str, sha256: str, ok: bool, error: str | None = None,
+               adopted: bool = False, duplicate_of: str | None = None):
+        entry = {
+            "file": filename,
+            "sha256": sha256,
+            "status": "ok" if ok else "failed",
+            "processed_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        if error:
+            entry["error"] = error
+        if adopted:
+            entry["adopted"] = True
+        if duplicate_of:
+            # 结果复用自近重复簇的代表文档
+            entry["duplicate_of"] = duplicate_of
+        self.entries[filename] = entry
+        self._fp.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._fp.flush()
+        if ok:
+            # 重试成功后清理上次留下的 error_ 文件
+            error_path = os.path.join(self.output_dir, f"error_{filename}")
+            if os.path.exists(error_path):
+                os.remove(error_path)
+
+    def close(self):
+        self._fp.close()
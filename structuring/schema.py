@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+结构化输出的 JSON Schema 与定向修复：校验时给出每个不合格字段的路径，
+修复时只把出错的片段和与之相关的原文章节发回模型，不重新抽取整篇文书
+"""
+
+import json
+
+from structuring.chunking import split_named_sections
+
+_STRING = {"type": "string"}
+_STRING_LIST = {"type": "array", "items": _STRING}
+
+STRUCTURE_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "title": "监管处罚文书结构化结果",
+    "type": "object",
+    "required": ["文号", "公告类型", "监管机构", "发布日期", "公司信息", "案件信息"],
+    "properties": {
+        "文号": _STRING,
+        "公告类型": {"type": "string",
+                 "enum": ["行政处罚事先告知书", "行政处罚决定书", "立案告知书", "其他", "无"]},
+        "监管机构": _STRING,
+        "发布日期": _STRING,
+        "公司信息": {
+            "type": "object",
+            "required": ["简称", "全称", "行业", "控股股东", "实际控制人", "主营业务"],
+            "properties": {key: _STRING for key in ["简称", "全称", "行业", "控股股东", "实际控制人", "主营业务"]},
+        },
+        "案件信息": {
+            "type": "object",
+            "required": ["立案日期", "涉案年份", "主要违规事项", "涉案金额", "处罚对象", "法律依据", "总结"],
+            "properties": {
+                "立案日期": _STRING,
+                "涉案年份": _STRING,
+                "主要违规事项": _STRING_LIST,
+                "涉案金额": {"type": ["string", "array"]},
+                "处罚对象": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "required": ["对象名称", "身份", "违规类型", "处罚类型", "处罚金额_万元", "处罚期限"],
+                        "properties": {
+                            "对象名称": {"type": "string", "minLength": 1},
+                            "身份": _STRING,
+                            "违规类型": _STRING,
+                            "处罚类型": _STRING,
+                            "处罚金额_万元": {"type": ["string", "number"]},
+                            "处罚期限": _STRING,
+                        },
+                    },
+                },
+                "法律依据": _STRING_LIST,
+                "罚没金额": _STRING_LIST,
+                "总结": _STRING,
+            },
+        },
+    },
+}
+
+# 修复某个字段时附带的原文章节；没有对应章节的字段附带文书开头和落款
+FIELD_SECTIONS = {
+    "公司信息": ["当事人", "正文"],
+    "主要违规事项": ["违法事项", "案件解析"],
+    "涉案年份": ["违法事项", "案件解析"],
+    "涉案金额": ["违法事项", "案件解析", "处罚情况"],
+    "处罚对象": ["当事人", "处罚情况", "处罚决定"],
+    "法律依据": ["法规定据", "法律依据"],
+    "总结": ["总结", "处罚决定"],
+}
+
+_TYPES = {"object": dict, "array": list, "string": str, "number": (int, float), "integer": int,
+          "boolean": bool, "null": type(None)}
+
+
+def format_path(path) -> str:
+    """("案件信息", "处罚对象", 0, "对象名称") -> 案件信息.处罚对象[0].对象名称"""
+    text = ""
+    for key in path:
+        text += f"[{key}]" if isinstance(key, int) else (f".{key}" if text else key)
+    return text or "（根）"
+
+
+def _type_ok(value, expected) -> bool:
+    for name in expected if isinstance(expected, list) else [expected]:
+        if isinstance(value, _TYPES[name]) and not (name in ("number", "integer") and isinstance(value, bool)):
+            return True
+    return False
+
+
+def validate(data, schema=STRUCTURE_SCHEMA, path=()) -> list:
+    """
+    按 Schema 子集（type / required / properties / items / enum / minLength）校验，
+    返回 [(路径元组, 错误说明)]，全部合格时返回空列表
+    """
+    errors = []
+    if "type" in schema and not _type_ok(data, schema["type"]):
+        return [(path, f"类型应为{schema['type']}，实际为{type(data).__name__}")]
+    if "enum" in schema and data not in schema["enum"]:
+        errors.append((path, f"取值{data!r}不在{schema['enum']}中"))
+    if "minLength" in schema and isinstance(data, str) and len(data.strip()) < schema["minLength"]:
+        errors.append((path, "不能为空"))
+    if isinstance(data, dict):
+        for key in schema.get("required", []):
+            if key not in data:
+                errors.append((path + (key,), "缺少字段"))
+        for key, sub in schema.get("properties", {}).items():
+            if key in data:
+                errors.extend(validate(data[key], sub, path + (key,)))
+    if isinstance(data, list) and "items" in schema:
+        for i, item in enumerate(data):
+            errors.extend(validate(item, schema["items"], path + (i,)))
+    return errors
+
+
+def repair_units(errors) -> dict:
+    """
+    把错误归并到需要整体重抽的片段：公司信息、案件信息下的各字段、顶层各字段；
+    返回 {片段路径: [错误说明]}
+    """
+    units = {}
+    for path, message in errors:
+        unit = path[:2] if len(path) >= 2 and path[0] in ("公司信息", "案件信息") else path[:1]
+        if unit[:1] == ("公司信息",):
+            unit = ("公司信息",)
+        units.setdefault(unit, []).append(f"{format_path(path)}：{message}")
+    return units
+
+
+def get_path(data, path, default=None):
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+    return data
+
+
+def set_path(data, path, value):
+    for key in path[:-1]:
+        if not isinstance(data.get(key), dict):
+            data[key] = {}
+        data = data[key]
+    data[path[-1]] = value
+
+
+def _schema_at(path):
+    schema = STRUCTURE_SCHEMA
+    for key in path:
+        schema = schema.get("properties", {}).get(key, {})
+    return schema
+
+
+def relevant_text(text: str, unit, max_chars: int = 3000) -> str:
+    """片段对应章节的原文；找不到章节时取文书开头和结尾（文号、当事人、落款日期通常在这两处）"""
+    names = FIELD_SECTIONS.get(unit[-1], [])
+    sections = split_named_sections(text)
+    picked = [body for name, body in sections if name in names or (not name and "正文" in names)]
+    if picked:
+        return " ".join(picked)[:max_chars]
+    if len(text) <= max_chars:
+        return text
+    head = max_chars * 2 // 3
+    return text[:head] + " …… " + text[-(max_chars - head):]
+
+
+def repair_prompt(unit, fragment, messages, source: str) -> str:
+    key = unit[-1]
+    return f"""
+以下是从监管处罚文书中抽取的 JSON 结果里的一个片段，未通过格式校验。
+
+【片段路径】{format_path(unit)}
+【当前内容】
+{json.dumps(fragment, ensure_ascii=False, indent=2)}
+【校验错误】
+{chr(10).join('- ' + m for m in messages)}
+【字段格式】
+{json.dumps(_schema_at(unit), ensure_ascii=False)}
+
+请根据下面的原文修正该片段，缺失的信息填"无"或空列表，只输出 {{"{key}": 修正后的内容}} 这一个 JSON 对象：
+{source}
+"""
+
+
+def syntax_repair_prompt(response: str, max_chars: int = 12000) -> str:
+    return f"""
+以下内容本应是一个 JSON 对象，但无法被解析（可能有多余文字、缺少括号或引号、未转义字符，或被截断）。
+请修正语法错误，保持字段和取值不变，被截断的部分补全括号即可，只输出修正后的 JSON：
+{response[:max_chars]}
+"""
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+流式输出的增量 JSON 校验：逐段喂入模型输出，一旦结构不合法立即报错，
+顶层对象/数组闭合后即可停止读取，不必等到整段输出生成完
+"""
+
+import re
+
+_LITERAL_RE = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?|true|false|null")
+_LITERAL_CHARS = set("0123456789+-.eEtrufalsn")
+_WHITESPACE = set(" \t\r\n")
+
+
+class StreamAbort(ValueError):
+    """流式输出在结构上已不可能是合法 JSON"""
+
+
+class IncrementalJSONValidator:
+    """
+    下推自动机逐字符校验 JSON；第一个 { 或 [ 之前的内容（```json 标记、说明文字）视为前言，
+    前言超过 max_preamble 个字符仍未出现 JSON 时中止。开括号后紧跟的第一个字符就不合法时
+    （如「以下是结果 [注意] {…}」），该括号仍视为前言，继续寻找下一个开括号
+    """
+
+    def __init__(self, max_preamble: int = 2000, openers: str = "{["):
+        self.max_preamble = max_preamble
+        self.openers = openers
+        self.parts = []
+        self.length = 0
+        self.start = None          # JSON 起点在全文中的位置
+        self.end = None            # 顶层值闭合后的位置
+        self.stack = []
+        self.expect = "value"
+        self.in_string = False
+        self.escape = False
+        self.literal = ""
+        self.tokens = 0            # 起点之后已读入的非空白字符数
+
+    @property
+    def done(self) -> bool:
+        return self.end is not None
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    @property
+    def json_text(self) -> str:
+        """已闭合的 JSON 部分，未闭合时返回空字符串"""
+        return self.text[self.start:self.end] if self.done else ""
+
+    def feed(self, chunk: str) -> bool:
+        """喂入一段输出，结构不合法时抛出 StreamAbort，返回顶层值是否已闭合"""
+        if not chunk or self.done:
+            return self.done
+        offset = self.length
+        self.parts.append(chunk)
+        self.length += len(chunk)
+        for i, ch in enumerate(chunk):
+            try:
+                self._feed_char(ch, offset + i)
+            except StreamAbort:
+                if self.start is None or self.tokens > 2:
+                    raise
+                # 出错的字符本身可能是下一个开括号
+                self._restart()
+                self._feed_char(ch, offset + i)
+            if self.done:
+                break
+        return self.done
+
+    def _feed_char(self, ch: str, pos: int):
+        if self.start is None:
+            if ch in self.openers:
+                self.start = pos
+            elif pos >= self.max_preamble:
+                raise StreamAbort(f"前{self.max_preamble}个字符内没有出现JSON")
+            else:
+                return
+        self._step(ch, pos)
+
+    def _restart(self):
+        """放弃当前起点，回到前言状态"""
+        self.start = None
+        self.stack = []
+        self.expect = "value"
+        self.in_string = False
+        self.escape = False
+        self.literal = ""
+        self.tokens = 0
+
+    def _fail(self, reason: str, pos: int):
+        raise StreamAbort(f"第{pos}个字符处{reason}: {self.text[max(0, pos - 40):pos + 1]!r}")
+
+    def _step(self, ch: str, pos: int):
+        if ch not in _WHITESPACE:
+            self.tokens += 1
+        if self.in_string:
+            if self.escape:
+                self.escape = False
+            elif ch == "\\":
+                self.escape = True
+            elif ch == '"':
+                self.in_string = False
+                self.expect = "colon" if self.expect == "key_end" else "comma"
+            elif ch < " ":
+                # JSON 字符串中不允许出现未转义的控制字符 U+0000–U+001F（换行、制表符等）
+                self._fail("字符串中出现未转义的控制字符", pos)
+            return
+        if self.literal:
+            if ch in _LITERAL_CHARS:
+                self.literal += ch
+                return
+            if not _LITERAL_RE.fullmatch(self.literal):
+                self._fail(f"非法字面量{self.literal!r}", pos)
+            self.literal = ""
+            self.expect = "comma"
+        if ch in _WHITESPACE:
+            return
+
+        expect = self.expect
+        if expect in ("value", "value_or_close"):
+            if ch == "]" and expect == "value_or_close":
+                self._close(ch, pos)
+            elif ch in "{[":
+                self.stack.append(ch)
+                self.expect = "key_or_close" if ch == "{" else "value_or_close"
+            elif ch == '"':
+                self.in_string = True
+                self.expect = "value_end"
+            elif ch in _LITERAL_CHARS:
+                self.literal = ch
+            else:
+                self._fail("应为值", pos)
+        elif expect in ("key", "key_or_close"):
+            if ch == "}" and expect == "key_or_close":
+                self._close(ch, pos)
+            elif ch == '"':
+                self.in_string = True
+                self.expect = "key_end"
+            else:
+                self._fail("应为键名", pos)
+        elif expect == "colon":
+            if ch != ":":
+                self._fail("键名后应为冒号", pos)
+            self.expect = "value"
+        elif expect == "comma":
+            if ch == ",":
+                self.expect = "key" if self.stack[-1] == "{" else "value"
+            elif ch in "}]":
+                self._close(ch, pos)
+            else:
+                self._fail("应为逗号或右括号", pos)
+
+    def _close(self, ch: str, pos: int):
+        opener = "{" if ch == "}" else "["
+        if not self.stack or self.stack[-1] != opener:
+            self._fail("括号不匹配", pos)
+        self.stack.pop()
+        self.expect = "comma"
+        if not self.stack:
+            self.end = pos + 1
+
+
+def first_json_value(text: str):
+    """整段输出中第一个完整且可解析的 JSON 对象或数组的原文，没有时返回 None"""
+    import json
+    if not text:
+        return None
+    validator = IncrementalJSONValidator(max_preamble=len(text))
+    try:
+        if validator.feed(text):
+            json.loads(validator.json_text)
+            return validator.json_text
+    except (StreamAbort, json.JSONDecodeError):
+        pass
+    return None
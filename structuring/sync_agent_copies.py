@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+各 Agent 目录独立运行（只把自身目录加入 sys.path），无法导入根目录的 structuring 包，
+因此 model_router.py 和 response_cache.py 在每个 Agent 的 llms/ 下各有一份副本。
+以 structuring/ 下的文件为准，修改后运行本脚本同步：
+
+    python -m structuring.sync_agent_copies           # 覆盖各 Agent 的副本
+    python -m structuring.sync_agent_copies --check   # 只检查，有不一致时返回非零
+"""
+
+import os
+import sys
+import shutil
+import filecmp
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHARED = ["model_router.py", "response_cache.py"]
+AGENTS = ["RiskMiningAgent", "RiskFormulaParserAgent", "RiskResearchAgent"]
+
+
+def stale_copies() -> list:
+    """返回与 structuring/ 下原件不一致（或缺失）的副本路径"""
+    stale = []
+    for name in SHARED:
+        source = os.path.join(ROOT, "structuring", name)
+        for agent in AGENTS:
+            copy = os.path.join(ROOT, agent, "llms", name)
+            if not os.path.exists(copy) or not filecmp.cmp(source, copy, shallow=False):
+                stale.append(copy)
+    return stale
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--check", action="store_true", help="只检查副本是否一致，不写入")
+    args = parser.parse_args()
+
+    stale = stale_copies()
+    if args.check:
+        for path in stale:
+            print(f"副本未同步：{os.path.relpath(path, ROOT)}")
+        sys.exit(1 if stale else 0)
+    for path in stale:
+        shutil.copyfile(os.path.join(ROOT, "structuring", os.path.basename(path)), path)
+        print(f"已同步：{os.path.relpath(path, ROOT)}")
+    if not stale:
+        print("全部副本已是最新")
+
+
+if __name__ == "__main__":
+    main()